@@ -0,0 +1,495 @@
+"""
+Benchmarks the load, query and reconfiguration paths of the library against the fake
+RandR server and, if available, against Xvfb.
+
+Every path reports its median wall time, the requests and blocking round trips it sends
+and the peak memory it allocates. Results can be saved as a baseline and compared to it
+to catch regressions:
+
+    python benchmarks/run.py --save benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json
+
+The traffic of a real X server can be recorded once and replayed without the hardware,
+the replayed benchmarks then see the reply sizes of the recorded driver:
+
+    python benchmarks/run.py --display :0 --record recordings/gpu
+    python benchmarks/run.py --replay recordings/gpu
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from displaymanagement.backend import XlibBackend
+from displaymanagement.display import Display
+from displaymanagement.fake import FakeBackend, FakeServer
+from displaymanagement.instrumentation import Instrumentation
+from displaymanagement.recording import (
+    ReplayBackend,
+    load_recordings,
+    record_connections,
+    save_recordings,
+)
+from displaymanagement.model_descriptors.crtc_config import CRTCConfig
+from displaymanagement.screen import Screen
+
+OUTPUT_COUNTS = (1, 4, 16, 64)
+REPEATS = 5
+
+# Wall times and peak memory may grow by this factor before they count as regression
+TOLERANCE = 1.5
+# and additionally by these absolute amounts, sub-millisecond timings are dominated by noise
+SLACK = dict(wall_ms=1.0, peak_kib=16.0)
+
+
+class FakeTarget:
+    """
+    Runs benchmarks against a fresh fake server for every repetition.
+    """
+
+    display_name = ":0"
+
+    def __init__(self, output_count, latency):
+        self.key = "fake/{}".format(output_count)
+        self.output_count = output_count
+        self.latency = latency
+        self.server = None
+
+    def begin(self, benchmark_name):
+        pass
+
+    def end(self, benchmark_name):
+        pass
+
+    def prepare(self):
+        self.server = FakeServer.create(
+            output_count=self.output_count, latency=self.latency
+        )
+        return FakeBackend(self.server)
+
+    def reset_counters(self):
+        self.server.reset_counters()
+
+    def get_counters(self):
+        return sum(self.server.requests.values()), self.server.round_trips
+
+
+class XlibTarget:
+    """
+    Runs benchmarks against an X server, e.g. Xvfb, whose state is shared between
+    repetitions. The traffic of every benchmark can be recorded for replaying it later.
+    """
+
+    def __init__(self, key, display_name, record_dir=None):
+        self.key = key
+        self.display_name = display_name
+        self.record_dir = record_dir
+        self.instrumentation = Instrumentation()
+        self.recordings = []
+
+    def begin(self, benchmark_name):
+        self.recordings = []
+
+    def end(self, benchmark_name):
+        if self.record_dir is not None:
+            os.makedirs(self.record_dir, exist_ok=True)
+            save_recordings(
+                self.recordings, get_recording_path(self.record_dir, benchmark_name)
+            )
+
+    def prepare(self):
+        self.instrumentation.reset()
+        return InstrumentedXlibBackend(
+            self.instrumentation,
+            self.recordings if self.record_dir is not None else None,
+        )
+
+    def reset_counters(self):
+        self.instrumentation.reset()
+
+    def get_counters(self):
+        stats = self.instrumentation.get_stats().values()
+        return (
+            sum(entry.requests for entry in stats),
+            sum(entry.round_trips for entry in stats),
+        )
+
+
+class ReplayTarget(XlibTarget):
+    """
+    Runs benchmarks against the traffic recorded by an XlibTarget.
+    """
+
+    def __init__(self, replay_dir):
+        super().__init__(
+            "replay/{}".format(os.path.basename(os.path.normpath(replay_dir))), ":0"
+        )
+        self.replay_dir = replay_dir
+
+    def begin(self, benchmark_name):
+        self.recordings = load_recordings(
+            get_recording_path(self.replay_dir, benchmark_name)
+        )
+
+    def end(self, benchmark_name):
+        pass
+
+    def prepare(self):
+        self.instrumentation.reset()
+        # Every repetition opens one display, so it replays the next recorded connection
+        return InstrumentedReplayBackend(self.instrumentation, [self.recordings.pop(0)])
+
+
+class InstrumentedXlibBackend(XlibBackend):
+    """
+    Opens python-xlib displays with instrumentation attached, optionally recording their traffic.
+    """
+
+    def __init__(self, instrumentation, recordings=None):
+        self.instrumentation = instrumentation
+        self.recordings = recordings
+
+    def open_display(self, name):
+        if self.recordings is None:
+            display = super().open_display(name)
+        else:
+            with record_connections() as recordings:
+                display = super().open_display(name)
+            self.recordings += recordings
+        self.instrumentation.attach(display)
+        return display
+
+
+class InstrumentedReplayBackend(ReplayBackend):
+    """
+    Opens python-xlib displays replaying recordings with instrumentation attached.
+    """
+
+    def __init__(self, instrumentation, recordings):
+        super().__init__(recordings)
+        self.instrumentation = instrumentation
+
+    def open_display(self, name):
+        display = super().open_display(name)
+        self.instrumentation.attach(display)
+        return display
+
+
+def get_recording_path(directory, benchmark_name):
+    return os.path.join(directory, benchmark_name + ".json")
+
+
+def start_xvfb():
+    """
+    Starts Xvfb on a free display number and returns the process and display name,
+    or None if Xvfb is not installed.
+    """
+    if shutil.which("Xvfb") is None:
+        return None
+
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen(
+        [
+            "Xvfb",
+            "-displayfd",
+            str(write_fd),
+            "-screen",
+            "0",
+            "1920x1080x24",
+            "-nolisten",
+            "tcp",
+        ],
+        pass_fds=(write_fd,),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    os.close(write_fd)
+    with os.fdopen(read_fd) as displayfd:
+        number = displayfd.readline().strip()
+    if not number:
+        process.terminate()
+        return None
+    return process, ":" + number
+
+
+def load_display(target, backend):
+    return Display(target.display_name, backend=backend)
+
+
+def bench_display_init(target, backend):
+    def run():
+        load_display(target, backend)
+
+    return run
+
+
+def bench_screen_load(target, backend):
+    display = backend.open_display(target.display_name)
+
+    def run():
+        Screen.load_from_identifier(display, 0)
+
+    return run
+
+
+def bench_get_info(target, backend):
+    display = load_display(target, backend)
+
+    def run():
+        display.get_info()
+
+    return run
+
+
+def bench_to_json(target, backend):
+    display = load_display(target, backend)
+
+    def run():
+        display.toJSON()
+
+    return run
+
+
+def bench_get_edid(target, backend):
+    display = load_display(target, backend)
+    outputs = [
+        output for output in display.Screens[0].Outputs.values() if output.Connected
+    ]
+
+    def run():
+        for output in outputs:
+            output.get_edid()
+
+    return run
+
+
+def bench_create_mode(target, backend):
+    display = load_display(target, backend)
+    screen = display.Screens[0]
+
+    def run():
+        # Recreating an identical mode is allowed, so repetitions can share the X server
+        screen.create_mode("bench_1280x720", 1280, 720, 59.0)
+
+    return run
+
+
+def bench_set_crtc_config(target, backend):
+    display = load_display(target, backend)
+    screen = display.Screens[0]
+    output = next(
+        output for output in screen.Outputs.values() if output.CRTC_Config.mode
+    )
+    config = output.CRTC_Config
+    other_mode = screen.find_mode(1280, 720, output=output) or config.mode
+
+    def run():
+        screen.set_crtc_config(
+            output, CRTCConfig(x=config.x, y=config.y, mode=other_mode)
+        )
+        screen.set_crtc_config(
+            output, CRTCConfig(x=config.x, y=config.y, mode=config.mode)
+        )
+
+    return run
+
+
+BENCHMARKS = {
+    "Display": bench_display_init,
+    "Screen.load_from_identifier": bench_screen_load,
+    "Display.get_info": bench_get_info,
+    "Display.toJSON": bench_to_json,
+    "Output.get_edid": bench_get_edid,
+    "Screen.create_mode": bench_create_mode,
+    "Screen.set_crtc_config": bench_set_crtc_config,
+}
+
+
+def measure(target, benchmark):
+    """
+    Runs a benchmark REPEATS times and returns its median wall time in ms, the requests
+    and round trips of one run and the peak memory of one run in KiB.
+    """
+    times = []
+    for _ in range(REPEATS):
+        run = benchmark(target, target.prepare())
+        target.reset_counters()
+        start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - start) * 1000)
+    requests, round_trips = target.get_counters()
+
+    run = benchmark(target, target.prepare())
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return dict(
+        wall_ms=round(statistics.median(times), 3),
+        requests=requests,
+        round_trips=round_trips,
+        peak_kib=round(peak / 1024, 1),
+    )
+
+
+def run_benchmarks(targets, selected):
+    results = {}
+    for target in targets:
+        for name, benchmark in BENCHMARKS.items():
+            if selected and name not in selected:
+                continue
+            key = "{}/{}".format(target.key, name)
+            try:
+                target.begin(name)
+                results[key] = measure(target, benchmark)
+                target.end(name)
+            except Exception as error:
+                results[key] = dict(error="{}: {}".format(type(error).__name__, error))
+            print_result(key, results[key])
+    return results
+
+
+def print_result(key, result):
+    if "error" in result:
+        print("{:<50} {}".format(key, result["error"]))
+        return
+    print(
+        "{:<50} {:>10.3f} ms {:>6} requests {:>4} round trips {:>10.1f} KiB".format(
+            key,
+            result["wall_ms"],
+            result["requests"],
+            result["round_trips"],
+            result["peak_kib"],
+        )
+    )
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns the regressions of the results compared to the baseline. Request and round trip
+    counts must not grow, wall times and peak memory may grow by the tolerance factor plus
+    an absolute slack. Failed benchmarks and benchmarks of a baselined target missing from
+    the baseline are regressions as well.
+    """
+    baselined_targets = {key.rpartition("/")[0] for key in baseline}
+    regressions = []
+    for key, result in results.items():
+        if "error" in result:
+            regressions.append("{}: {}".format(key, result["error"]))
+            continue
+        expected = baseline.get(key)
+        if expected is None:
+            if key.rpartition("/")[0] in baselined_targets:
+                regressions.append("{}: missing from the baseline".format(key))
+            continue
+        for metric in ("requests", "round_trips"):
+            if result[metric] > expected[metric]:
+                regressions.append(
+                    "{}: {} {} > {}".format(
+                        key, metric, result[metric], expected[metric]
+                    )
+                )
+        for metric in ("wall_ms", "peak_kib"):
+            if result[metric] > expected[metric] * tolerance + SLACK[metric]:
+                regressions.append(
+                    "{}: {} {} > {} * {} + {}".format(
+                        key,
+                        metric,
+                        result[metric],
+                        expected[metric],
+                        tolerance,
+                        SLACK[metric],
+                    )
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--outputs",
+        type=int,
+        nargs="+",
+        default=OUTPUT_COUNTS,
+        help="output counts of the fake server",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="round trip latency of the fake server in seconds",
+    )
+    parser.add_argument(
+        "--no-xvfb", action="store_true", help="do not benchmark against Xvfb"
+    )
+    parser.add_argument("--display", help="also benchmark an X display, e.g. :0")
+    parser.add_argument(
+        "--record", help="record the traffic of the X display to a directory"
+    )
+    parser.add_argument(
+        "--replay", help="benchmark the traffic recorded in a directory"
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run"
+    )
+    parser.add_argument("--save", help="write the results to a baseline file")
+    parser.add_argument("--compare", help="compare the results to a baseline file")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    targets = []
+    for output_count in args.outputs:
+        targets.append(FakeTarget(output_count, args.latency))
+
+    xvfb = None if args.no_xvfb else start_xvfb()
+    if xvfb is not None:
+        targets.append(XlibTarget("xvfb/1", xvfb[1]))
+    elif not args.no_xvfb:
+        print("Xvfb not found, only the fake server is benchmarked")
+
+    if args.display:
+        targets.append(
+            XlibTarget("x11/" + args.display.lstrip(":"), args.display, args.record)
+        )
+    if args.replay:
+        targets.append(ReplayTarget(args.replay))
+
+    try:
+        results = run_benchmarks(targets, args.only)
+    finally:
+        if xvfb is not None:
+            xvfb[0].terminate()
+            xvfb[0].wait()
+
+    errors = [key for key, result in results.items() if "error" in result]
+    if args.save:
+        if errors:
+            # A baseline without the failed benchmarks would not guard them
+            print("Not saving a baseline, failed benchmarks:", ", ".join(errors))
+            sys.exit(1)
+        with open(args.save, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print("REGRESSION", regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,789 @@
+import asyncio
+from Xlib.display import Display as XDisplay
+from Xlib.protocol.request import GetInputFocus
+from Xlib.ext import randr
+from Xlib.ext.randr import PROPERTY_RANDR_EDID
+from .screen import Screen
+from .backend import XlibBackend
+from .entity import JSON_ENCODER
+from .events import RANDR_EVENT_MASK, is_randr_event, get_event_window_id
+from .pipeline import send_request, get_target_crtc_ids
+from .layout import DisableOutput, SetScreenSize
+from .output import Output, EDID_TYPE
+from .utils import get_mode, make_descriptor
+from .model_descriptors.display_descriptor import DisplayDescriptor
+from .model_descriptors.screen_descriptor import ScreenSizeRange
+from .model_descriptors.crtc_config import CRTCConfig
+from .rotation import Rotation
+from .timings import ModeTiming
+from .exceptions import ResourceError, InvalidStateError
+
+
+class AsyncConnection:
+    """
+    Sends the requests of an X display and waits for their replies and events inside
+    an asyncio event loop. The loop watches the file descriptor of the connection,
+    so waiting never blocks the loop or a thread.
+
+    Methods
+    -------
+    send(request, fields)
+    request(request, fields)
+    wait(requests)
+    gather(requests)
+    sync()
+    next_events()
+    """
+
+    def __init__(self, display):
+        """
+        Parameters
+        ----------
+        display : XDisplay
+            The X display to wrap
+        """
+        self.__display = display
+        self.__readable = None
+        self.__loop = None
+
+    def send(self, request, **fields):
+        """
+        Sends a RandR request without waiting for its reply, see pipeline.send_request.
+        """
+        return send_request(self.__display, request, **fields)
+
+    async def request(self, request, **fields):
+        """
+        Sends a RandR request and waits for its reply.
+        """
+        sent = self.send(request, **fields)
+        await self.wait(sent)
+        return sent
+
+    async def wait(self, *requests):
+        """
+        Flushes the queued requests and waits until the replies of the given sent requests
+        arrived. All requests sent before are answered within the same round trip.
+
+        Throws
+        ------
+        XError
+            If the server answered one of the requests with an error
+        """
+        self.__display.flush()
+
+        if not isinstance(self.__display, XDisplay):
+            # Displays of other backends answer deferred requests themselves
+            for request in requests:
+                request.reply()
+            return requests
+
+        pending = list(requests)
+        while True:
+            # Reads whatever arrived without blocking, replies are assigned to their requests
+            self.__display.pending_events()
+            # Events might have been read as well, so waiting event iterators check again
+            self.__wake()
+            pending = [
+                request
+                for request in pending
+                if request._data is None and request._error is None
+            ]
+            if not pending:
+                break
+            await self.__wait_readable()
+
+        for request in requests:
+            if request._error is not None:
+                raise request._error
+        return requests
+
+    async def gather(self, requests):
+        """
+        Waits for the replies of a dictionary of sent requests, like pipeline.collect_replies.
+        """
+        await self.wait(*requests.values())
+        return requests
+
+    async def sync(self):
+        """
+        Flushes the queued requests and waits until the server processed all of them.
+        """
+        if not isinstance(self.__display, XDisplay):
+            self.__display.sync()
+            return
+
+        # Any request with a reply is answered after all requests sent before it
+        await self.wait(GetInputFocus(display=self.__display.display, defer=True))
+
+    async def next_events(self):
+        """
+        Waits until events are pending and returns all of them.
+        """
+        while True:
+            count = self.__display.pending_events()
+            if count:
+                return [self.__display.next_event() for _ in range(count)]
+            await self.__wait_readable()
+
+    def __wait_readable(self):
+        """
+        Returns an awaitable resolved once the connection becomes readable.
+        All coroutines waiting at the same time share one reader of the event loop.
+        """
+        if self.__readable is None:
+            self.__loop = asyncio.get_event_loop()
+            self.__readable = self.__loop.create_future()
+            self.__loop.add_reader(self.__display.fileno(), self.__wake)
+        # Cancelling one waiter must not cancel the others
+        return asyncio.shield(self.__readable)
+
+    def __wake(self):
+        """
+        Resolves the pending readable future, waiters check their conditions again.
+        """
+        readable, self.__readable = self.__readable, None
+        if readable is None:
+            return
+        self.__loop.remove_reader(self.__display.fileno())
+        if not readable.done():
+            readable.set_result(None)
+
+
+class AsyncDisplay:
+    """
+    Represents an X display like Display, with the operations exposed as coroutines.
+    Screens are always loaded with all their outputs and the CRTC info of the connected ones.
+
+    Note: Opening the connection blocks for the connection setup and for interning
+    the EDID atom, every other request is awaited without blocking.
+
+    Methods
+    -------
+    get_screen_count()
+    load_screen(screen_identifier, reload, probe)
+    load_all_screens(probe)
+    enable_events()
+    events()
+    get_info(validate)
+    toJSON()
+    sync()
+    close()
+
+    Static Methods
+    --------------
+    open(id, probe, backend)
+
+    Properties
+    ----------
+    Screens()
+    """
+
+    def __init__(self, id=":0", backend=None):
+        """
+        Parameters
+        ----------
+        id : str, optional
+            The string id for this display to load (default is ":0").
+            Note: Corresponds to the DISPLAY environment variable.
+        backend : Backend, optional
+            The backend opening the X display (default is None, python-xlib is used).
+        """
+        self.__id = id
+        self.__display = (backend or XlibBackend()).open_display(id)
+        # Events of the EDID property are matched against the atom while they are applied
+        self.__display.get_atom(PROPERTY_RANDR_EDID)
+        self.__connection = AsyncConnection(self.__display)
+        self.__screens = {}
+        self.__root_screens = {}
+
+    @staticmethod
+    async def open(id=":0", probe=False, backend=None):
+        """
+        Opens an X display and loads all its screens.
+
+        Parameters
+        ----------
+        id : str, optional
+            The string id for this display to load (default is ":0").
+        probe : bool, optional
+            Whether the server should probe all outputs for changes while loading the screens
+            (default is False).
+        backend : Backend, optional
+            The backend opening the X display (default is None, python-xlib is used).
+
+        Returns
+        -------
+        AsyncDisplay
+            The display
+        """
+        display = AsyncDisplay(id, backend)
+        await display.load_all_screens(probe)
+        return display
+
+    def get_screen_count(self):
+        """
+        Returns the number of screens associated with this display.
+        """
+        return self.__display.screen_count()
+
+    async def load_screen(self, screen_identifier=None, reload=False, probe=False):
+        """
+        Loads the screen resources identified by the screen_identifier for this display.
+        The resources and the size range, the output infos and the CRTC infos are
+        requested in three round trips.
+
+        Parameters
+        ----------
+        screen_identifier : int, optional
+            The screen ID for the screen to load (Default is None, the default screen for the display).
+        reload : bool, optional
+            Whether the screen should be reloaded if it exists.
+        probe : bool, optional
+            Whether the server should probe the outputs of the screen for changes (default is False).
+
+        Returns
+        -------
+        AsyncScreen
+            The loaded screen
+
+        Throws
+        ------
+        ResourceError
+            If the screen referenced by the screen_identifier argument
+            does not exist.
+        """
+        if screen_identifier is None:
+            screen_identifier = self.__display.get_default_screen()
+
+        screen_count = self.get_screen_count()
+        if screen_identifier >= screen_count:
+            raise ResourceError(
+                "Invalid screen identifier. Display has only %s screen(s)"
+                % screen_count
+            )
+
+        if screen_identifier in self.__screens and not reload:
+            return self.__screens[screen_identifier]
+
+        root = self.__display.screen(screen_identifier).root
+        resources = self.__connection.send(
+            randr.GetScreenResources if probe else randr.GetScreenResourcesCurrent,
+            window=root,
+        )
+        size_range = self.__connection.send(randr.GetScreenSizeRange, window=root)
+        await self.__connection.wait(resources, size_range)
+
+        config_timestamp = resources._data["config_timestamp"]
+        output_infos = await self.__connection.gather(
+            {
+                output_id: self.__connection.send(
+                    randr.GetOutputInfo,
+                    output=output_id,
+                    config_timestamp=config_timestamp,
+                )
+                for output_id in resources._data["outputs"]
+            }
+        )
+        crtc_infos = await self.__connection.gather(
+            {
+                crtc_id: self.__connection.send(
+                    randr.GetCrtcInfo,
+                    crtc=crtc_id,
+                    config_timestamp=config_timestamp,
+                )
+                for crtc_id in get_target_crtc_ids(output_infos)
+            }
+        )
+
+        screen = Screen.load_from_replies(
+            self.__display,
+            screen_identifier,
+            resources,
+            output_infos,
+            crtc_infos,
+            size_range=ScreenSizeRange(
+                min_width=size_range._data["min_width"],
+                max_width=size_range._data["max_width"],
+                min_height=size_range._data["min_height"],
+                max_height=size_range._data["max_height"],
+            ),
+        )
+        async_screen = AsyncScreen(screen, self.__display, self.__connection)
+        self.__screens[screen_identifier] = async_screen
+        return async_screen
+
+    async def load_all_screens(self, probe=False):
+        """
+        Loads all screens associated with this display concurrently.
+
+        Parameters
+        ----------
+        probe : bool, optional
+            Whether the server should probe all outputs for changes (default is False).
+        """
+        await asyncio.gather(
+            *(
+                self.load_screen(screen_identifier, reload=True, probe=probe)
+                for screen_identifier in range(self.get_screen_count())
+            )
+        )
+
+    async def enable_events(self):
+        """
+        Subscribes to the RandR notify events of all screens associated with this display,
+        see Display.enable_events().
+        """
+        for screen_identifier in range(self.get_screen_count()):
+            root = self.__display.screen(screen_identifier).root
+            root.xrandr_select_input(RANDR_EVENT_MASK)
+            self.__root_screens[root.id] = screen_identifier
+
+        self.__display.flush()
+
+    async def events(self):
+        """
+        Iterates over the RandR notify events as they arrive. Each event is applied to the
+        loaded screens and outputs before it is yielded, screens an output was plugged in or
+        out of are reloaded with a full probe of their outputs first.
+        Events have to be enabled with enable_events().
+
+        Yields
+        ------
+        XEvent
+            The applied RandR notify events
+        """
+        while True:
+            applied = []
+            stale_screens = set()
+
+            for event in await self.__connection.next_events():
+                if not is_randr_event(event):
+                    continue
+
+                screen_identifier = self.__root_screens.get(get_event_window_id(event))
+                screen = self.__screens.get(screen_identifier)
+                if screen is not None and screen.screen.handle_event(event):
+                    stale_screens.add(screen_identifier)
+                applied.append(event)
+
+            for screen_identifier in stale_screens:
+                await self.load_screen(screen_identifier, reload=True, probe=True)
+
+            for event in applied:
+                yield event
+
+    @property
+    def Screens(self):
+        """
+        Returns a dictionary of the loaded screens indexed by ids.
+
+        Returns
+        -------
+        dict
+            A dictionary of AsyncScreens indexed by ids
+        """
+        return self.__screens
+
+    async def get_info(self, validate=True):
+        """
+        Returns a dictionary containing all relevant information about this display's loaded resources.
+        CRTC infos which are not cached anymore are requested in one round trip for all screens.
+
+        Parameters
+        ----------
+        validate : bool, optional
+            Whether the descriptors are validated (default is True)
+
+        Returns
+        -------
+        DisplayDescriptor
+            The descriptor of the display
+        """
+        await prefetch_crtc_infos(
+            self.__connection,
+            [
+                output
+                for screen in self.__screens.values()
+                for output in screen.screen.Outputs.values()
+            ],
+        )
+        return make_descriptor(
+            DisplayDescriptor,
+            validate,
+            id=self.__id,
+            screen_count=self.get_screen_count(),
+            screens=[
+                screen.screen.get_info(validate) for screen in self.__screens.values()
+            ],
+        )
+
+    async def toJSON(self):
+        """
+        Returns the information about this display's loaded resources in JSON format.
+        """
+        return JSON_ENCODER.encode(await self.get_info(validate=False))
+
+    async def sync(self):
+        """
+        Flushes X queue and waits until the server has processed all
+        the queued requests.
+        """
+        await self.__connection.sync()
+
+    def close(self):
+        """
+        Closes the connection to the X display.
+        """
+        self.__display.close()
+
+
+class AsyncScreen:
+    """
+    Represents a screen of an AsyncDisplay, with the operations of Screen exposed as coroutines.
+    The underlying Screen keeps the state and answers everything not needing the server.
+
+    Methods
+    -------
+    get_size_range()
+    set_size(width, height, dpi, width_mm, height_mm)
+    adjust_size()
+    create_mode(name, width, height, refresh_rate, interlaced, timing)
+    best_mode(output)
+    set_crtc_config(output, config)
+    apply_layout(layout)
+    get_info(validate)
+
+    Properties
+    ----------
+    screen()
+    Outputs()
+    """
+
+    def __init__(self, screen, display, connection):
+        """
+        Parameters
+        ----------
+        screen : Screen
+            The loaded screen
+        display : XDisplay
+            The underlying X display which contains the screen
+        connection : AsyncConnection
+            The connection of the display
+        """
+        self.__screen = screen
+        self.__display = display
+        self.__root = display.screen(screen.ID).root
+        self.__connection = connection
+
+    @property
+    def screen(self):
+        """
+        Returns the underlying Screen.
+        """
+        return self.__screen
+
+    @property
+    def Outputs(self):
+        """
+        Returns a dictionary of all outputs associated with this screen indexed with their IDs.
+        """
+        return {
+            output_id: self.__wrap(output)
+            for output_id, output in self.__screen.Outputs.items()
+        }
+
+    async def get_size_range(self):
+        """
+        Returns the size range allowed for this screen, it is requested once at most.
+        """
+        return self.__screen.get_size_range()
+
+    async def set_size(self, width, height, dpi=None, width_mm=None, height_mm=None):
+        """
+        Sets the size of the screen, see Screen.set_size().
+        """
+        self.__screen.set_size(width, height, dpi, width_mm, height_mm)
+        self.__display.flush()
+
+    async def adjust_size(self):
+        """
+        Adjusts size of screen to fit outputs, see Screen.adjust_size().
+        """
+        await prefetch_crtc_infos(
+            self.__connection, list(self.__screen.Outputs.values())
+        )
+        self.__screen.adjust_size()
+        self.__display.flush()
+
+    async def create_mode(
+        self,
+        name,
+        width,
+        height,
+        refresh_rate,
+        interlaced=False,
+        timing=ModeTiming.CVT,
+    ):
+        """
+        Creates a new mode for this screen and returns its ID, see Screen.create_mode().
+        """
+        mode = get_mode(width, height, refresh_rate, name, 0, interlaced, timing)
+        reply = await self.__connection.request(
+            randr.CreateMode, window=self.__root, mode=mode, name=name
+        )
+        return self.__screen.register_mode(reply._data["mode"], mode)
+
+    async def best_mode(self, output):
+        """
+        Returns the ID of the best mode for the monitor connected to the given output,
+        see Screen.best_mode(). The EDID is requested before without blocking.
+        """
+        output = self.__unwrap(output)
+        if output.Connected:
+            await self.__wrap(output).load_edid()
+        return self.__screen.best_mode(output)
+
+    async def set_crtc_config(self, output, config: CRTCConfig):
+        """
+        Sets crtc config on output while also adjusting screen size.
+        The config is applied through apply_layout(), so the screen is resized once at most.
+
+        Throws
+        ------
+        ResourceError
+            If the output is not assigned to this screen or the mode is not in the list of
+            supported modes for this screen.
+        """
+        await self.apply_layout({output: config})
+
+    async def apply_layout(self, layout):
+        """
+        Sets the crtc configs of multiple outputs at once while resizing the screen only once,
+        see Screen.apply_layout().
+
+        Parameters
+        ----------
+        layout : dict
+            A dictionary of CRTCConfigs indexed by the outputs or AsyncOutputs to apply them to.
+        """
+        layout = {self.__unwrap(output): config for output, config in layout.items()}
+        await prefetch_crtc_infos(
+            self.__connection, list(self.__screen.Outputs.values())
+        )
+        plan = self.__screen.plan_layout(layout)
+        if not plan:
+            return
+
+        self.__display.grab_server()
+
+        try:
+            for operation in plan:
+                if isinstance(operation, DisableOutput):
+                    await self.__wrap(operation.output).disable()
+                elif isinstance(operation, SetScreenSize):
+                    self.__screen.set_size(operation.width, operation.height)
+                else:
+                    await self.__wrap(operation.output).set_config(operation.config)
+        finally:
+            self.__display.ungrab_server()
+            self.__display.flush()
+
+    async def get_info(self, validate=True):
+        """
+        Returns a dictionary containing all relevant information about this screen's resources.
+        CRTC infos which are not cached anymore are requested in one round trip.
+        """
+        await prefetch_crtc_infos(
+            self.__connection, list(self.__screen.Outputs.values())
+        )
+        return self.__screen.get_info(validate)
+
+    def __wrap(self, output):
+        return AsyncOutput(output, self.__display, self.__connection)
+
+    def __unwrap(self, output):
+        return output.output if isinstance(output, AsyncOutput) else output
+
+
+class AsyncOutput:
+    """
+    Represents an output of an AsyncScreen, with the operations of Output exposed as coroutines.
+    The underlying Output keeps the state and answers everything not needing the server.
+
+    Methods
+    -------
+    set_mode(mode_id, crtc_id)
+    set_position(x,y)
+    set_rotation(rotation)
+    set_config(config)
+    disable()
+    re_enable()
+    load_edid()
+    get_edid()
+    has_edid()
+    add_mode(mode_id)
+    get_info(validate)
+
+    Properties
+    ----------
+    output()
+    """
+
+    def __init__(self, output, display, connection):
+        """
+        Parameters
+        ----------
+        output : Output
+            The loaded output
+        display : XDisplay
+            The underlying X display which contains the output
+        connection : AsyncConnection
+            The connection of the display
+        """
+        self.__output = output
+        self.__display = display
+        self.__connection = connection
+
+    @property
+    def output(self):
+        """
+        Returns the underlying Output.
+        """
+        return self.__output
+
+    async def set_mode(self, mode_id, crtc_id=None):
+        """
+        Sets the mode of this output, see Output.set_mode().
+        """
+        return await self.set_config(CRTCConfig(crtc=crtc_id, mode=mode_id))
+
+    async def set_position(self, x=None, y=None):
+        """
+        Sets the position of this output, see Output.set_position().
+        """
+        return await self.set_config(CRTCConfig(x=x, y=y))
+
+    async def set_rotation(self, rotation=Rotation.NO_ROTATION):
+        """
+        Sets the rotation of this output, see Output.set_rotation().
+        """
+        return await self.set_config(CRTCConfig(rotation=rotation))
+
+    async def set_config(self, config: CRTCConfig):
+        """
+        Sets the crtc config of this output, see Output.set_config().
+        Missing values of the config are taken from the current one.
+        """
+        await prefetch_crtc_infos(self.__connection, [self.__output])
+        prepared = self.__output.prepare_config(config)
+        if prepared is None:
+            # Nothing changes, avoid a needless mode set
+            return
+
+        config, fields = prepared
+        result = await self.__connection.request(randr.SetCrtcConfig, **fields)
+        self.__output.commit_config(config, result._data["new_timestamp"])
+
+    async def disable(self):
+        """
+        Disables output if connected
+        """
+        await prefetch_crtc_infos(self.__connection, [self.__output])
+        config = self.__output.get_disable_config()
+        if config is not None:
+            await self.set_config(config)
+
+    async def re_enable(self):
+        """
+        If this output was connected before, connects to the last crtc_id it was
+        connected to with the mode that it was connected with.
+        """
+        await prefetch_crtc_infos(self.__connection, [self.__output])
+        config = self.__output.get_re_enable_config()
+        if config is not None:
+            await self.set_config(config)
+
+    async def load_edid(self):
+        """
+        Requests the raw EDID of the connected monitor unless it is cached.
+
+        Throws
+        ------
+        InvalidStateError
+            If output is not connected.
+        """
+        if not self.__output.Connected:
+            raise InvalidStateError("Output is not connected to any monitor")
+        if self.__output.EDID_Loaded:
+            return
+
+        atom = self.__display.get_atom(PROPERTY_RANDR_EDID)
+        raw, offset, length = Output.next_edid_chunk(b"", None)
+        while length:
+            reply = await self.__connection.request(
+                randr.GetOutputProperty,
+                output=self.__output.ID,
+                property=atom,
+                type=EDID_TYPE,
+                long_offset=offset,
+                long_length=length,
+                delete=False,
+                pending=False,
+            )
+            raw, offset, length = Output.next_edid_chunk(raw, reply)
+        self.__output.put_raw_edid(raw)
+
+    async def get_edid(self):
+        """
+        Returns the EDID of the monitor connected to this output, see Output.get_edid().
+        """
+        await self.load_edid()
+        return self.__output.get_edid()
+
+    async def has_edid(self):
+        """
+        Checks if the output's connected monitor exposes an EDID property.
+        """
+        await self.load_edid()
+        return self.__output.has_edid()
+
+    async def add_mode(self, mode_id):
+        """
+        Adds a mode to this output, see Output.add_mode().
+        """
+        self.__output.add_mode(mode_id)
+        self.__display.flush()
+
+    async def get_info(self, validate=True):
+        """
+        Returns a dictionary containing all relevant information about this output.
+        """
+        await prefetch_crtc_infos(self.__connection, [self.__output])
+        return self.__output.get_info(validate)
+
+
+async def prefetch_crtc_infos(connection, outputs):
+    """
+    Requests the CRTC infos the given outputs miss in their caches in one round trip,
+    so reading their CRTC info afterwards does not block.
+
+    Parameters
+    ----------
+    connection : AsyncConnection
+        The connection of the display containing the outputs
+    outputs : list
+        The Outputs
+    """
+    requests = {}
+    for output in outputs:
+        fields = output.get_crtc_info_request()
+        if fields is not None and fields["crtc"] not in requests:
+            requests[fields["crtc"]] = (
+                output,
+                connection.send(randr.GetCrtcInfo, **fields),
+            )
+
+    await connection.wait(*(request for _, request in requests.values()))
+    for output, request in requests.values():
+        output.put_crtc_info(request)
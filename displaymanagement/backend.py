@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from Xlib import display
+
+
+class Backend(ABC):
+    """
+    Opens the X display objects the library talks to.
+    Displays of other backends have to provide the python-xlib display methods and
+    RandR extension methods used by the library, and defer_request() for sending
+    requests whose replies are collected later (see pipeline.py).
+
+    Methods
+    -------
+    open_display(name)
+    """
+
+    @abstractmethod
+    def open_display(self, name):
+        """
+        Opens the display with the given name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the display, e.g. ":0"
+
+        Returns
+        -------
+        XDisplay
+            The display object
+        """
+        pass
+
+
+class XlibBackend(Backend):
+    """
+    Connects to X servers through python-xlib, the default backend.
+
+    Methods
+    -------
+    open_display(name)
+    """
+
+    def open_display(self, name):
+        return display.Display(name)
@@ -0,0 +1,201 @@
+import hashlib
+from pyedid import parse_edid
+from .model_descriptors.crtc_info import CRTCInfo
+from .edid import EDID_BLOCK_LENGTH
+from .model_descriptors.edid_descriptor import EDIDDescriptor
+from .rotation import Rotation
+from .resources import get_pnp_info
+from .utils import format_edid
+
+
+class CRTCInfoCache:
+    """
+    Caches the CRTC info of a screen indexed by CRTC IDs.
+
+    Entries are only valid for the config timestamp they were requested with.
+    All entries are dropped once a reply reveals a newer server timestamp, i.e.
+    the configuration was changed by another client.
+
+    Methods
+    -------
+    get(crtc_id, config_timestamp)
+    contains(crtc_id, config_timestamp)
+    put(crtc_id, reply, config_timestamp)
+    invalidate(crtc_id, timestamp)
+    update_from_crtc_change(event)
+    clear()
+    """
+
+    def __init__(self, display):
+        """
+        Parameters
+        ----------
+        display : XDisplay
+            The X display used for requesting missing entries.
+        """
+        self.__display = display
+        self.__entries = {}
+        self.__timestamp = None
+
+    def get(self, crtc_id: int, config_timestamp: int) -> CRTCInfo:
+        """
+        Returns the CRTC info for the given id, requesting it only if it is not cached.
+
+        Parameters
+        ----------
+        crtc_id : int
+            The ID of the CRTC
+        config_timestamp : int
+            The current config timestamp of the screen containing the CRTC
+        """
+        entry = self.__entries.get(crtc_id)
+        if entry is not None and entry[0] == config_timestamp:
+            return entry[1]
+
+        reply = self.__display.xrandr_get_crtc_info(crtc_id, config_timestamp)
+        return self.put(crtc_id, reply, config_timestamp)
+
+    def contains(self, crtc_id: int, config_timestamp: int) -> bool:
+        """
+        Checks if the CRTC info for the given id is cached for the config timestamp.
+        """
+        entry = self.__entries.get(crtc_id)
+        return entry is not None and entry[0] == config_timestamp
+
+    def put(self, crtc_id: int, reply, config_timestamp: int) -> CRTCInfo:
+        """
+        Caches a received CRTC info reply and returns the corresponding CRTC info.
+
+        Parameters
+        ----------
+        crtc_id : int
+            The ID of the CRTC
+        reply : GetCrtcInfo
+            The CRTC info reply
+        config_timestamp : int
+            The config timestamp the info was requested with
+        """
+        data = reply._data
+        if self.__timestamp is None or data["timestamp"] > self.__timestamp:
+            # The configuration changed since the other entries were requested
+            self.__entries.clear()
+            self.__timestamp = data["timestamp"]
+
+        crtc_info = CRTCInfo(mode_id=data["mode"], **data)
+        self.__entries[crtc_id] = (config_timestamp, crtc_info)
+        return crtc_info
+
+    def invalidate(self, crtc_id: int, timestamp: int = None):
+        """
+        Drops the entry of a CRTC that was changed by this library.
+
+        Parameters
+        ----------
+        crtc_id : int
+            The ID of the changed CRTC
+        timestamp : int, optional
+            The new server timestamp returned for the change
+        """
+        self.__entries.pop(crtc_id, None)
+        if timestamp is not None:
+            self.__timestamp = timestamp
+
+    def update_from_crtc_change(self, event):
+        """
+        Patches the cached entry of a CRTC from a RandR CRTC change event.
+
+        Parameters
+        ----------
+        event : CrtcChangeNotify
+            The CRTC change event
+        """
+        entry = self.__entries.get(event.crtc)
+        if entry is None:
+            return
+
+        config_timestamp, crtc_info = entry
+        self.__entries[event.crtc] = (
+            config_timestamp,
+            crtc_info.copy(
+                update=dict(
+                    x=event.x,
+                    y=event.y,
+                    width=event.width,
+                    height=event.height,
+                    mode_id=event.mode,
+                    rotation=Rotation(
+                        event.rotation or Rotation.NO_ROTATION.value
+                    ).value,
+                )
+            ),
+        )
+        self.__timestamp = max(self.__timestamp, event.timestamp)
+
+    def clear(self):
+        """
+        Drops all cached entries.
+        """
+        self.__entries.clear()
+        self.__timestamp = None
+
+
+class EDIDCache:
+    """
+    Caches the raw EDIDs of the outputs of a screen indexed by output IDs,
+    and the parsed EDIDs indexed by the digest of their bytes.
+
+    Methods
+    -------
+    contains(output_id)
+    get(output_id)
+    put(output_id, raw)
+    parse(raw)
+    invalidate(output_id)
+    """
+
+    def __init__(self):
+        self.__raw = {}
+        self.__parsed = {}
+
+    def contains(self, output_id: int) -> bool:
+        """
+        Checks if the EDID of an output was fetched, including outputs without an EDID.
+        """
+        return output_id in self.__raw
+
+    def get(self, output_id: int):
+        """
+        Returns the raw EDID of an output or None if the output has no EDID.
+        """
+        return self.__raw[output_id]
+
+    def put(self, output_id: int, raw):
+        """
+        Caches the raw EDID of an output.
+
+        Parameters
+        ----------
+        output_id : int
+            The ID of the output
+        raw : bytes
+            The raw EDID or None if the output has no EDID
+        """
+        self.__raw[output_id] = raw
+
+    def parse(self, raw: bytes) -> EDIDDescriptor:
+        """
+        Returns the descriptor of a raw EDID, parsing it only if the same bytes were not parsed before.
+        """
+        digest = hashlib.sha1(raw).digest()
+        if digest not in self.__parsed:
+            # Only the base block is parsed up front, extensions are decoded on access
+            self.__parsed[digest] = format_edid(
+                parse_edid(raw[:EDID_BLOCK_LENGTH], get_pnp_info()), raw
+            )
+        return self.__parsed[digest]
+
+    def invalidate(self, output_id: int):
+        """
+        Drops the raw EDID of an output, e.g. after the output changed.
+        """
+        self.__raw.pop(output_id, None)
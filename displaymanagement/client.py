@@ -0,0 +1,119 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+from .exceptions import DaemonError
+
+# Only the standard library is imported, so clients start without loading python-xlib,
+# pydantic or pyedid
+
+
+def default_socket_path(display_id):
+    """
+    Returns the path of the Unix socket the daemon serving a display listens on by default,
+    e.g. $XDG_RUNTIME_DIR/displaymanagement-0.sock for the display ":0".
+    """
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(
+        directory, "displaymanagement-{}.sock".format(display_id.lstrip(":"))
+    )
+
+
+class DaemonClient:
+    """
+    Sends requests to a display management daemon over its Unix socket.
+    The protocol is line based: every request is a JSON object with the method name and
+    its parameters, every response a JSON object with the result or the error.
+
+    Methods
+    -------
+    call(method, params)
+    close()
+    """
+
+    def __init__(self, socket_path=None, display_id=":0", timeout=10.0):
+        """
+        Parameters
+        ----------
+        socket_path : str, optional
+            The path of the socket of the daemon (default is None, the default path for the display).
+        display_id : str, optional
+            The display served by the daemon, used for the default socket path (default is ":0").
+        timeout : float, optional
+            The maximum duration of a request in seconds (default is 10).
+        """
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__socket.settimeout(timeout)
+        self.__socket.connect(socket_path or default_socket_path(display_id))
+        self.__stream = self.__socket.makefile("rwb")
+        self.__next_id = 0
+
+    def call(self, method, **params):
+        """
+        Calls a method of the daemon and returns its result.
+
+        Parameters
+        ----------
+        method : str
+            The name of the method, e.g. "get_info" or "set_rotation"
+        params : dict
+            The parameters of the method
+
+        Throws
+        ------
+        DaemonError
+            If the daemon failed to handle the request
+        """
+        self.__next_id += 1
+        request = dict(id=self.__next_id, method=method, params=params)
+        self.__stream.write(json.dumps(request, separators=(",", ":")).encode() + b"\n")
+        self.__stream.flush()
+
+        line = self.__stream.readline()
+        if not line:
+            raise DaemonError("ConnectionError", "The daemon closed the connection.")
+        response = json.loads(line)
+        if "error" in response:
+            raise DaemonError(response["error"]["type"], response["error"]["message"])
+        return response["result"]
+
+    def close(self):
+        """
+        Closes the connection to the daemon.
+        """
+        self.__stream.close()
+        self.__socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def parse_value(value):
+    """
+    Parses a command line parameter value as JSON, falling back to the plain string.
+    """
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+if __name__ == "__main__":
+    # Calls a method of the daemon serving $DISPLAY, e.g.
+    # python -m displaymanagement.client set_rotation output=HDMI-1 rotation=2
+    method, arguments = sys.argv[1], sys.argv[2:]
+    params = {}
+    for argument in arguments:
+        name, _, value = argument.partition("=")
+        params[name] = parse_value(value)
+
+    with DaemonClient(display_id=os.environ.get("DISPLAY", ":0")) as client:
+        try:
+            print(json.dumps(client.call(method, **params)))
+        except DaemonError as error:
+            print(error, file=sys.stderr)
+            sys.exit(1)
@@ -0,0 +1,259 @@
+import argparse
+import inspect
+import json
+import os
+import signal
+import socketserver
+import threading
+from .display import Display
+from .client import default_socket_path
+from .entity import JSON_ENCODER
+from .rotation import Rotation
+from .model_descriptors.crtc_config import CRTCConfig
+from .exceptions import MalformedInputError, ResourceError
+
+
+class DisplayService:
+    """
+    Handles the requests of daemon clients with one warm, thread-safe Display whose state
+    is kept up to date by RandR events, so requests are answered without reloading anything.
+    Outputs are referenced by their ID or name, on the default screen unless given.
+
+    Methods
+    -------
+    handle(line)
+    get_info()
+    set_mode(output, mode, crtc, screen)
+    set_position(output, x, y, screen)
+    set_rotation(output, rotation, screen)
+    disable(output, screen)
+    re_enable(output, screen)
+    get_edid(output, screen)
+    apply_layout(layout, screen)
+    close()
+    """
+
+    METHODS = (
+        "get_info",
+        "set_mode",
+        "set_position",
+        "set_rotation",
+        "disable",
+        "re_enable",
+        "get_edid",
+        "apply_layout",
+    )
+
+    def __init__(self, display_id=":0", probe=False, backend=None):
+        """
+        Parameters
+        ----------
+        display_id : str, optional
+            The id of the display to serve (default is ":0").
+        probe : bool, optional
+            Whether the server should probe all outputs for changes while loading the screens
+            (default is False).
+        backend : Backend, optional
+            The backend opening the X display (default is None, python-xlib is used).
+        """
+        self.__display = Display(
+            display_id, probe=probe, backend=backend, thread_safe=True
+        )
+        self.__display.enable_events()
+        self.__display.start_event_reader()
+        self.__info = None
+        self.__info_json = None
+
+    def handle(self, line):
+        """
+        Handles one request line and returns the response line.
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            method = request["method"]
+            if method not in self.METHODS:
+                raise MalformedInputError("Unknown method {}.".format(method))
+            handler = getattr(self, method)
+            params = request.get("params", {})
+            try:
+                inspect.signature(handler).bind(**params)
+            except TypeError as error:
+                raise MalformedInputError(str(error))
+            result = handler(**params)
+        except Exception as error:
+            # Any failure is reported to the client, the daemon keeps serving
+            return JSON_ENCODER.encode(
+                dict(
+                    id=request_id,
+                    error=dict(type=type(error).__name__, message=str(error)),
+                )
+            )
+
+        if method == "get_info":
+            # The encoded info is reused until the state of the display changes
+            return '{{"id":{},"result":{}}}'.format(json.dumps(request_id), result)
+        return JSON_ENCODER.encode(dict(id=request_id, result=result))
+
+    def get_info(self):
+        """
+        Returns the info of the display encoded as JSON.
+        """
+        info = self.__display.get_info(validate=False)
+        if info is not self.__info:
+            self.__info_json = JSON_ENCODER.encode(info)
+            self.__info = info
+        return self.__info_json
+
+    def set_mode(self, output, mode, crtc=None, screen=0):
+        """
+        Sets the mode of an output, see Output.set_mode().
+        """
+        self.__get_output(output, screen).set_mode(mode, crtc)
+
+    def set_position(self, output, x=None, y=None, screen=0):
+        """
+        Sets the position of an output, see Output.set_position().
+        """
+        self.__get_output(output, screen).set_position(x, y)
+
+    def set_rotation(self, output, rotation=Rotation.NO_ROTATION.value, screen=0):
+        """
+        Sets the rotation of an output given as Rotation value, see Output.set_rotation().
+        """
+        self.__get_output(output, screen).set_rotation(Rotation(rotation))
+
+    def disable(self, output, screen=0):
+        """
+        Disables an output, see Output.disable().
+        """
+        self.__get_output(output, screen).disable()
+
+    def re_enable(self, output, screen=0):
+        """
+        Enables an output with its last mode again, see Output.re_enable().
+        """
+        self.__get_output(output, screen).re_enable()
+
+    def get_edid(self, output, screen=0):
+        """
+        Returns the EDID of the monitor connected to an output, see Output.get_edid().
+        """
+        return self.__get_output(output, screen).get_edid()
+
+    def apply_layout(self, layout, screen=0):
+        """
+        Applies a layout given as a dictionary of CRTC configs (crtc, x, y, mode, rotation)
+        indexed by output IDs or names, see Screen.apply_layout().
+        """
+        self.__get_screen(screen).apply_layout(
+            {
+                self.__get_output(output, screen): CRTCConfig(**config)
+                for output, config in layout.items()
+            }
+        )
+
+    def __get_screen(self, screen):
+        try:
+            return self.__display.Screens[screen]
+        except KeyError:
+            raise ResourceError("Screen {} does not exist.".format(screen))
+
+    def __get_output(self, output, screen):
+        outputs = self.__get_screen(screen).Outputs
+        if isinstance(output, str) and output.isdigit():
+            # Output IDs arrive as strings when used as keys of a layout
+            output = int(output)
+        if isinstance(output, int):
+            if output in outputs:
+                return outputs[output]
+        else:
+            for candidate in outputs.values():
+                if candidate.Name == output:
+                    return candidate
+        raise ResourceError("Output {} does not exist.".format(output))
+
+    def close(self):
+        """
+        Stops applying events and closes the connection to the display.
+        """
+        self.__display.close()
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answers the request lines of one client connection in order.
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.wfile.write(self.server.service.handle(line).encode() + b"\n")
+            self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Serves a DisplayService on a Unix socket, each client connection is handled by its own thread.
+    The socket is only accessible by the user running the daemon.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, service):
+        """
+        Parameters
+        ----------
+        socket_path : str
+            The path of the socket, an existing socket file is replaced
+        service : DisplayService
+            The service handling the requests
+        """
+        self.service = service
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, DaemonRequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        description="Serves a display over a Unix socket, see client.py for the protocol"
+    )
+    parser.add_argument("--display", default=os.environ.get("DISPLAY", ":0"))
+    parser.add_argument(
+        "--socket", help="default: $XDG_RUNTIME_DIR/displaymanagement-N.sock"
+    )
+    parser.add_argument("--probe", action="store_true")
+    options = parser.parse_args(arguments)
+
+    service = DisplayService(options.display, options.probe)
+    server = DaemonServer(
+        options.socket or default_socket_path(options.display), service
+    )
+
+    def stop(*_):
+        # shutdown() waits for serve_forever() to return, so it must not run on its thread
+        threading.Thread(target=server.shutdown).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
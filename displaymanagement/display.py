@@ -1,10 +1,15 @@
-from Xlib import display
 from Xlib.ext import randr
 from .screen import Screen
+from .backend import XlibBackend
 from .entity import Entity
+from .lazy import LazyDict
+from .snapshot import load_snapshot, restore_screens, save_snapshot
+from .threads import EventReader, NO_LOCK, make_thread_safe, synchronized
+from .events import RANDR_EVENT_MASK, is_randr_event, get_event_window_id
 from .model_descriptors.display_descriptor import DisplayDescriptor
 from .validation import is_valid_display_identifier
-from .exceptions import ResourceError
+from .utils import make_descriptor
+from .exceptions import ResourceError, InvalidStateError
 
 
 class Display(Entity):
@@ -16,35 +21,92 @@ class Display(Entity):
     -------
     init_display()
     get_screen_count()
-    load_screen(screen_identifier, reload)
-    load_all_screens()
+    load_screen(screen_identifier, reload, probe)
+    load_screens(screen_identifiers, reload, probe)
+    load_all_screens(probe)
+    restore(snapshot, probe)
+    save_snapshot(path)
+    enable_events()
+    process_events(block)
+    start_event_reader(interval)
+    stop_event_reader()
     get_info()
     sync()
+    close()
 
     Properties
     ----------
     Screens()
     """
 
-    def __init__(self, id=":0"):
+    def __init__(
+        self,
+        id=":0",
+        probe=False,
+        lazy=False,
+        instrumentation=None,
+        backend=None,
+        thread_safe=False,
+        snapshot=None,
+    ):
         """
         Parameters
         ----------
         id : str, optional
             The string id for this display to load (default is ":0").
             Note: Corresponds to the DISPLAY environment variable.
+        probe : bool, optional
+            Whether the server should probe all outputs for changes while loading the screens
+            (default is False). Probing can take up to seconds on some drivers.
+        lazy : bool, optional
+            Whether screens, their outputs and the CRTC info of the outputs are only loaded
+            on first access instead of all at once (default is False).
+        instrumentation : Instrumentation, optional
+            Records the requests sent by this display, its screens and outputs
+            (default is None, nothing is recorded).
+        backend : Backend, optional
+            The backend opening the X display (default is None, python-xlib is used).
+        thread_safe : bool, optional
+            Whether the display, its screens and outputs can be shared between threads
+            (default is False). Requests and state changes are serialized by one lock per
+            display, and get_info() returns a shared snapshot while nothing changed.
+        snapshot : str, optional
+            The path of a snapshot written by save_snapshot() to load the screens from,
+            see restore() (default is None, the screens are loaded from the server).
         """
         super().__init__(id)
-        self.__screens = {}
         self.__display = None
+        self.__root_screens = {}
+        self.__probe = probe
+        self.__lazy = lazy
+        self.__instrumentation = instrumentation
+        self.__backend = backend or XlibBackend()
+        self.__thread_safe = thread_safe
+        self._lock = NO_LOCK
+        self.__snapshots = {}
+        self.__event_reader = None
         self.init_display()
-        self.load_all_screens()
+        self.__screens = LazyDict(
+            range(self.get_screen_count()), self.__load_screen_on_access
+        )
+        if snapshot is not None:
+            self.restore(snapshot, probe)
+        elif not lazy:
+            self.load_all_screens(probe)
 
     def init_display(self):
         """
         Loads the display resources(Excludes loading associated screens).
         """
-        self.__display = display.Display(self._id)
+        if self.__thread_safe:
+            # Makes python-xlib lock its connection state as well
+            import Xlib.threaded  # noqa: F401
+
+        self.__display = self.__backend.open_display(self._id)
+        if self.__thread_safe:
+            self._lock = make_thread_safe(self.__display)
+        if self.__instrumentation is not None:
+            self.__instrumentation.attach(self.__display)
 
     def get_screen_count(self):
         """
@@ -52,7 +114,7 @@ class Display(Entity):
         """
         return self.__display.screen_count()
 
-    def load_screen(self, screen_identifier=None, reload=False):
+    def load_screen(self, screen_identifier=None, reload=False, probe=False):
         """
         Loads the screen resources identified by the screen_identifier for this display.
 
@@ -62,6 +124,13 @@ class Display(Entity):
             The screen ID for the screen to load (Default is None, the default screen for the display).
         reload : bool, optional
             Whether the screen should be reloaded if it exists.
+        probe : bool, optional
+            Whether the server should probe the outputs of the screen for changes (default is False).
+
+        Returns
+        -------
+        Screen
+            The loaded screen
 
         Throws
         ------
@@ -78,26 +147,244 @@ class Display(Entity):
             )
 
         # if screen exists remove or short circuit depending on the reload param.
-        if screen_identifier in self.__screens and not reload:
-            return
+        if self.__screens.is_loaded(screen_identifier) and not reload:
+            return self.__screens[screen_identifier]
 
-        screen = Screen.load_from_identifier(self.__display, screen_identifier)
-        self.__screens[screen_identifier] = screen
+        with self._lock.changing():
+            screen = Screen.load_from_identifier(
+                self.__display,
+                screen_identifier,
+                probe,
+                self.__lazy,
+            )
+            self.__screens[screen_identifier] = screen
+        return screen
 
-    def load_all_screens(self):
+    def __load_screen_on_access(self, screen_identifier):
         """
-        Loads all screens associated with this display.
+        Loads a screen of a lazily loaded display on first access.
+        """
+        return self.load_screen(screen_identifier, probe=self.__probe)
+
+    def load_screens(self, screen_identifiers, reload=False, probe=False):
+        """
+        Loads multiple screens of this display concurrently: the requests of all screens are
+        interleaved on the connection, so they are loaded in three round trips in total
+        instead of three per screen.
+
+        Parameters
+        ----------
+        screen_identifiers : list
+            The IDs of the screens to load
+        reload : bool, optional
+            Whether screens should be reloaded if they exist.
+        probe : bool, optional
+            Whether the server should probe the outputs of the screens for changes (default is False).
+
+        Returns
+        -------
+        dict
+            The loaded screens indexed by their IDs
+
+        Throws
+        ------
+        ResourceError
+            If one of the screens does not exist.
         """
-        self.__screens = {}
         screen_count = self.get_screen_count()
+        for screen_identifier in screen_identifiers:
+            if screen_identifier >= screen_count:
+                raise ResourceError(
+                    "Invalid screen identifier. Display has only %s screen(s)"
+                    % screen_count
+                )
 
-        for i in range(screen_count):
-            self.load_screen(i)
+        to_load = [
+            screen_identifier
+            for screen_identifier in screen_identifiers
+            if reload or not self.__screens.is_loaded(screen_identifier)
+        ]
+        if to_load:
+            with self._lock.changing():
+                screens = Screen.load_from_identifiers(
+                    self.__display, to_load, probe, self.__lazy
+                )
+                for screen_identifier, screen in screens.items():
+                    self.__screens[screen_identifier] = screen
+
+        return {
+            screen_identifier: self.__screens[screen_identifier]
+            for screen_identifier in screen_identifiers
+        }
+
+    def load_all_screens(self, probe=False):
+        """
+        Loads all screens associated with this display concurrently, see load_screens().
+        The loaded screens replace the previous ones at once.
+
+        Parameters
+        ----------
+        probe : bool, optional
+            Whether the server should probe all outputs for changes (default is False).
+        """
+        screen_count = self.get_screen_count()
+        with self._lock.changing():
+            screens = Screen.load_from_identifiers(
+                self.__display, range(screen_count), probe, self.__lazy
+            )
+            self.__screens = LazyDict(range(screen_count), self.__load_screen_on_access)
+            self.__screens.update(screens)
+
+    def restore(self, snapshot, probe=False):
+        """
+        Loads all screens associated with this display from a snapshot written by save_snapshot().
+        The snapshot is validated with one screen resources request for all screens, only
+        the screens whose config timestamps changed since are loaded from the server.
+        All screens are loaded from the server if the snapshot is missing or unusable.
+
+        Parameters
+        ----------
+        snapshot : str
+            The path of the snapshot file
+        probe : bool, optional
+            Whether the server should probe all outputs for changes (default is False).
+
+        Returns
+        -------
+        bool
+            Whether the snapshot was used
+        """
+        try:
+            data = load_snapshot(snapshot, self._id)
+        except (OSError, ValueError, InvalidStateError):
+            self.load_all_screens(probe)
+            return False
+
+        screen_count = self.get_screen_count()
+        try:
+            with self._lock.changing():
+                screens = restore_screens(
+                    self.__display, data, range(screen_count), probe, self.__lazy
+                )
+                self.__screens = LazyDict(
+                    range(screen_count), self.__load_screen_on_access
+                )
+                self.__screens.update(screens)
+        except (KeyError, TypeError, ValueError):
+            # Stored values of unexpected types only surface while rebuilding the screens
+            self.load_all_screens(probe)
+            return False
+        return True
+
+    @synchronized
+    def save_snapshot(self, path):
+        """
+        Writes the loaded screens, their outputs, the CRTC info and the cached EDIDs
+        with the config timestamps they are valid for to a compact snapshot file,
+        see restore().
+
+        Parameters
+        ----------
+        path : str
+            The path of the snapshot file
+        """
+        save_snapshot(self._id, dict(self.__screens.loaded_items()), path)
+
+    @synchronized
+    def enable_events(self):
+        """
+        Subscribes to the RandR notify events of all screens associated with this display.
+        Once enabled, process_events() keeps the loaded screens and outputs up to date
+        without reloading them.
+
+        Note: python-xlib only decodes RandR events for servers supporting RandR 1.5 or later.
+        """
+        for screen_identifier in range(self.get_screen_count()):
+            root = self.__display.screen(screen_identifier).root
+            root.xrandr_select_input(RANDR_EVENT_MASK)
+            self.__root_screens[root.id] = screen_identifier
+
+        self.__display.flush()
+
+    @synchronized
+    def process_events(self, block=False):
+        """
+        Applies the pending RandR notify events to the loaded screens and their outputs.
+        Only the affected outputs are patched, screens are only reloaded, with a full
+        probe of their outputs, when an output was plugged in or out.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Whether to wait for an event if none is pending (default is False).
+
+        Returns
+        -------
+        int
+            The number of RandR events applied.
+        """
+        handled = 0
+        stale_screens = set()
+
+        while block or self.__display.pending_events():
+            block = False
+            event = self.__display.next_event()
+            if not is_randr_event(event):
+                continue
+
+            screen_identifier = self.__root_screens.get(get_event_window_id(event))
+            if not self.__screens.is_loaded(screen_identifier):
+                # Screens not loaded yet are requested with their current state on first access
+                continue
+
+            screen = self.__screens[screen_identifier]
+
+            if screen.handle_event(event):
+                stale_screens.add(screen_identifier)
+            handled += 1
+
+        if stale_screens:
+            self.load_screens(stale_screens, reload=True, probe=True)
+
+        return handled
+
+    def start_event_reader(self, interval=0.5):
+        """
+        Starts a background thread applying RandR events as soon as they arrive,
+        so the loaded state is kept up to date without calling process_events().
+        Events have to be enabled with enable_events().
+
+        Parameters
+        ----------
+        interval : float, optional
+            How often, in seconds, pending events are checked for at least (default is 0.5).
+
+        Throws
+        ------
+        InvalidStateError
+            If the display is not thread-safe or the reader was started already.
+        """
+        if not self.__thread_safe:
+            raise InvalidStateError("Event readers require a thread-safe display.")
+        if self.__event_reader is not None:
+            raise InvalidStateError("The event reader was started already.")
+
+        self.__event_reader = EventReader(self, self.__display, interval)
+        self.__event_reader.start()
+
+    def stop_event_reader(self):
+        """
+        Stops the background thread applying RandR events, if it was started.
+        """
+        if self.__event_reader is not None:
+            self.__event_reader.stop()
+            self.__event_reader = None
 
     @property
     def Screens(self):
         """
-        Returns a dcitionary of all loaded screens associated with this display.
+        Returns a dcitionary of all screens associated with this display.
+        Screens of lazily loaded displays are loaded on first access.
 
         Returns
         -------
@@ -106,24 +393,53 @@ class Display(Entity):
         """
         return self.__screens
 
-    def get_info(self):
+    def get_info(self, validate=True):
         """
         Returns a dictionary containing all relevant information about this display's loaded resources.
+        Thread-safe displays return the same descriptor to all callers until the state changes,
+        so it must not be modified.
+
+        Parameters
+        ----------
+        validate : bool, optional
+            Whether the descriptors are validated (default is True)
 
         Returns
         -------
         DisplayDescriptor
             The descriptor of the display
         """
-        return DisplayDescriptor(
-            id=self._id,
-            screen_count=self.get_screen_count(),
-            screens=[screen.get_info() for screen in self.__screens.values()],
-        )
+        snapshot = self.__snapshots.get(validate)
+        if snapshot is not None and snapshot[0] == self._lock.generation:
+            return snapshot[1]
 
+        with self._lock:
+            generation = self._lock.generation
+            info = make_descriptor(
+                DisplayDescriptor,
+                validate,
+                id=self._id,
+                screen_count=self.get_screen_count(),
+                screens=[
+                    screen.get_info(validate) for screen in self.__screens.values()
+                ],
+            )
+            if generation is not None:
+                self.__snapshots[validate] = (generation, info)
+        return info
+
+    @synchronized
     def sync(self):
         """
         Flushes X queue and waits until the server has processed all
         the queued requests.
         """
         return self.__display.sync()
+
+    def close(self):
+        """
+        Stops the event reader, if it was started, and closes the connection to the X display.
+        """
+        self.stop_event_reader()
+        with self._lock:
+            self.__display.close()
@@ -0,0 +1,305 @@
+from .model_descriptors.detailed_timing import DetailedTiming
+from .model_descriptors.edid_extension import EDIDExtension
+
+EDID_BLOCK_LENGTH = 128
+
+# Offsets of the 18 byte descriptors of the base block
+BASE_DESCRIPTOR_OFFSETS = (54, 72, 90, 108)
+DESCRIPTOR_LENGTH = 18
+
+# Extension block tags
+CEA_EXTENSION_TAG = 0x02
+DISPLAYID_EXTENSION_TAG = 0x70
+
+# CEA-861 data block tags
+CEA_VIDEO_BLOCK_TAG = 2
+CEA_VENDOR_BLOCK_TAG = 3
+HDMI_OUIS = (0x000C03, 0xC45DD8)
+
+# DisplayID timing block tags, with the pixel clock unit of their descriptors in Hz
+DISPLAYID_TIMING_BLOCKS = {0x03: 10000, 0x22: 1000}
+DISPLAYID_TIMING_LENGTH = 20
+
+
+def get_blocks(raw):
+    """
+    Splits a raw EDID into its 128 byte blocks, the base block followed by the extension blocks.
+
+    Parameters
+    ----------
+    raw : bytes
+        The raw EDID
+
+    Returns
+    -------
+    list
+        The blocks of the EDID, a trailing incomplete block is dropped
+    """
+    return [
+        raw[offset : offset + EDID_BLOCK_LENGTH]
+        for offset in range(0, len(raw) - EDID_BLOCK_LENGTH + 1, EDID_BLOCK_LENGTH)
+    ]
+
+
+def make_timing(
+    dot_clock,
+    width,
+    h_blank,
+    h_sync_offset,
+    h_sync_width,
+    height,
+    v_blank,
+    v_sync_offset,
+    v_sync_width,
+    interlaced=False,
+    preferred=False,
+    width_mm=0,
+    height_mm=0,
+):
+    """
+    Creates a DetailedTiming from the active, blanking and sync sizes of a timing.
+    The vertical values of interlaced timings are given per field and converted to
+    frame values the way the X server reports modes.
+
+    Returns
+    -------
+    DetailedTiming
+        The timing
+    """
+    v_total = height + v_blank
+    v_sync_start = height + v_sync_offset
+    if interlaced:
+        height *= 2
+        v_total = v_total * 2 + 1
+        v_sync_start *= 2
+        v_sync_width *= 2
+
+    h_total = width + h_blank
+    return DetailedTiming(
+        dot_clock=dot_clock,
+        width=width,
+        h_sync_start=width + h_sync_offset,
+        h_sync_end=width + h_sync_offset + h_sync_width,
+        h_total=h_total,
+        height=height,
+        v_sync_start=v_sync_start,
+        v_sync_end=v_sync_start + v_sync_width,
+        v_total=v_total,
+        refresh_rate=dot_clock / (h_total * v_total) if h_total and v_total else 0.0,
+        interlaced=interlaced,
+        preferred=preferred,
+        width_mm=width_mm,
+        height_mm=height_mm,
+    )
+
+
+def parse_detailed_timing(data, preferred=False):
+    """
+    Decodes an 18 byte detailed timing descriptor.
+
+    Parameters
+    ----------
+    data : bytes
+        The descriptor
+    preferred : bool, optional
+        Whether the timing is the preferred one of the monitor (default is False)
+
+    Returns
+    -------
+    DetailedTiming
+        The timing or None if the descriptor is a display descriptor, e.g. the monitor name
+    """
+    dot_clock = (data[0] | data[1] << 8) * 10000
+    if not dot_clock:
+        return None
+
+    return make_timing(
+        dot_clock,
+        width=data[2] | (data[4] & 0xF0) << 4,
+        h_blank=data[3] | (data[4] & 0x0F) << 8,
+        h_sync_offset=data[8] | (data[11] & 0xC0) << 2,
+        h_sync_width=data[9] | (data[11] & 0x30) << 4,
+        height=data[5] | (data[7] & 0xF0) << 4,
+        v_blank=data[6] | (data[7] & 0x0F) << 8,
+        v_sync_offset=data[10] >> 4 | (data[11] & 0x0C) << 2,
+        v_sync_width=data[10] & 0x0F | (data[11] & 0x03) << 4,
+        interlaced=bool(data[17] & 0x80),
+        preferred=preferred,
+        width_mm=data[12] | (data[14] & 0xF0) << 4,
+        height_mm=data[13] | (data[14] & 0x0F) << 8,
+    )
+
+
+def parse_base_timings(block):
+    """
+    Decodes the detailed timings of the base block of an EDID,
+    the first one is the preferred timing of the monitor.
+
+    Parameters
+    ----------
+    block : bytes
+        The base block
+
+    Returns
+    -------
+    list
+        The detailed timings
+    """
+    timings = []
+    for offset in BASE_DESCRIPTOR_OFFSETS:
+        timing = parse_detailed_timing(
+            block[offset : offset + DESCRIPTOR_LENGTH], preferred=offset == 54
+        )
+        if timing:
+            timings.append(timing)
+    return timings
+
+
+def parse_cea_extension(block):
+    """
+    Decodes a CEA-861 extension block, which holds the video formats and the HDMI
+    support of the monitor.
+
+    Parameters
+    ----------
+    block : bytes
+        The extension block
+
+    Returns
+    -------
+    EDIDExtension
+        The decoded extension
+    """
+    timings_offset = block[2]
+    video_codes = []
+    hdmi = False
+
+    # The data block collection is located between the header and the detailed timings
+    offset = 4
+    while 4 <= offset < timings_offset:
+        tag = block[offset] >> 5
+        length = block[offset] & 0x1F
+        payload = block[offset + 1 : offset + 1 + length]
+        if tag == CEA_VIDEO_BLOCK_TAG:
+            # Codes 129 to 192 are the native codes 1 to 64
+            video_codes.extend(
+                code & 0x7F if 129 <= code <= 192 else code for code in payload
+            )
+        elif tag == CEA_VENDOR_BLOCK_TAG and length >= 3:
+            hdmi = (
+                hdmi or (payload[0] | payload[1] << 8 | payload[2] << 16) in HDMI_OUIS
+            )
+        offset += length + 1
+
+    timings = []
+    if timings_offset >= 4:
+        for offset in range(
+            timings_offset, EDID_BLOCK_LENGTH - DESCRIPTOR_LENGTH, DESCRIPTOR_LENGTH
+        ):
+            timing = parse_detailed_timing(block[offset : offset + DESCRIPTOR_LENGTH])
+            if timing is None:
+                break
+            timings.append(timing)
+
+    return EDIDExtension(
+        tag=block[0],
+        revision=block[1],
+        detailed_timings=timings,
+        video_codes=video_codes,
+        hdmi=hdmi,
+    )
+
+
+def parse_displayid_timing(data, clock_unit):
+    """
+    Decodes a 20 byte DisplayID type I or type VII timing descriptor.
+
+    Parameters
+    ----------
+    data : bytes
+        The descriptor
+    clock_unit : int
+        The unit of the pixel clock of the descriptor in Hz
+
+    Returns
+    -------
+    DetailedTiming
+        The timing
+    """
+
+    def field(offset):
+        return (data[offset] | data[offset + 1] << 8) + 1
+
+    return make_timing(
+        ((data[0] | data[1] << 8 | data[2] << 16) + 1) * clock_unit,
+        width=field(4),
+        h_blank=field(6),
+        h_sync_offset=field(8) & 0x7FFF,
+        h_sync_width=field(10),
+        height=field(12),
+        v_blank=field(14),
+        v_sync_offset=field(16) & 0x7FFF,
+        v_sync_width=field(18),
+        interlaced=bool(data[3] & 0x10),
+        preferred=bool(data[3] & 0x80),
+    )
+
+
+def parse_displayid_extension(block):
+    """
+    Decodes a DisplayID extension block, which holds the timings of monitors whose
+    native resolution exceeds the limits of the base block.
+
+    Parameters
+    ----------
+    block : bytes
+        The extension block
+
+    Returns
+    -------
+    EDIDExtension
+        The decoded extension
+    """
+    end = min(5 + block[2], EDID_BLOCK_LENGTH - 1)
+    timings = []
+
+    offset = 5
+    while offset + 3 <= end:
+        tag = block[offset]
+        length = block[offset + 2]
+        payload = block[offset + 3 : min(offset + 3 + length, end)]
+        clock_unit = DISPLAYID_TIMING_BLOCKS.get(tag)
+        if clock_unit:
+            for start in range(
+                0, len(payload) - DISPLAYID_TIMING_LENGTH + 1, DISPLAYID_TIMING_LENGTH
+            ):
+                timings.append(
+                    parse_displayid_timing(
+                        payload[start : start + DISPLAYID_TIMING_LENGTH], clock_unit
+                    )
+                )
+        offset += length + 3
+
+    return EDIDExtension(tag=block[0], revision=block[1], detailed_timings=timings)
+
+
+def parse_extension(block):
+    """
+    Decodes an extension block of an EDID. Only the timings and capabilities of
+    CEA-861 and DisplayID extensions are decoded, other extensions are only identified by their tag.
+
+    Parameters
+    ----------
+    block : bytes
+        The extension block
+
+    Returns
+    -------
+    EDIDExtension
+        The decoded extension
+    """
+    if block[0] == CEA_EXTENSION_TAG:
+        return parse_cea_extension(block)
+    if block[0] == DISPLAYID_EXTENSION_TAG:
+        return parse_displayid_extension(block)
+    return EDIDExtension(tag=block[0], revision=block[1])
@@ -1,4 +1,20 @@
+import json
 from abc import abstractmethod
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+
+
+def encode_descriptor(obj):
+    """
+    Encodes the objects the JSON encoder does not support, descriptors are only converted
+    shallowly so nested descriptors are encoded while the JSON is streamed.
+    """
+    if isinstance(obj, BaseModel):
+        return dict(obj)
+    return pydantic_encoder(obj)
+
+
+JSON_ENCODER = json.JSONEncoder(default=encode_descriptor)
 
 
 class Entity:
@@ -7,15 +23,28 @@ class Entity:
 
     Methods
     -------
-    get_info()
+    get_info(validate)
     toJSON()
+    iter_json()
+    write_json(stream)
+
+    Properties
+    ----------
+    ID()
     """
 
     def __init__(self, id):
         self._id = id
 
+    @property
+    def ID(self):
+        """
+        Returns the ID of this Entity
+        """
+        return self._id
+
     @abstractmethod
-    def get_info(self):
+    def get_info(self, validate=True):
         """
         Returns the information represented by this Entity
         """
@@ -25,5 +54,19 @@ class Entity:
         """
         Returns the information represented by this Entity in JSON format
         """
-        info = self.get_info()
-        return info.json()
+        return "".join(self.iter_json())
+
+    def iter_json(self):
+        """
+        Returns the information represented by this Entity in JSON format chunk by chunk.
+        The information comes straight from the server, so its descriptors are not validated.
+        """
+        return JSON_ENCODER.iterencode(self.get_info(validate=False))
+
+    def write_json(self, stream):
+        """
+        Writes the information represented by this Entity in JSON format to a text stream
+        without building the whole JSON string first.
+        """
+        for chunk in self.iter_json():
+            stream.write(chunk)
@@ -0,0 +1,51 @@
+from Xlib.ext import randr
+
+# The RandR notify events used to keep the loaded state in sync with the server.
+RANDR_EVENT_MASK = (
+    randr.RRScreenChangeNotifyMask
+    | randr.RRCrtcChangeNotifyMask
+    | randr.RROutputChangeNotifyMask
+    | randr.RROutputPropertyNotifyMask
+)
+
+RANDR_EVENT_TYPES = (
+    randr.ScreenChangeNotify,
+    randr.CrtcChangeNotify,
+    randr.OutputChangeNotify,
+    randr.OutputPropertyNotify,
+)
+
+
+def is_randr_event(event):
+    """
+    Checks if the given event is one of the RandR notify events.
+
+    Parameters
+    ----------
+    event : XEvent
+        The event to check
+
+    Returns
+    -------
+    bool
+        Whether the event is a RandR notify event
+    """
+    return isinstance(event, RANDR_EVENT_TYPES)
+
+
+def get_event_window_id(event):
+    """
+    Returns the ID of the root window a RandR event was reported for.
+
+    Parameters
+    ----------
+    event : XEvent
+        A RandR notify event
+
+    Returns
+    -------
+    int
+        The ID of the root window of the screen the event belongs to
+    """
+    window = event.root if isinstance(event, randr.ScreenChangeNotify) else event.window
+    return getattr(window, "id", window)
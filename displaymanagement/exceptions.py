@@ -18,3 +18,17 @@ class InvalidStateError(DisplayManagementError):
     """Thrown when a method invocation effect is not defined for the current state of the object"""
 
     pass
+
+
+class ReplayError(DisplayManagementError):
+    """Thrown when the traffic of a replayed connection does not match its recording"""
+
+    pass
+
+
+class DaemonError(DisplayManagementError):
+    """Thrown by a daemon client when the daemon failed to handle a request"""
+
+    def __init__(self, type, message):
+        super().__init__("{}: {}".format(type, message))
+        self.type = type
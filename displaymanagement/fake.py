@@ -0,0 +1,959 @@
+import socket
+import threading
+import time
+from collections import deque
+from Xlib import X
+from Xlib.ext import randr
+from Xlib.ext.randr import PROPERTY_RANDR_EDID
+from .backend import Backend
+from .edid import EDID_BLOCK_LENGTH
+from .timings import generate_timing, ModeTiming
+
+# Resolutions and refresh rates of the modes every fake server starts with
+DEFAULT_MODES = (
+    (3840, 2160, 60.0),
+    (2560, 1440, 60.0),
+    (1920, 1200, 60.0),
+    (1920, 1080, 60.0),
+    (1920, 1080, 50.0),
+    (1680, 1050, 60.0),
+    (1600, 900, 60.0),
+    (1280, 1024, 60.0),
+    (1280, 720, 60.0),
+    (1024, 768, 60.0),
+    (800, 600, 60.0),
+    (640, 480, 60.0),
+)
+
+# Outputs are laid out in rows of this many outputs by FakeServer.create
+OUTPUTS_PER_ROW = 8
+
+XA_INTEGER = 19
+RANDR_EVENT_BASE = 89
+FAKE_MANUFACTURER = "FAK"
+
+
+class FakeReply:
+    """
+    A reply of the fake server. Like python-xlib replies, its fields are accessible
+    as attributes, as items and through the _data dictionary.
+    """
+
+    def __init__(self, **data):
+        self._data = data
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["_data"][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __getitem__(self, name):
+        return self._data[name]
+
+    def __repr__(self):
+        return "FakeReply({})".format(self._data)
+
+
+class FakeRequest:
+    """
+    A deferred request of a fake display, answered together with all other queued
+    requests by the first reply() call.
+    """
+
+    def __init__(self, display, handler, fields):
+        self.__display = display
+        self.__handler = handler
+        self.__fields = fields
+        self._data = None
+
+    def answer(self):
+        self._data = self.__handler(**self.__fields)._data
+
+    def reply(self):
+        if self._data is None:
+            self.__display.round_trip()
+        return self
+
+    def __getattr__(self, name):
+        data = self.__dict__.get("_data")
+        if data is None or name not in data:
+            raise AttributeError(name)
+        return data[name]
+
+
+def make_edid(timing, width_mm, height_mm, serial, name):
+    """
+    Creates a valid 128 byte EDID 1.4 base block describing a monitor with the given preferred timing.
+
+    Parameters
+    ----------
+    timing : Timing
+        The preferred timing of the monitor
+    width_mm : int
+        The width of the monitor in mm
+    height_mm : int
+        The height of the monitor in mm
+    serial : int
+        The serial number of the monitor
+    name : str
+        The name of the monitor, at most 13 characters
+
+    Returns
+    -------
+    bytes
+        The EDID
+    """
+    edid = bytearray(EDID_BLOCK_LENGTH)
+    edid[0:8] = b"\x00\xff\xff\xff\xff\xff\xff\x00"
+    manufacturer = 0
+    for letter in FAKE_MANUFACTURER:
+        manufacturer = manufacturer << 5 | (ord(letter) - 64)
+    edid[8:10] = manufacturer.to_bytes(2, "big")
+    edid[10:12] = (1).to_bytes(2, "little")
+    edid[12:16] = serial.to_bytes(4, "little")
+    edid[16:20] = bytes((1, 30, 1, 4))
+    edid[20] = 0x80
+    edid[21] = width_mm // 10
+    edid[22] = height_mm // 10
+    edid[23] = 120
+    edid[24] = 0x0A
+    # No standard timings
+    edid[38:54] = b"\x01" * 16
+
+    h_blank = timing.h_total - timing.width
+    v_blank = timing.v_total - timing.height
+    h_sync_offset = timing.h_sync_start - timing.width
+    h_sync_width = timing.h_sync_end - timing.h_sync_start
+    v_sync_offset = timing.v_sync_start - timing.height
+    v_sync_width = timing.v_sync_end - timing.v_sync_start
+    edid[54:72] = bytes(
+        (
+            timing.dot_clock // 10000 & 0xFF,
+            timing.dot_clock // 10000 >> 8,
+            timing.width & 0xFF,
+            h_blank & 0xFF,
+            (timing.width >> 8) << 4 | h_blank >> 8,
+            timing.height & 0xFF,
+            v_blank & 0xFF,
+            (timing.height >> 8) << 4 | v_blank >> 8,
+            h_sync_offset & 0xFF,
+            h_sync_width & 0xFF,
+            (v_sync_offset & 0x0F) << 4 | v_sync_width & 0x0F,
+            (h_sync_offset >> 8) << 6
+            | (h_sync_width >> 8) << 4
+            | (v_sync_offset >> 4) << 2
+            | v_sync_width >> 4,
+            width_mm & 0xFF,
+            height_mm & 0xFF,
+            (width_mm >> 8) << 4 | height_mm >> 8,
+            0,
+            0,
+            0x1E,
+        )
+    )
+    edid[72:90] = (
+        bytes((0, 0, 0, 0xFC, 0))
+        + (name[:13] + "\n").encode("ascii").ljust(13, b" ")[:13]
+    )
+    edid[127] = -sum(edid[:127]) % 256
+    return bytes(edid)
+
+
+class FakeServer:
+    """
+    An in-memory model of an X server supporting RandR, for exercising the library
+    without an X server. Screens, outputs, CRTCs, modes, timestamps, size ranges and
+    output properties such as EDIDs are modeled, and each round trip can be delayed by
+    a configurable latency. Requests and round trips are counted.
+
+    Methods
+    -------
+    add_screen(width, height, min_width, min_height, max_width, max_height)
+    add_mode(width, height, refresh_rate, timing, name)
+    add_crtc(screen)
+    add_output(screen, name, mode_ids, num_preferred, connected, crtc, edid)
+    set_output_connection(output_id, connected)
+    intern_atom(name)
+    round_trip()
+    reset_counters()
+
+    Static Methods
+    --------------
+    create(output_count, screen_count, latency, extra_mode_count)
+    """
+
+    def __init__(self, latency=0.0):
+        """
+        Parameters
+        ----------
+        latency : float, optional
+            The duration of a round trip in seconds (default is 0).
+        """
+        self.latency = latency
+        self.lock = threading.RLock()
+        self.screens = []
+        self.modes = {}
+        self.crtcs = {}
+        self.outputs = {}
+        self.atoms = {}
+        self.requests = {}
+        self.round_trips = 0
+        self.__time = 1
+        self.__next_id = 0x40
+
+    def __allocate_id(self):
+        self.__next_id += 1
+        return self.__next_id
+
+    def tick(self):
+        """
+        Advances the server time and returns it, e.g. as the timestamp of a change.
+        """
+        self.__time += 1
+        return self.__time
+
+    def count_request(self, name):
+        """
+        Counts a request handled by the server.
+        """
+        self.requests[name] = self.requests.get(name, 0) + 1
+
+    def round_trip(self):
+        """
+        Counts a round trip and waits for the configured latency.
+        """
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def reset_counters(self):
+        """
+        Resets the request and round trip counters.
+        """
+        self.requests = {}
+        self.round_trips = 0
+
+    def intern_atom(self, name):
+        """
+        Returns the atom of the given name, creating it if needed.
+        """
+        if name not in self.atoms:
+            self.atoms[name] = len(self.atoms) + 1
+        return self.atoms[name]
+
+    def add_screen(
+        self,
+        width=1920,
+        height=1080,
+        min_width=8,
+        min_height=8,
+        max_width=16384,
+        max_height=16384,
+    ):
+        """
+        Adds a screen and returns its index.
+        """
+        self.screens.append(
+            dict(
+                root=self.__allocate_id(),
+                width=width,
+                height=height,
+                width_mm=int(width / 3.78),
+                height_mm=int(height / 3.78),
+                min_width=min_width,
+                min_height=min_height,
+                max_width=max_width,
+                max_height=max_height,
+                timestamp=self.__time,
+                config_timestamp=self.__time,
+                crtcs=[],
+                outputs=[],
+                event_mask=0,
+                displays=[],
+            )
+        )
+        return len(self.screens) - 1
+
+    def add_mode(
+        self, width, height, refresh_rate=60.0, timing=ModeTiming.CVT, name=None
+    ):
+        """
+        Adds a mode with generated timings and returns its ID.
+        """
+        generated = generate_timing(width, height, refresh_rate, timing=timing)
+        mode_id = self.__allocate_id()
+        name = name or "{}x{}_{:g}".format(width, height, refresh_rate)
+        self.modes[mode_id] = dict(
+            id=mode_id,
+            width=width,
+            height=height,
+            dot_clock=generated.dot_clock,
+            h_sync_start=generated.h_sync_start,
+            h_sync_end=generated.h_sync_end,
+            h_total=generated.h_total,
+            h_skew=0,
+            v_sync_start=generated.v_sync_start,
+            v_sync_end=generated.v_sync_end,
+            v_total=generated.v_total,
+            name_length=len(name),
+            flags=generated.flags,
+            name=name,
+        )
+        return mode_id
+
+    def add_crtc(self, screen=0):
+        """
+        Adds a disabled CRTC to a screen and returns its ID.
+        """
+        crtc_id = self.__allocate_id()
+        self.crtcs[crtc_id] = dict(
+            screen=screen,
+            timestamp=self.__time,
+            x=0,
+            y=0,
+            mode=0,
+            rotation=randr.Rotate_0,
+            outputs=[],
+        )
+        self.screens[screen]["crtcs"].append(crtc_id)
+        return crtc_id
+
+    def add_output(
+        self,
+        screen=0,
+        name=None,
+        mode_ids=(),
+        num_preferred=1,
+        connected=True,
+        crtc=0,
+        edid=None,
+    ):
+        """
+        Adds an output to a screen and returns its ID. The output can use all CRTCs of the screen.
+        """
+        output_id = self.__allocate_id()
+        self.outputs[output_id] = dict(
+            screen=screen,
+            name=name or "FAKE-{}".format(len(self.outputs) + 1),
+            timestamp=self.__time,
+            crtc=crtc,
+            connection=randr.Connected if connected else randr.Disconnected,
+            mm_width=0,
+            mm_height=0,
+            modes=list(mode_ids),
+            num_preferred=num_preferred,
+            properties={},
+        )
+        if edid is not None:
+            self.outputs[output_id]["properties"][
+                self.intern_atom(PROPERTY_RANDR_EDID)
+            ] = (XA_INTEGER, bytes(edid))
+        self.screens[screen]["outputs"].append(output_id)
+        return output_id
+
+    def set_output_connection(self, output_id, connected):
+        """
+        Plugs a monitor in or out of an output, e.g. for exercising hotplug handling.
+        """
+        with self.lock:
+            output = self.outputs[output_id]
+            output["connection"] = randr.Connected if connected else randr.Disconnected
+            screen = self.screens[output["screen"]]
+            screen["config_timestamp"] = self.tick()
+            self.notify_output_change(output_id)
+
+    def queue_event(self, screen, mask, event):
+        """
+        Queues an event for all displays which selected the given event mask on the root of the screen.
+        """
+        if screen["event_mask"] & mask:
+            for display in screen["displays"]:
+                display.queue_event(event)
+
+    def notify_crtc_change(self, crtc_id):
+        """
+        Queues a CRTC change event for a CRTC.
+        """
+        crtc = self.crtcs[crtc_id]
+        mode = self.modes.get(crtc["mode"])
+        screen = self.screens[crtc["screen"]]
+        self.queue_event(
+            screen,
+            randr.RRCrtcChangeNotifyMask,
+            randr.CrtcChangeNotify(
+                type=RANDR_EVENT_BASE + randr.RRNotify,
+                sub_code=randr.RRNotify_CrtcChange,
+                sequence_number=0,
+                timestamp=crtc["timestamp"],
+                window=screen["root"],
+                crtc=crtc_id,
+                mode=crtc["mode"],
+                rotation=crtc["rotation"],
+                x=crtc["x"],
+                y=crtc["y"],
+                width=mode["width"] if mode else 0,
+                height=mode["height"] if mode else 0,
+            ),
+        )
+
+    def notify_output_change(self, output_id):
+        """
+        Queues an output change event for an output.
+        """
+        output = self.outputs[output_id]
+        crtc = self.crtcs.get(output["crtc"])
+        screen = self.screens[output["screen"]]
+        self.queue_event(
+            screen,
+            randr.RROutputChangeNotifyMask,
+            randr.OutputChangeNotify(
+                type=RANDR_EVENT_BASE + randr.RRNotify,
+                sub_code=randr.RRNotify_OutputChange,
+                sequence_number=0,
+                timestamp=output["timestamp"],
+                config_timestamp=screen["config_timestamp"],
+                window=screen["root"],
+                output=output_id,
+                crtc=output["crtc"],
+                mode=crtc["mode"] if crtc else 0,
+                rotation=crtc["rotation"] if crtc else randr.Rotate_0,
+                connection=output["connection"],
+                subpixel_order=0,
+            ),
+        )
+
+    def notify_screen_change(self, screen_index):
+        """
+        Queues a screen change event for a screen.
+        """
+        screen = self.screens[screen_index]
+        self.queue_event(
+            screen,
+            randr.RRScreenChangeNotifyMask,
+            randr.ScreenChangeNotify(
+                type=RANDR_EVENT_BASE + randr.RRScreenChangeNotify,
+                rotation=randr.Rotate_0,
+                sequence_number=0,
+                timestamp=screen["timestamp"],
+                config_timestamp=screen["config_timestamp"],
+                root=screen["root"],
+                window=screen["root"],
+                size_id=0,
+                subpixel_order=0,
+                width_in_pixels=screen["width"],
+                height_in_pixels=screen["height"],
+                width_in_millimeters=screen["width_mm"],
+                height_in_millimeters=screen["height_mm"],
+            ),
+        )
+
+    @staticmethod
+    def create(output_count=4, screen_count=1, latency=0.0, extra_mode_count=0):
+        """
+        Creates a fake server where every screen has the given number of connected
+        outputs, each driven by its own CRTC, showing the preferred mode of its monitor
+        and laid out in rows of OUTPUTS_PER_ROW outputs.
+
+        Parameters
+        ----------
+        output_count : int, optional
+            The number of outputs of each screen (default is 4).
+        screen_count : int, optional
+            The number of screens (default is 1).
+        latency : float, optional
+            The duration of a round trip in seconds (default is 0).
+        extra_mode_count : int, optional
+            The number of additional modes available to all outputs, to simulate
+            drivers reporting many modes (default is 0).
+
+        Returns
+        -------
+        FakeServer
+            The fake server
+        """
+        server = FakeServer(latency)
+        mode_ids = [
+            server.add_mode(width, height, refresh_rate)
+            for width, height, refresh_rate in DEFAULT_MODES
+        ]
+        for index in range(extra_mode_count):
+            mode_ids.append(server.add_mode(640 + 8 * index, 480, 60.0))
+
+        # Outputs prefer 1920x1080 at 60Hz
+        preferred_mode_id = mode_ids[3]
+        preferred_mode = server.modes[preferred_mode_id]
+        mode_ids.insert(0, mode_ids.pop(3))
+        timing = generate_timing(1920, 1080, 60.0)
+
+        for screen_index in range(screen_count):
+            columns = min(output_count, OUTPUTS_PER_ROW)
+            rows = -(-output_count // OUTPUTS_PER_ROW)
+            screen = server.add_screen(
+                preferred_mode["width"] * max(columns, 1),
+                preferred_mode["height"] * max(rows, 1),
+            )
+            for index in range(output_count):
+                crtc_id = server.add_crtc(screen)
+                output_id = server.add_output(
+                    screen,
+                    mode_ids=mode_ids,
+                    crtc=crtc_id,
+                    edid=make_edid(
+                        timing, 510, 290, len(server.outputs) + 1, "Fake Monitor"
+                    ),
+                )
+                server.outputs[output_id]["mm_width"] = 510
+                server.outputs[output_id]["mm_height"] = 290
+                server.crtcs[crtc_id].update(
+                    x=preferred_mode["width"] * (index % OUTPUTS_PER_ROW),
+                    y=preferred_mode["height"] * (index // OUTPUTS_PER_ROW),
+                    mode=preferred_mode_id,
+                    outputs=[output_id],
+                )
+        return server
+
+
+class FakeScreen:
+    """
+    A screen of a fake display, mirroring the python-xlib screen structure.
+    """
+
+    def __init__(self, display, server, index):
+        self.__server = server
+        self.__index = index
+        self.root = FakeRoot(display, server, index)
+
+    @property
+    def width_in_pixels(self):
+        return self.__server.screens[self.__index]["width"]
+
+    @property
+    def height_in_pixels(self):
+        return self.__server.screens[self.__index]["height"]
+
+    @property
+    def width_in_mms(self):
+        return self.__server.screens[self.__index]["width_mm"]
+
+    @property
+    def height_in_mms(self):
+        return self.__server.screens[self.__index]["height_mm"]
+
+
+class FakeRoot:
+    """
+    The root window of a fake screen, implementing the RandR window requests used by the library.
+    """
+
+    def __init__(self, display, server, index):
+        self.__display = display
+        self.__server = server
+        self.__index = index
+        self.id = server.screens[index]["root"]
+
+    def __screen(self):
+        return self.__server.screens[self.__index]
+
+    def xrandr_select_input(self, mask):
+        self.__server.count_request("SelectInput")
+        with self.__server.lock:
+            screen = self.__screen()
+            screen["event_mask"] = mask
+            if self.__display not in screen["displays"]:
+                screen["displays"].append(self.__display)
+
+    def xrandr_get_screen_resources(self):
+        # Probing the outputs is as fast as reading the current resources on the fake server
+        self.__server.count_request("GetScreenResources")
+        self.__display.round_trip()
+        return self.get_resources()
+
+    def xrandr_get_screen_resources_current(self):
+        self.__server.count_request("GetScreenResourcesCurrent")
+        self.__display.round_trip()
+        return self.get_resources()
+
+    def get_resources(self):
+        """
+        Returns the screen resources reply without counting a request.
+        """
+        with self.__server.lock:
+            screen = self.__screen()
+            modes = list(self.__server.modes.values())
+            return FakeReply(
+                timestamp=screen["timestamp"],
+                config_timestamp=screen["config_timestamp"],
+                crtcs=list(screen["crtcs"]),
+                outputs=list(screen["outputs"]),
+                modes=[
+                    FakeReply(**{key: mode[key] for key in mode if key != "name"})
+                    for mode in modes
+                ],
+                mode_names="".join(mode["name"] for mode in modes),
+            )
+
+    def xrandr_get_screen_size_range(self):
+        self.__server.count_request("GetScreenSizeRange")
+        self.__display.round_trip()
+        return self.get_size_range()
+
+    def get_size_range(self):
+        """
+        Returns the screen size range reply without counting a request.
+        """
+        screen = self.__screen()
+        return FakeReply(
+            min_width=screen["min_width"],
+            min_height=screen["min_height"],
+            max_width=screen["max_width"],
+            max_height=screen["max_height"],
+        )
+
+    def xrandr_get_screen_info(self):
+        self.__server.count_request("GetScreenInfo")
+        self.__display.round_trip()
+        screen = self.__screen()
+        return FakeReply(
+            set_of_rotations=randr.Rotate_0,
+            root=self.id,
+            timestamp=screen["timestamp"],
+            config_timestamp=screen["config_timestamp"],
+            size_id=0,
+            rotation=randr.Rotate_0,
+            rate=60,
+            sizes=[
+                FakeReply(
+                    width_in_pixels=screen["width"],
+                    height_in_pixels=screen["height"],
+                    width_in_millimeters=screen["width_mm"],
+                    height_in_millimeters=screen["height_mm"],
+                )
+            ],
+            rates=[],
+        )
+
+    def xrandr_set_screen_size(
+        self, width, height, width_in_millimeters, height_in_millimeters
+    ):
+        self.__server.count_request("SetScreenSize")
+        with self.__server.lock:
+            screen = self.__screen()
+            screen.update(
+                width=width,
+                height=height,
+                width_mm=width_in_millimeters,
+                height_mm=height_in_millimeters,
+                timestamp=self.__server.tick(),
+            )
+            self.__server.notify_screen_change(self.__index)
+
+    def xrandr_create_mode(self, mode, name):
+        self.__server.count_request("CreateMode")
+        self.__display.round_trip()
+        return self.create_mode(mode, name)
+
+    def create_mode(self, mode, name):
+        """
+        Creates a mode and returns the reply without counting a request.
+        """
+        with self.__server.lock:
+            mode_id = self.__server.add_mode(mode["width"], mode["height"], name=name)
+            self.__server.modes[mode_id].update(
+                {
+                    key: mode[key]
+                    for key in mode
+                    if key not in ("id", "name", "name_length")
+                }
+            )
+        return FakeReply(mode=mode_id)
+
+
+class FakeDisplay:
+    """
+    A display connected to a fake server, implementing the python-xlib display methods
+    and RandR extension methods used by the library.
+    """
+
+    def __init__(self, server):
+        self.__server = server
+        self.__atoms = {}
+        self.__events = deque()
+        self.__event_arrived = threading.Condition()
+        # Becomes readable while events are pending, for event loops waiting on fileno()
+        self.__wake_reader, self.__wake_writer = socket.socketpair()
+        self.__wake_reader.setblocking(False)
+        self.__wake_writer.setblocking(False)
+        self.__deferred = []
+        self.__screens = [
+            FakeScreen(self, server, index) for index in range(len(server.screens))
+        ]
+
+    def round_trip(self):
+        """
+        Waits for the server once, answering all deferred requests.
+        """
+        self.__server.round_trip()
+        deferred, self.__deferred = self.__deferred, []
+        for request in deferred:
+            request.answer()
+
+    def defer_request(self, request, **fields):
+        """
+        Queues a request whose reply is collected later, see pipeline.send_request.
+        """
+        handlers = {
+            randr.GetOutputInfo: self.__get_output_info,
+            randr.GetCrtcInfo: self.__get_crtc_info,
+            randr.SetCrtcConfig: self.__set_crtc_config,
+            randr.GetOutputProperty: self.__get_output_property,
+            randr.GetScreenResources: lambda window: window.get_resources(),
+            randr.GetScreenResourcesCurrent: lambda window: window.get_resources(),
+            randr.GetScreenSizeRange: lambda window: window.get_size_range(),
+            randr.CreateMode: lambda window, mode, name: window.create_mode(mode, name),
+        }
+        self.__server.count_request(request.__name__)
+        deferred = FakeRequest(self, handlers[request], fields)
+        self.__deferred.append(deferred)
+        return deferred
+
+    def queue_event(self, event):
+        with self.__event_arrived:
+            self.__events.append(event)
+            self.__event_arrived.notify_all()
+        try:
+            self.__wake_writer.send(b"\0")
+        except BlockingIOError:
+            # The reader is readable already
+            pass
+
+    def wait_for_events(self, timeout):
+        """
+        Waits until an event is pending or the timeout in seconds passed, see threads.wait_for_events.
+        """
+        with self.__event_arrived:
+            return self.__event_arrived.wait_for(lambda: self.__events, timeout)
+
+    def screen_count(self):
+        return len(self.__screens)
+
+    def screen(self, screen_number=None):
+        return self.__screens[screen_number or 0]
+
+    def get_atom(self, name, only_if_exists=False):
+        if name not in self.__atoms:
+            self.__server.count_request("InternAtom")
+            self.round_trip()
+            self.__atoms[name] = self.__server.intern_atom(name)
+        return self.__atoms[name]
+
+    def flush(self):
+        pass
+
+    def sync(self):
+        self.__server.count_request("GetInputFocus")
+        self.round_trip()
+
+    def grab_server(self):
+        self.__server.count_request("GrabServer")
+
+    def ungrab_server(self):
+        self.__server.count_request("UngrabServer")
+
+    def pending_events(self):
+        try:
+            while self.__wake_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        return len(self.__events)
+
+    def fileno(self):
+        return self.__wake_reader.fileno()
+
+    def next_event(self):
+        if not self.__events:
+            raise RuntimeError("A fake display can not wait for events")
+        return self.__events.popleft()
+
+    def close(self):
+        self.__wake_reader.close()
+        self.__wake_writer.close()
+
+    def xrandr_get_output_info(self, output, config_timestamp):
+        self.__server.count_request("GetOutputInfo")
+        self.round_trip()
+        return self.__get_output_info(output, config_timestamp)
+
+    def __get_output_info(self, output, config_timestamp):
+        with self.__server.lock:
+            data = self.__server.outputs[output]
+            screen = self.__server.screens[data["screen"]]
+            return FakeReply(
+                status=randr.SetConfigSuccess,
+                timestamp=data["timestamp"],
+                crtc=data["crtc"],
+                mm_width=data["mm_width"],
+                mm_height=data["mm_height"],
+                connection=data["connection"],
+                subpixel_order=0,
+                num_preferred=data["num_preferred"],
+                crtcs=list(screen["crtcs"]),
+                modes=list(data["modes"]),
+                clones=[],
+                name=data["name"],
+            )
+
+    def xrandr_get_crtc_info(self, crtc, config_timestamp):
+        self.__server.count_request("GetCrtcInfo")
+        self.round_trip()
+        return self.__get_crtc_info(crtc, config_timestamp)
+
+    def __get_crtc_info(self, crtc, config_timestamp):
+        with self.__server.lock:
+            data = self.__server.crtcs[crtc]
+            mode = self.__server.modes.get(data["mode"])
+            screen = self.__server.screens[data["screen"]]
+            return FakeReply(
+                status=randr.SetConfigSuccess,
+                timestamp=data["timestamp"],
+                x=data["x"],
+                y=data["y"],
+                width=mode["width"] if mode else 0,
+                height=mode["height"] if mode else 0,
+                mode=data["mode"],
+                rotation=data["rotation"],
+                possible_rotations=randr.Rotate_0
+                | randr.Rotate_90
+                | randr.Rotate_180
+                | randr.Rotate_270,
+                outputs=list(data["outputs"]),
+                possible_outputs=list(screen["outputs"]),
+            )
+
+    def xrandr_set_crtc_config(
+        self,
+        crtc,
+        config_timestamp,
+        x,
+        y,
+        mode,
+        rotation,
+        outputs,
+        timestamp=X.CurrentTime,
+    ):
+        self.__server.count_request("SetCrtcConfig")
+        self.round_trip()
+        return self.__set_crtc_config(
+            crtc, config_timestamp, x, y, mode, rotation, outputs, timestamp
+        )
+
+    def __set_crtc_config(
+        self,
+        crtc,
+        config_timestamp,
+        x,
+        y,
+        mode,
+        rotation,
+        outputs,
+        timestamp=X.CurrentTime,
+    ):
+        with self.__server.lock:
+            data = self.__server.crtcs[crtc]
+            screen = self.__server.screens[data["screen"]]
+            if config_timestamp != screen["config_timestamp"]:
+                return FakeReply(
+                    status=randr.SetConfigInvalidConfigTime,
+                    new_timestamp=data["timestamp"],
+                )
+
+            for output_id in set(data["outputs"]) - set(outputs):
+                self.__server.outputs[output_id]["crtc"] = 0
+            for output_id in outputs:
+                self.__server.outputs[output_id]["crtc"] = crtc
+
+            data.update(
+                x=x,
+                y=y,
+                mode=mode,
+                rotation=rotation,
+                outputs=list(outputs),
+                timestamp=self.__server.tick(),
+            )
+            # The screen reports the time of the last configuration change as well
+            screen["timestamp"] = data["timestamp"]
+            self.__server.notify_crtc_change(crtc)
+            for output_id in outputs:
+                self.__server.notify_output_change(output_id)
+            return FakeReply(
+                status=randr.SetConfigSuccess, new_timestamp=data["timestamp"]
+            )
+
+    def xrandr_add_output_mode(self, output, mode):
+        self.__server.count_request("AddOutputMode")
+        with self.__server.lock:
+            modes = self.__server.outputs[output]["modes"]
+            if mode not in modes:
+                modes.append(mode)
+
+    def xrandr_get_output_property(
+        self,
+        output,
+        property,
+        type,
+        long_offset,
+        long_length,
+        delete=False,
+        pending=False,
+    ):
+        self.__server.count_request("GetOutputProperty")
+        self.round_trip()
+        return self.__get_output_property(output, property, long_offset, long_length)
+
+    def __get_output_property(
+        self,
+        output,
+        property,
+        long_offset,
+        long_length,
+        type=None,
+        delete=False,
+        pending=False,
+    ):
+        with self.__server.lock:
+            value = self.__server.outputs[output]["properties"].get(property)
+            if value is None:
+                return FakeReply(format=0, property_type=0, bytes_after=0, value=[])
+
+            property_type, data = value
+            start = long_offset * 4
+            chunk = data[start : start + long_length * 4]
+            return FakeReply(
+                format=8,
+                property_type=property_type,
+                bytes_after=max(len(data) - start - len(chunk), 0),
+                value=list(chunk),
+            )
+
+
+class FakeBackend(Backend):
+    """
+    Opens displays connected to a fake server.
+
+    Methods
+    -------
+    open_display(name)
+    """
+
+    def __init__(self, server):
+        """
+        Parameters
+        ----------
+        server : FakeServer
+            The fake server the opened displays are connected to
+        """
+        self.__server = server
+
+    def open_display(self, name):
+        return FakeDisplay(self.__server)
@@ -0,0 +1,311 @@
+import sys
+import threading
+import time
+from bisect import bisect_left
+from Xlib.display import Display as XDisplay
+from Xlib.protocol import rq
+from .exceptions import ResourceError
+
+# Upper bounds of the latency histogram buckets in seconds
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+# Method label of requests which are not sent by a public method of the library
+OTHER_METHOD = "other"
+
+PUBLIC_METHOD_CODES = None
+
+
+def get_public_method_codes():
+    """
+    Returns the code objects of the public methods of Display, Screen and Output
+    mapped to their qualified names, e.g. "Screen.set_crtc_config".
+    """
+    global PUBLIC_METHOD_CODES
+    if PUBLIC_METHOD_CODES is None:
+        from .display import Display
+        from .screen import Screen
+        from .output import Output
+
+        PUBLIC_METHOD_CODES = {}
+        for cls in (Display, Screen, Output):
+            for name, attribute in vars(cls).items():
+                if name.startswith("_"):
+                    continue
+                if isinstance(attribute, (staticmethod, classmethod)):
+                    attribute = attribute.__func__
+                elif isinstance(attribute, property):
+                    attribute = attribute.fget
+                # Methods synchronized for thread-safe displays are wrapped
+                attribute = getattr(attribute, "__wrapped__", attribute)
+                code = getattr(attribute, "__code__", None)
+                if code is not None:
+                    PUBLIC_METHOD_CODES[code] = "{}.{}".format(cls.__name__, name)
+    return PUBLIC_METHOD_CODES
+
+
+def get_calling_method():
+    """
+    Returns the name of the outermost public library method on the call stack,
+    i.e. the method called by the user which caused the current request.
+    """
+    codes = get_public_method_codes()
+    method = OTHER_METHOD
+    frame = sys._getframe(2)
+    while frame is not None:
+        method = codes.get(frame.f_code, method)
+        frame = frame.f_back
+    return method
+
+
+class RequestStats:
+    """
+    Statistics of the requests of one type sent by one library method.
+
+    Properties
+    ----------
+    requests
+    round_trips
+    latency_buckets
+    latency_sum
+    latency_count
+    """
+
+    __slots__ = (
+        "requests",
+        "round_trips",
+        "latency_buckets",
+        "latency_sum",
+        "latency_count",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.round_trips = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latency_count = 0
+
+    def observe_latency(self, latency):
+        """
+        Adds a reply latency in seconds to the histogram.
+        """
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_sum += latency
+        self.latency_count += 1
+
+
+class Instrumentation:
+    """
+    Counts the requests and blocking round trips sent through X displays and records
+    the latency of their replies, per request type and per public library method
+    causing them. Pass it to Display to instrument the display and all its screens and outputs.
+
+    Latencies are measured from sending a request until the library waits for its reply
+    and received it, requests are attributed to the outermost public method of Display,
+    Screen or Output on the call stack.
+
+    Methods
+    -------
+    attach(display)
+    detach(display)
+    get_stats()
+    get_counts(method)
+    reset()
+    to_openmetrics()
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__stats = {}
+        self.__pending = {}
+
+    def __get_entry(self, method, request_name):
+        key = (method, request_name)
+        entry = self.__stats.get(key)
+        if entry is None:
+            entry = self.__stats[key] = RequestStats()
+        return entry
+
+    def attach(self, display):
+        """
+        Instruments an X display, the requests sent through it are recorded from now on.
+
+        Parameters
+        ----------
+        display : XDisplay
+            The X display to instrument
+
+        Throws
+        ------
+        ResourceError
+            If the display was not opened through python-xlib, fake displays count
+            their requests on the fake server instead.
+        """
+        if not isinstance(display, XDisplay):
+            raise ResourceError("Only python-xlib displays can be instrumented.")
+
+        connection = display.display
+        pending = self.__pending.setdefault(id(connection), [])
+        send_request = connection.send_request
+        send_and_recv = connection.send_and_recv
+
+        def instrumented_send_request(request, wait_for_response):
+            method = get_calling_method()
+            request_name = type(request).__name__
+            with self.__lock:
+                self.__get_entry(method, request_name).requests += 1
+                if isinstance(request, rq.ReplyRequest):
+                    pending.append((request, method, request_name, time.perf_counter()))
+            return send_request(request, wait_for_response)
+
+        def instrumented_send_and_recv(
+            flush=False, event=False, request=None, recv=False
+        ):
+            result = send_and_recv(flush=flush, event=event, request=request, recv=recv)
+            if request is None:
+                return result
+
+            # Replies arrive in order, the ones received while waiting are recorded now
+            now = time.perf_counter()
+            with self.__lock:
+                while pending and (
+                    pending[0][0]._data is not None or pending[0][0]._error is not None
+                ):
+                    sent, method, request_name, sent_at = pending.pop(0)
+                    entry = self.__get_entry(method, request_name)
+                    entry.observe_latency(now - sent_at)
+                    if sent._serial == request:
+                        entry.round_trips += 1
+            return result
+
+        connection.send_request = instrumented_send_request
+        connection.send_and_recv = instrumented_send_and_recv
+
+    def detach(self, display):
+        """
+        Stops instrumenting an X display.
+
+        Parameters
+        ----------
+        display : XDisplay
+            The instrumented X display
+        """
+        connection = display.display
+        connection.__dict__.pop("send_request", None)
+        connection.__dict__.pop("send_and_recv", None)
+        self.__pending.pop(id(connection), None)
+
+    def get_stats(self):
+        """
+        Returns the recorded statistics.
+
+        Returns
+        -------
+        dict
+            The RequestStats indexed by (method, request name) tuples
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def get_counts(self, method=None):
+        """
+        Returns the number of requests per request type.
+
+        Parameters
+        ----------
+        method : str, optional
+            Only count requests caused by the given public method, e.g. "Screen.set_crtc_config"
+            (default is None, all requests are counted).
+
+        Returns
+        -------
+        dict
+            The number of requests indexed by request names, e.g. "GetCrtcInfo"
+        """
+        counts = {}
+        for (request_method, request_name), stats in self.get_stats().items():
+            if method is None or request_method == method:
+                counts[request_name] = counts.get(request_name, 0) + stats.requests
+        return counts
+
+    def reset(self):
+        """
+        Drops all recorded statistics.
+        """
+        with self.__lock:
+            self.__stats.clear()
+
+    def to_openmetrics(self):
+        """
+        Returns the recorded statistics in the OpenMetrics text format.
+
+        Returns
+        -------
+        str
+            The metrics text
+        """
+        stats = sorted(self.get_stats().items())
+        lines = [
+            "# TYPE displaymanagement_requests counter",
+            "# HELP displaymanagement_requests X requests sent.",
+        ]
+        for (method, request_name), entry in stats:
+            lines.append(
+                'displaymanagement_requests_total{{method="{}",request="{}"}} {}'.format(
+                    method, request_name, entry.requests
+                )
+            )
+
+        lines += [
+            "# TYPE displaymanagement_round_trips counter",
+            "# HELP displaymanagement_round_trips Blocking waits for replies.",
+        ]
+        for (method, request_name), entry in stats:
+            lines.append(
+                'displaymanagement_round_trips_total{{method="{}",request="{}"}} {}'.format(
+                    method, request_name, entry.round_trips
+                )
+            )
+
+        lines += [
+            "# TYPE displaymanagement_reply_latency_seconds histogram",
+            "# HELP displaymanagement_reply_latency_seconds Latency of replies.",
+        ]
+        for (method, request_name), entry in stats:
+            if not entry.latency_count:
+                continue
+            labels = 'method="{}",request="{}"'.format(method, request_name)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), entry.latency_buckets):
+                cumulative += count
+                lines.append(
+                    'displaymanagement_reply_latency_seconds_bucket{{{},le="{}"}} {}'.format(
+                        labels, bound, cumulative
+                    )
+                )
+            lines.append(
+                "displaymanagement_reply_latency_seconds_sum{{{}}} {}".format(
+                    labels, entry.latency_sum
+                )
+            )
+            lines.append(
+                "displaymanagement_reply_latency_seconds_count{{{}}} {}".format(
+                    labels, entry.latency_count
+                )
+            )
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
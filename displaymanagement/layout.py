@@ -0,0 +1,88 @@
+from collections import namedtuple
+from .utils import output_extent
+
+# Operations of a layout plan, to be executed in order
+DisableOutput = namedtuple("DisableOutput", ["output"])
+SetScreenSize = namedtuple("SetScreenSize", ["width", "height"])
+SetOutputConfig = namedtuple("SetOutputConfig", ["output", "config"])
+
+
+def config_extent(config, modes):
+    """
+    Size (max x, y) requirements of an output with the given config or None if it is disabled.
+
+    Parameters
+    ----------
+    config : CRTCConfig
+        The complete crtc config of the output
+    modes : dict
+        A dictionary of the modes of the screen indexed by their IDs
+    """
+    if not config.mode or config.mode not in modes:
+        return None
+
+    mode = modes[config.mode]
+    return output_extent(
+        config.x or 0, config.y or 0, mode["width"], mode["height"], config.rotation
+    )
+
+
+def plan_layout(outputs, configs, modes, size, size_range):
+    """
+    Computes the ordered list of operations that changes the current layout of a screen
+    into the desired one. Outputs whose mode, position and rotation do not change are not touched.
+
+    Parameters
+    ----------
+    outputs : list
+        All outputs of the screen
+    configs : dict
+        The desired complete crtc configs indexed by the outputs to apply them to,
+        outputs that are not part of it keep their current config
+    modes : dict
+        A dictionary of the modes of the screen indexed by their IDs
+    size : ScreenSize
+        The current size of the screen
+    size_range : ScreenSizeRange
+        The size range allowed for the screen
+
+    Returns
+    -------
+    list
+        The operations(DisableOutput, SetScreenSize and SetOutputConfig) to execute in order
+    """
+    changes = {}
+    for output, config in configs.items():
+        current = output.CRTC_Config
+        if config != current and (config.mode or current.mode):
+            changes[output] = config
+
+    width = 0
+    height = 0
+    for output in outputs:
+        extent = config_extent(changes.get(output, output.CRTC_Config), modes)
+        if extent:
+            width = max(width, extent.x)
+            height = max(height, extent.y)
+
+    width = min(max(width, size_range.min_width), size_range.max_width)
+    height = min(max(height, size_range.min_height), size_range.max_height)
+
+    plan = []
+    for output in outputs:
+        extent = config_extent(output.CRTC_Config, modes)
+        if not extent:
+            continue
+
+        disabled = output in changes and not changes[output].mode
+        if disabled or extent.x > width or extent.y > height:
+            plan.append(DisableOutput(output))
+
+    if width != size.width or height != size.height:
+        plan.append(SetScreenSize(width, height))
+
+    for output, config in changes.items():
+        if config.mode:
+            plan.append(SetOutputConfig(output, config))
+
+    return plan
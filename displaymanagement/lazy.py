@@ -0,0 +1,82 @@
+from collections.abc import MutableMapping
+
+
+class LazyDict(MutableMapping):
+    """
+    A dictionary whose keys are known up front while its values are loaded on
+    first access and cached afterwards.
+
+    Methods
+    -------
+    is_loaded(key)
+    loaded_values()
+    loaded_items()
+    unload(key)
+    """
+
+    def __init__(self, keys=(), loader=None):
+        """
+        Parameters
+        ----------
+        keys : iterable, optional
+            The keys of the dictionary (default is empty)
+        loader : callable, optional
+            Called with a key to load its value (default is None, values have to be set)
+        """
+        self.__keys = dict.fromkeys(keys)
+        self.__values = {}
+        self.__loader = loader
+
+    def __getitem__(self, key):
+        if key not in self.__values:
+            if key not in self.__keys or self.__loader is None:
+                raise KeyError(key)
+            self.__values[key] = self.__loader(key)
+        return self.__values[key]
+
+    def __setitem__(self, key, value):
+        self.__keys[key] = None
+        self.__values[key] = value
+
+    def __delitem__(self, key):
+        del self.__keys[key]
+        self.__values.pop(key, None)
+
+    def __contains__(self, key):
+        # Checking for a key must not load its value
+        return key in self.__keys
+
+    def __iter__(self):
+        return iter(self.__keys)
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def __repr__(self):
+        return "LazyDict({} keys, {} loaded)".format(
+            len(self.__keys), len(self.__values)
+        )
+
+    def is_loaded(self, key):
+        """
+        Checks if the value of a key was loaded.
+        """
+        return key in self.__values
+
+    def loaded_values(self):
+        """
+        Returns the values loaded so far without loading the remaining ones.
+        """
+        return list(self.__values.values())
+
+    def loaded_items(self):
+        """
+        Returns the (key, value) pairs loaded so far without loading the remaining ones.
+        """
+        return list(self.__values.items())
+
+    def unload(self, key):
+        """
+        Drops the loaded value of a key, it is loaded again on next access.
+        """
+        self.__values.pop(key, None)
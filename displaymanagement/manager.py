@@ -0,0 +1,246 @@
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from .display import Display
+from .exceptions import ResourceError
+
+# The outcome of an operation on one display, error is None if it succeeded
+DisplayResult = namedtuple("DisplayResult", ["value", "error"])
+
+
+class DisplayManager:
+    """
+    Keeps a pool of connections to multiple X displays, e.g. the X servers ":0", ":1", ...
+    of one machine, and runs operations on all of them in parallel.
+    The displays are thread-safe and stay open until they are closed, so operations reuse
+    their loaded state instead of connecting again. Every operation reports a DisplayResult
+    per display, an error of one display does not affect the others.
+
+    Methods
+    -------
+    open(display_ids)
+    get(display_id)
+    map(operation, display_ids)
+    apply_layout(layout, screen_identifier, display_ids)
+    get_info(validate, display_ids)
+    reload(display_ids)
+    close(display_ids)
+
+    Properties
+    ----------
+    Display_IDs()
+    Displays()
+    """
+
+    def __init__(
+        self,
+        display_ids=(),
+        probe=False,
+        lazy=False,
+        backend=None,
+        max_workers=None,
+    ):
+        """
+        Parameters
+        ----------
+        display_ids : list, optional
+            The ids of the displays to manage, e.g. [":0", ":1"] (default is none, displays
+            are added by open() or get()).
+        probe : bool, optional
+            Whether the server should probe all outputs for changes while loading the screens
+            (default is False).
+        lazy : bool, optional
+            Whether the displays are loaded lazily, see Display (default is False).
+        backend : Backend, optional
+            The backend opening the X displays (default is None, python-xlib is used).
+        max_workers : int, optional
+            The maximum number of displays talked to at the same time
+            (default is None, one per display up to 32).
+        """
+        self.__display_ids = list(display_ids)
+        self.__probe = probe
+        self.__lazy = lazy
+        self.__backend = backend
+        self.__max_workers = max_workers
+        self.__displays = {}
+        self.__lock = threading.Lock()
+
+    def open(self, display_ids=None):
+        """
+        Opens the connections to the given displays in parallel and loads them.
+        Displays which are open already are kept.
+
+        Parameters
+        ----------
+        display_ids : list, optional
+            The ids of the displays to open (default is None, all managed displays).
+
+        Returns
+        -------
+        dict
+            The DisplayResults indexed by display ids, holding the opened Displays
+        """
+        return self.map(lambda display: display, display_ids)
+
+    def get(self, display_id):
+        """
+        Returns the open Display with the given id, connecting to it if needed.
+
+        Throws
+        ------
+        Exception
+            Any error raised while connecting to or loading the display
+        """
+        with self.__lock:
+            if display_id not in self.__display_ids:
+                self.__display_ids.append(display_id)
+            display = self.__displays.get(display_id)
+        if display is not None:
+            return display
+
+        display = Display(
+            display_id,
+            probe=self.__probe,
+            lazy=self.__lazy,
+            backend=self.__backend,
+            thread_safe=True,
+        )
+        with self.__lock:
+            # Another thread might have connected in the meantime
+            opened = self.__displays.setdefault(display_id, display)
+        if opened is not display:
+            display.close()
+        return opened
+
+    def map(self, operation, display_ids=None):
+        """
+        Runs an operation on multiple displays in parallel, connecting to them first if needed.
+
+        Parameters
+        ----------
+        operation : callable
+            The operation, called with the Display and returning the result for it
+        display_ids : list, optional
+            The ids of the displays to run the operation on (default is None, all managed displays).
+
+        Returns
+        -------
+        dict
+            The DisplayResults indexed by display ids
+        """
+        display_ids = list(self.__display_ids if display_ids is None else display_ids)
+        if not display_ids:
+            return {}
+
+        def run(display_id):
+            try:
+                return DisplayResult(operation(self.get(display_id)), None)
+            except Exception as error:
+                return DisplayResult(None, error)
+
+        if len(display_ids) == 1:
+            return {display_ids[0]: run(display_ids[0])}
+
+        with ThreadPoolExecutor(
+            max_workers=self.__max_workers or min(len(display_ids), 32),
+            thread_name_prefix="displaymanagement-manager",
+        ) as executor:
+            return dict(zip(display_ids, executor.map(run, display_ids)))
+
+    def apply_layout(self, layout, screen_identifier=0, display_ids=None):
+        """
+        Applies the same layout to a screen of multiple displays in parallel,
+        see Screen.apply_layout().
+
+        Parameters
+        ----------
+        layout : dict
+            A dictionary of CRTCConfigs indexed by output names, e.g. "HDMI-1".
+            The modes have to exist on all displays, outputs missing on a display are an error.
+        screen_identifier : int, optional
+            The screen of the displays to apply the layout to (default is 0)
+        display_ids : list, optional
+            The ids of the displays to change (default is None, all managed displays).
+
+        Returns
+        -------
+        dict
+            The DisplayResults indexed by display ids
+        """
+
+        def apply(display):
+            screen = display.Screens[screen_identifier]
+            outputs = {output.Name: output for output in screen.Outputs.values()}
+            missing = set(layout) - set(outputs)
+            if missing:
+                raise ResourceError(
+                    "Outputs {} do not exist on this screen.".format(
+                        ", ".join(sorted(missing))
+                    )
+                )
+            screen.apply_layout(
+                {outputs[name]: config for name, config in layout.items()}
+            )
+
+        return self.map(apply, display_ids)
+
+    def get_info(self, validate=True, display_ids=None):
+        """
+        Returns the descriptors of multiple displays, see Display.get_info().
+
+        Returns
+        -------
+        dict
+            The DisplayResults indexed by display ids, holding the DisplayDescriptors
+        """
+        return self.map(lambda display: display.get_info(validate), display_ids)
+
+    def reload(self, display_ids=None):
+        """
+        Reloads all screens of multiple displays in parallel, probing the outputs if the
+        manager probes them.
+
+        Returns
+        -------
+        dict
+            The DisplayResults indexed by display ids
+        """
+        return self.map(
+            lambda display: display.load_all_screens(self.__probe), display_ids
+        )
+
+    def close(self, display_ids=None):
+        """
+        Closes the connections to the given displays, they are connected to again on next use.
+
+        Parameters
+        ----------
+        display_ids : list, optional
+            The ids of the displays to close (default is None, all open displays).
+        """
+        with self.__lock:
+            if display_ids is None:
+                display_ids = list(self.__displays)
+            closed = [
+                self.__displays.pop(display_id)
+                for display_id in display_ids
+                if display_id in self.__displays
+            ]
+
+        for display in closed:
+            display.close()
+
+    @property
+    def Display_IDs(self):
+        """
+        Returns the ids of the managed displays.
+        """
+        return list(self.__display_ids)
+
+    @property
+    def Displays(self):
+        """
+        Returns a dictionary of the open Displays indexed by their ids.
+        """
+        with self.__lock:
+            return dict(self.__displays)
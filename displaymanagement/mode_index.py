@@ -0,0 +1,71 @@
+from bisect import bisect_left, insort
+from .utils import get_refresh_rate
+
+
+class ModeIndex:
+    """
+    Indexes the modes of a screen by their resolution.
+    The refresh rates of each resolution are kept sorted.
+
+    Methods
+    -------
+    add(mode_id, mode)
+    find(width, height, refresh_rate, tolerance, mode_ids)
+    """
+
+    def __init__(self, modes):
+        """
+        Parameters
+        ----------
+        modes : dict
+            A dictionary of the modes of a screen indexed by their IDs.
+        """
+        self.__resolutions = {}
+        for mode_id, mode in modes.items():
+            self.add(mode_id, mode)
+
+    def add(self, mode_id, mode):
+        """
+        Adds a mode to the index.
+
+        Parameters
+        ----------
+        mode_id : int
+            The ID of the mode
+        mode : mode_object
+            The mode object
+        """
+        entries = self.__resolutions.setdefault((mode["width"], mode["height"]), [])
+        insort(entries, (get_refresh_rate(mode), mode_id))
+
+    def find(self, width, height, refresh_rate=None, tolerance=0.5, mode_ids=None):
+        """
+        Returns the ID of the mode with the given resolution whose refresh rate is closest to
+        the given one or None if there is no such mode within the tolerance.
+
+        Parameters
+        ----------
+        width : int
+            The width of the mode
+        height : int
+            The height of the mode
+        refresh_rate : float, optional
+            The refresh rate of the mode (default is None, the highest refresh rate)
+        tolerance : float, optional
+            The allowed difference in Hz between the refresh rates (default is 0.5)
+        mode_ids : collection, optional
+            The IDs of the modes to consider (default is None, all modes)
+        """
+        entries = self.__resolutions.get((width, height), [])
+        if mode_ids is not None:
+            entries = [entry for entry in entries if entry[1] in mode_ids]
+        if not entries:
+            return None
+
+        if refresh_rate is None:
+            return entries[-1][1]
+
+        position = bisect_left(entries, (refresh_rate,))
+        candidates = entries[max(position - 1, 0) : position + 1]
+        rate, mode_id = min(candidates, key=lambda entry: abs(entry[0] - refresh_rate))
+        return mode_id if abs(rate - refresh_rate) <= tolerance else None
@@ -0,0 +1,102 @@
+from array import array
+from collections.abc import Mapping
+
+# Fields of a mode and the array type code they are stored with, the X protocol
+# limits the timings to 16 bits and the dot clock and flags to 32 bits
+MODE_FIELDS = (
+    ("id", "I"),
+    ("width", "H"),
+    ("height", "H"),
+    ("dot_clock", "I"),
+    ("h_sync_start", "H"),
+    ("h_sync_end", "H"),
+    ("h_total", "H"),
+    ("h_skew", "H"),
+    ("v_sync_start", "H"),
+    ("v_sync_end", "H"),
+    ("v_total", "H"),
+    ("name_length", "H"),
+    ("flags", "I"),
+)
+
+
+class ModeTable(Mapping):
+    """
+    Stores the modes of a screen once in parallel arrays of their fields, shared by the
+    screen and all of its outputs. Modes are accessed by their IDs like a dictionary,
+    each access returns a lightweight ModeRow reading from the arrays.
+
+    Methods
+    -------
+    add(mode_id, mode)
+    get_field(mode_id, field)
+    """
+
+    def __init__(self, modes=()):
+        """
+        Parameters
+        ----------
+        modes : list, optional
+            The mode objects to store, e.g. the modes of a screen resources reply (default is none).
+        """
+        self.__rows = {}
+        self.__columns = {field: array(code) for field, code in MODE_FIELDS}
+        for mode in modes:
+            self.add(mode["id"], mode)
+
+    def add(self, mode_id, mode):
+        """
+        Adds a mode to the table, replacing the mode with the same ID.
+
+        Parameters
+        ----------
+        mode_id : int
+            The ID of the mode
+        mode : mode_object
+            The mode object, e.g. a reply struct or a dictionary created by utils.get_mode
+        """
+        row = self.__rows.get(mode_id)
+        for field, _ in MODE_FIELDS:
+            value = mode_id if field == "id" else mode[field]
+            if row is None:
+                self.__columns[field].append(value)
+            else:
+                self.__columns[field][row] = value
+        if row is None:
+            self.__rows[mode_id] = len(self.__rows)
+
+    def get_field(self, mode_id, field):
+        """
+        Returns a field of a mode without creating a ModeRow.
+        """
+        return self.__columns[field][self.__rows[mode_id]]
+
+    def __getitem__(self, mode_id):
+        return ModeRow(self.__columns, self.__rows[mode_id])
+
+    def __contains__(self, mode_id):
+        return mode_id in self.__rows
+
+    def __iter__(self):
+        return iter(self.__rows)
+
+    def __len__(self):
+        return len(self.__rows)
+
+
+class ModeRow:
+    """
+    A mode of a ModeTable, its fields are accessible as items like the ones of mode reply structs.
+    """
+
+    __slots__ = ("__columns", "__row")
+
+    def __init__(self, columns, row):
+        self.__columns = columns
+        self.__row = row
+
+    def __getitem__(self, field):
+        return self.__columns[field][self.__row]
+
+    def __repr__(self):
+        return "ModeRow({})".format({field: self[field] for field, _ in MODE_FIELDS})
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class DetailedTiming(BaseModel):
+    dot_clock: int
+    width: int
+    h_sync_start: int
+    h_sync_end: int
+    h_total: int
+    height: int
+    v_sync_start: int
+    v_sync_end: int
+    v_total: int
+    refresh_rate: float
+    interlaced: bool
+    preferred: bool = False
+    width_mm: int = 0
+    height_mm: int = 0
@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
+from typing import List, Optional
+from .detailed_timing import DetailedTiming
+from .edid_extension import EDIDExtension
+from ..edid import EDID_BLOCK_LENGTH, get_blocks, parse_base_timings, parse_extension
 
 
 class EDIDDescriptor(BaseModel):
@@ -7,3 +11,59 @@ class EDIDDescriptor(BaseModel):
     manufacturer_serial_number: str
     width: float
     height: float
+
+    # The timings and extensions are only decoded from the raw EDID when accessed
+    _raw: bytes = PrivateAttr(b"")
+    _detailed_timings: Optional[List[DetailedTiming]] = PrivateAttr(None)
+    _extensions: Optional[List[EDIDExtension]] = PrivateAttr(None)
+
+    def __init__(self, raw: bytes = b"", **data):
+        super().__init__(**data)
+        self._raw = raw
+
+    @property
+    def raw(self) -> bytes:
+        return self._raw
+
+    @property
+    def extension_count(self) -> int:
+        return max(len(self._raw) // EDID_BLOCK_LENGTH - 1, 0)
+
+    @property
+    def detailed_timings(self) -> List[DetailedTiming]:
+        if self._detailed_timings is None:
+            self._detailed_timings = (
+                parse_base_timings(self._raw[:EDID_BLOCK_LENGTH])
+                if len(self._raw) >= EDID_BLOCK_LENGTH
+                else []
+            )
+        return self._detailed_timings
+
+    @property
+    def extensions(self) -> List[EDIDExtension]:
+        if self._extensions is None:
+            self._extensions = [
+                parse_extension(block) for block in get_blocks(self._raw)[1:]
+            ]
+        return self._extensions
+
+    @property
+    def preferred_timing(self) -> Optional[DetailedTiming]:
+        for timing in self.detailed_timings:
+            if timing.preferred:
+                return timing
+
+        # Monitors exceeding the limits of the base block only describe their native timing in an extension
+        extension_timings = [
+            timing
+            for extension in self.extensions
+            for timing in extension.detailed_timings
+        ]
+        for timing in extension_timings:
+            if timing.preferred:
+                return timing
+        return extension_timings[0] if extension_timings else None
+
+    @property
+    def hdmi(self) -> bool:
+        return any(extension.hdmi for extension in self.extensions)
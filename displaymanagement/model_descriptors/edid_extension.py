@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import List
+from .detailed_timing import DetailedTiming
+
+
+class EDIDExtension(BaseModel):
+    tag: int
+    revision: int
+    detailed_timings: List[DetailedTiming] = []
+    video_codes: List[int] = []
+    hdmi: bool = False
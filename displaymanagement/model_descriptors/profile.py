@@ -0,0 +1,28 @@
+from typing import List, Optional
+from pydantic import BaseModel
+from ..rotation import Rotation
+
+
+class MonitorFingerprint(BaseModel):
+    manufacturer: str
+    manufacturer_product_code: str
+    manufacturer_serial_number: str
+
+
+class ProfileOutput(BaseModel):
+    monitor: MonitorFingerprint
+    enabled: bool = True
+    x: int = 0
+    y: int = 0
+    width: Optional[int]
+    height: Optional[int]
+    refresh_rate: Optional[float]
+    rotation: Rotation = Rotation.NO_ROTATION
+
+    class Config:
+        use_enum_values = True
+
+
+class Profile(BaseModel):
+    name: str
+    outputs: List[ProfileOutput]
@@ -1,18 +1,22 @@
 import enum
+from array import array
 from typing import Optional
 from Xlib.error import XError
 from Xlib.ext import randr
 from Xlib.ext.randr import PROPERTY_RANDR_EDID
-from pyedid import Edid
-from .utils import get_modes_from_ids, format_mode, format_edid
+from .utils import format_mode, make_descriptor
 from .rotation import Rotation
 from .entity import Entity
 from .model_descriptors.output_descriptor import OutputDescriptor
 from .model_descriptors.crtc_info import CRTCInfo
 from .model_descriptors.crtc_config import CRTCConfig
-from .resources import get_pnp_info
+from .cache import CRTCInfoCache, EDIDCache
+from .threads import get_display_lock, synchronized, changes_state
+from .edid import EDID_BLOCK_LENGTH
 from .exceptions import ResourceError, InvalidStateError
 
+EDID_TYPE = 19  # XA_INTEGER
+
 
 class Output(Entity):
     """
@@ -26,14 +30,26 @@ class Output(Entity):
     set_position(x,y)
     set_rotation(rotation)
     set_config(crtc_id, mode_id, x, y, rotation)
+    prepare_config(config)
+    commit_config(config, new_timestamp)
     disable()
     re_enable()
+    get_disable_config()
+    get_re_enable_config()
     get_edid()
+    get_raw_edid()
+    get_output_info_data()
+    put_raw_edid(raw)
     add_mode(mode_id)
     get_info()
     has_edid()
     relative_place(output, orientation)
     complete_crtc_config(config)
+    update_config_timestamp(config_timestamp)
+    update_from_crtc_change(event)
+    update_from_output_change(event, crtc_state)
+    get_crtc_info_request()
+    put_crtc_info(reply)
 
     Properties
     ----------
@@ -41,10 +57,18 @@ class Output(Entity):
     CRTC_ID()
     CRTC_Info()
     CRTC_Config()
+    EDID_Loaded()
+    Name()
+    Last_Mode_ID()
+    Mode_IDs()
+    Preferred_Mode_IDs()
+    Possible_CRTC_IDs()
 
     Static Methods
     --------------
-    load_from_identifier(display,screen,output_id,screen_modes,config_timestamp)
+    next_edid_chunk(raw, reply)
+    load_from_identifier(display,screen,output_id,screen_modes,config_timestamp,crtc_info_cache,edid_cache,lazy)
+    load_from_replies(display,screen,output_id,output,target_crtc_info,screen_modes,config_timestamp,crtc_info_cache,edid_cache,lazy)
     """
 
     def __init__(
@@ -54,13 +78,18 @@ class Output(Entity):
         screen,
         output,
         is_connected,
-        modes,
+        mode_ids,
+        preferred_mode_count,
+        screen_modes,
         active_mode_id,
         target_crtc_id,
         x,
         y,
         rotation,
         config_timestamp,
+        crtc_info_cache,
+        edid_cache,
+        lazy=False,
     ):
         """
         Parameters
@@ -71,10 +100,16 @@ class Output(Entity):
             The underlying X display object which contains this output.
         screen : XScreen
             The underlying X screen object which contains this output.
+        output : GetOutputInfo
+            The output info reply of this output, only the fields used later are kept.
         is_connected : bool
             Whether this output is connected or not.
-        modes : dict
-            The modes allowed for this output indexed by their IDs.
+        mode_ids : list
+            The IDs of the modes allowed for this output.
+        preferred_mode_count : int
+            The number of leading mode IDs which are preferred by the connected monitor.
+        screen_modes : ModeTable
+            The modes of the screen which contains this output indexed by their IDs.
         active_mode_id : int
             The ID of the mode which is currently assigned to this output.
         target_crtc_id : int
@@ -87,23 +122,44 @@ class Output(Entity):
             The current rotation mode of the screen.
         config_timestamp : int
             The time at which the screen which contains this object was last changed.
+        crtc_info_cache : CRTCInfoCache
+            The CRTC info cache of the screen which contains this output.
+        edid_cache : EDIDCache
+            The EDID cache of the screen which contains this output.
+        lazy : bool, optional
+            Whether the info of the target CRTC is requested on first access instead of being
+            given by active_mode_id, x, y and rotation (default is False).
         """
         super().__init__(id)
         self.__display = display
+        self._lock = get_display_lock(display)
         self.__screen = screen
-        self.__output = output
+        output_data = output._data
+        self.__name = output_data["name"]
+        self.__mm_width = output_data["mm_width"]
+        self.__mm_height = output_data["mm_height"]
+        self.__possible_crtc_ids = array("I", output_data["crtcs"])
         self.__is_connected = is_connected
-        self.__modes = modes
+        self.__mode_ids = array("I", mode_ids)
+        self.__preferred_mode_count = preferred_mode_count
+        self.__screen_modes = screen_modes
         self.__last_mode_id = active_mode_id
-        self.__crtc_config = CRTCConfig(
-            crtc=target_crtc_id,
-            x=x,
-            y=y,
-            mode=active_mode_id,
-            rotation=Rotation(rotation or Rotation.NO_ROTATION),
+        self.__target_crtc_id = target_crtc_id
+        self.__crtc_config = (
+            None
+            if lazy and target_crtc_id
+            else CRTCConfig(
+                crtc=target_crtc_id,
+                x=x,
+                y=y,
+                mode=active_mode_id,
+                rotation=Rotation(rotation or Rotation.NO_ROTATION),
+            )
         )
 
         self.__config_timestamp = config_timestamp
+        self.__crtc_info_cache = crtc_info_cache
+        self.__edid_cache = edid_cache
 
     def get_available_modes_info(self):
         """
@@ -113,7 +169,10 @@ class Output(Entity):
         list
             A list of available modes
         """
-        return [format_mode(mode_id, mode) for mode_id, mode in self.__modes.items()]
+        return [
+            format_mode(mode_id, self.__screen_modes[mode_id])
+            for mode_id in self.__mode_ids
+        ]
 
     def set_mode(self, mode_id: int, crtc_id: Optional[int] = None):
         """
@@ -158,24 +217,50 @@ class Output(Entity):
         """
         return self.set_config(CRTCConfig(rotation=rotation))
 
+    @changes_state
     def disable(self):
         """
         Disables output if connected
         """
-        if self.__crtc_config.crtc is not None and self.__crtc_config.mode:
-            return self.set_config(CRTCConfig(mode=0))
+        config = self.get_disable_config()
+        if config is not None:
+            return self.set_config(config)
 
+    @changes_state
     def re_enable(self):
         """
         If this output was connected before, connects to the last crtc_id it was
         connected to with the mode that it was connected with.
         """
-        if self.__crtc_config.crtc is not None and self.__last_mode_id:
-            self.set_mode(self.__last_mode_id, self.__crtc_config.crtc)
+        config = self.get_re_enable_config()
+        if config is not None:
+            self.set_config(config)
+
+    @synchronized
+    def get_disable_config(self):
+        """
+        Returns the config disabling this output or None if it is disabled already.
+        """
+        crtc_config = self.__get_crtc_config()
+        if crtc_config.crtc is not None and crtc_config.mode:
+            return CRTCConfig(mode=0)
+        return None
+
+    @synchronized
+    def get_re_enable_config(self):
+        """
+        Returns the config enabling this output with its last mode on its last CRTC
+        or None if it was never enabled.
+        """
+        crtc_config = self.__get_crtc_config()
+        if crtc_config.crtc is not None and self.__last_mode_id:
+            return CRTCConfig(mode=self.__last_mode_id, crtc=crtc_config.crtc)
+        return None
 
+    @changes_state
     def set_config(self, config: CRTCConfig):
         """
-        Sets crtc config.
+        Sets crtc config. No request is sent if the config matches the current one.
 
         WARNING Does not adjust screen size! Use Screen.set_crtc_config instead
         to profit from automatic adjustment of screen size.
@@ -185,29 +270,76 @@ class Output(Entity):
         ResourceError
             If the mode_id provided is not in the list of supported mode ids for this output.
         """
+        prepared = self.prepare_config(config)
+        if prepared is None:
+            # Nothing changes, avoid a needless mode set
+            return
 
+        config, fields = prepared
+        result = self.__display.xrandr_set_crtc_config(**fields)
+        self.commit_config(config, result._data["new_timestamp"])
+
+    @synchronized
+    def prepare_config(self, config: CRTCConfig):
+        """
+        Completes and checks a crtc config without sending any request.
+
+        Returns
+        -------
+        tuple
+            The completed config and the fields of the SetCrtcConfig request applying it,
+            or None if the config matches the current one.
+
+        Throws
+        ------
+        ResourceError
+            If the mode_id provided is not in the list of supported mode ids for this output.
+        """
         config = self.complete_crtc_config(config)
 
-        if config.mode not in self.__modes and config.mode != 0:
+        if config.mode not in self.__mode_ids and config.mode != 0:
             raise ResourceError(
                 "Mode ID is not in the list of supported modes for this output, use add_mode to add it first."
             )
 
-        result = self.__display.xrandr_set_crtc_config(
-            config_timestamp=self.__config_timestamp,
-            outputs=[self._id] if config.mode else [],
-            **config.dict()
+        if config == self.__get_crtc_config():
+            return None
+
+        return (
+            config,
+            dict(
+                config_timestamp=self.__config_timestamp,
+                outputs=[self._id] if config.mode else [],
+                **config.dict()
+            ),
         )
-        self.__config_timestamp = result._data["new_timestamp"]
-        self.__last_mode_id = config.mode
+
+    @changes_state
+    def commit_config(self, config: CRTCConfig, new_timestamp: int):
+        """
+        Updates this output after a config returned by prepare_config() was applied.
+
+        Parameters
+        ----------
+        config : CRTCConfig
+            The applied config
+        new_timestamp : int
+            The timestamp returned by the server for the change
+        """
+        self.__crtc_info_cache.invalidate(config.crtc, new_timestamp)
+        if config.mode:
+            self.__last_mode_id = config.mode
         self.__crtc_config = config
-        self.__is_connected = True
+        if config.mode:
+            # Disabling the CRTC of an unplugged monitor does not connect it
+            self.__is_connected = True
 
+    @synchronized
     def complete_crtc_config(self, config: CRTCConfig) -> CRTCConfig:
         """
         Returns crtc config where missing bits are filled with current config of this output.
         """
-        fill = self.__crtc_config
+        fill = self.__get_crtc_config()
         return CRTCConfig(
             crtc=fill.crtc if config.crtc is None else config.crtc,
             x=fill.x if config.x is None else config.x,
@@ -216,9 +348,93 @@ class Output(Entity):
             rotation=fill.rotation if config.rotation is None else config.rotation,
         )
 
+    @changes_state
+    def update_config_timestamp(self, config_timestamp):
+        """
+        Updates the config timestamp used for requests issued by this output.
+
+        Parameters
+        config_timestamp : int
+            The new config timestamp of the screen containing this output
+        """
+        self.__config_timestamp = config_timestamp
+
+    @changes_state
+    def update_from_crtc_change(self, event):
+        """
+        Patches the CRTC config of this output from a RandR CRTC change event.
+        Events for CRTCs this output is not actively driven by are ignored.
+
+        Parameters
+        event : CrtcChangeNotify
+            The CRTC change event
+        """
+        if self.__crtc_config is None:
+            # The CRTC info is requested with the new state on first access
+            return
+
+        if self.__crtc_config.crtc != event.crtc or not self.__crtc_config.mode:
+            return
+
+        self.__crtc_config = CRTCConfig(
+            crtc=event.crtc,
+            x=event.x,
+            y=event.y,
+            mode=event.mode,
+            rotation=Rotation(event.rotation or Rotation.NO_ROTATION.value),
+        )
+        if event.mode:
+            self.__last_mode_id = event.mode
+
+    @changes_state
+    def update_from_output_change(self, event, crtc_state=None):
+        """
+        Patches the state of this output from a RandR output change event.
+
+        Parameters
+        event : OutputChangeNotify
+            The output change event
+        crtc_state : CrtcChangeNotify, optional
+            The last known state of the CRTC the event assigns this output to,
+            used for updating the position of the output.
+
+        Returns
+        bool
+            Whether the connection status of the output changed, i.e. a monitor
+            was plugged in or out and the modes of the output are not up to date anymore.
+        """
+        is_connected = event.connection == randr.Connected
+        hotplugged = is_connected != self.__is_connected
+        current = self.__crtc_config
+        if current is None:
+            # The CRTC info is requested with the new state on first access
+            self.__is_connected = is_connected
+            self.__target_crtc_id = event.crtc or self.__target_crtc_id
+            self.__config_timestamp = event.config_timestamp
+            return hotplugged
+
+        x, y = (crtc_state.x, crtc_state.y) if crtc_state else (current.x, current.y)
+
+        self.__is_connected = is_connected
+        self.__crtc_config = CRTCConfig(
+            crtc=event.crtc or current.crtc,
+            x=x,
+            y=y,
+            mode=event.mode,
+            rotation=Rotation(event.rotation or Rotation.NO_ROTATION.value),
+        )
+        if event.mode:
+            self.__last_mode_id = event.mode
+        self.__config_timestamp = event.config_timestamp
+
+        return hotplugged
+
+    @synchronized
     def get_edid(self):
         """
-        Returns the EDID of the monitor represented by the display
+        Returns the EDID of the monitor represented by the display.
+        The whole EDID including its extension blocks is read, its detailed timings
+        and extensions are decoded when accessed.
 
         Returns
         EDIDDescriptor
@@ -228,19 +444,26 @@ class Output(Entity):
         ResourceError
             If the output does not have an EDID property exposed
         """
-        if not self.has_edid():
+        raw = self.__get_raw_edid()
+        if raw is None:
             raise ResourceError("Connected monitor does not provide an EDID property")
 
-        EDID_ATOM = self.__display.intern_atom(PROPERTY_RANDR_EDID)
-        EDID_TYPE = 19
-        EDID_LENGTH = 128
-        edid_info = self.__display.xrandr_get_output_property(
-            self._id, EDID_ATOM, EDID_TYPE, 0, EDID_LENGTH
-        )
+        return self.__edid_cache.parse(raw)
+
+    @changes_state
+    def put_raw_edid(self, raw):
+        """
+        Caches the raw EDID of the connected monitor requested by the caller,
+        get_edid() then does not send any request.
 
-        edid = Edid(bytes(edid_info._data["value"]), get_pnp_info())
-        return format_edid(edid)
+        Parameters
+        ----------
+        raw : bytes
+            The raw EDID including its extension blocks or None if the monitor does not expose one
+        """
+        self.__edid_cache.put(self._id, raw)
 
+    @synchronized
     def has_edid(self):
         """
         Checks if the output's connected monitor exposes an EDID property.
@@ -253,21 +476,98 @@ class Output(Entity):
         InvalidStateError
             If output is not connected.
         """
+        return self.__get_raw_edid() is not None
+
+    @synchronized
+    def get_raw_edid(self):
+        """
+        Returns the raw EDID of the connected monitor including its extension blocks
+        or None if it does not expose one.
+
+        Throws
+        ------
+        InvalidStateError
+            If output is not connected.
+        """
+        return self.__get_raw_edid()
+
+    @synchronized
+    def get_output_info_data(self):
+        """
+        Returns the fields of the output info reply this output is created from by
+        load_from_replies(), reflecting its current state.
+
+        Returns
+        -------
+        dict
+            The output info data
+        """
+        return dict(
+            connection=randr.Connected if self.__is_connected else randr.Disconnected,
+            crtc=self.CRTC_ID or 0,
+            modes=list(self.__mode_ids),
+            num_preferred=self.__preferred_mode_count,
+            name=self.__name,
+            mm_width=self.__mm_width,
+            mm_height=self.__mm_height,
+            crtcs=list(self.__possible_crtc_ids),
+        )
+
+    def __get_raw_edid(self):
+        """
+        Returns the raw EDID of the connected monitor including its extension blocks
+        or None if it does not expose one. The base block is fetched first and the
+        remaining bytes reported by the server are fetched in a second request.
+        The EDID is cached until the output changes.
+        """
         if not self.__is_connected:
             raise InvalidStateError("Output is not connected to any monitor")
 
-        EDID_ATOM = self.__display.intern_atom(PROPERTY_RANDR_EDID)
-        EDID_TYPE = 19
-        EDID_LENGTH = 128
-        edid_info = self.__display.xrandr_get_output_property(
-            self._id, EDID_ATOM, EDID_TYPE, 0, EDID_LENGTH
-        )
+        if not self.__edid_cache.contains(self._id):
+            atom = self.__display.get_atom(PROPERTY_RANDR_EDID)
+            raw, offset, length = Output.next_edid_chunk(b"", None)
+            while length:
+                reply = self.__display.xrandr_get_output_property(
+                    self._id, atom, EDID_TYPE, offset, length
+                )
+                raw, offset, length = Output.next_edid_chunk(raw, reply)
+            self.__edid_cache.put(self._id, raw)
+
+        return self.__edid_cache.get(self._id)
+
+    @staticmethod
+    def next_edid_chunk(raw, reply):
+        """
+        Appends a chunk of the EDID property to the raw EDID read so far and returns
+        where the next chunk starts. The base block is requested first and the remaining
+        bytes reported by the server with the second request.
+
+        Parameters
+        ----------
+        raw : bytes
+            The raw EDID read so far, empty before the first request
+        reply : GetOutputProperty
+            The reply of the last EDID property request or None before the first request
+
+        Returns
+        -------
+        tuple
+            The raw EDID read so far, or None if the monitor does not expose one, followed by
+            the offset and length of the next GetOutputProperty request, the length is 0 once
+            the whole EDID is read
+        """
+        # Offsets and lengths of property requests are given in 32 bit units
+        if reply is None:
+            return raw, 0, EDID_BLOCK_LENGTH // 4
 
-        if edid_info._data["property_type"] == 0:
-            return False
+        edid_info = reply._data
+        if not edid_info["property_type"]:
+            return None, 0, 0
 
-        return True
+        raw += bytes(edid_info["value"])
+        return raw, len(raw) // 4, (edid_info["bytes_after"] + 3) // 4
 
+    @changes_state
     def add_mode(self, mode_id):
         """
         Adds a mode to be used by this output if it is within the containing screen's modes and
@@ -278,6 +578,8 @@ class Output(Entity):
             The mode id to add
         """
         self.__display.xrandr_add_output_mode(self._id, mode_id)
+        if mode_id not in self.__mode_ids:
+            self.__mode_ids = self.__mode_ids + array("I", (mode_id,))
 
     def relative_place(self, output, orientation):
         """
@@ -322,27 +624,92 @@ class Output(Entity):
         # TODO: check screen boundaries and adjust if possible
         self.set_position(new_x, new_y)
 
+    def __get_crtc_config(self):
+        """
+        Returns the current CRTC config of this output.
+        For lazily loaded outputs, the info of the target CRTC is requested on first use.
+        """
+        if self.__crtc_config is None:
+            crtc_info = self.__crtc_info_cache.get(
+                self.__target_crtc_id, self.__config_timestamp
+            )
+            if crtc_info.mode_id:
+                self.__last_mode_id = self.__last_mode_id or crtc_info.mode_id
+            self.__crtc_config = CRTCConfig(
+                crtc=self.__target_crtc_id,
+                x=crtc_info.x,
+                y=crtc_info.y,
+                mode=crtc_info.mode_id,
+                rotation=Rotation(crtc_info.rotation or Rotation.NO_ROTATION),
+            )
+        return self.__crtc_config
+
+    @synchronized
+    def get_crtc_info_request(self):
+        """
+        Returns the fields of the GetCrtcInfo request needed before CRTC_Info and
+        CRTC_Config can be read without a round trip, or None if the CRTC info is cached
+        or not needed.
+        """
+        crtc_id = self.CRTC_ID
+        if not crtc_id or self.__crtc_info_cache.contains(
+            crtc_id, self.__config_timestamp
+        ):
+            return None
+        return dict(crtc=crtc_id, config_timestamp=self.__config_timestamp)
+
+    @changes_state
+    def put_crtc_info(self, reply):
+        """
+        Caches a CRTC info reply requested with the fields returned by get_crtc_info_request().
+        """
+        self.__crtc_info_cache.put(self.CRTC_ID, reply, self.__config_timestamp)
+
+    @property
+    def Name(self):
+        """
+        Returns the name of this output, e.g. HDMI-1
+        """
+        return self.__name
+
+    @property
+    def Last_Mode_ID(self):
+        """
+        Returns the ID of the mode this output was enabled with last, re_enable() restores it.
+        """
+        return self.__last_mode_id
+
     @property
+    def EDID_Loaded(self):
+        """
+        Whether the EDID of the connected monitor was requested and is cached.
+
+        Returns
+        bool
+            The EDID cache status
+        """
+        return self.__edid_cache.contains(self._id)
+
+    @property
+    @synchronized
     def CRTC_Info(self) -> CRTCInfo:
         """
         CRTC information for this output or None if it is not connected.
+        The info is requested only if it is not in the CRTC info cache of the screen.
         """
-        if not self.__is_connected or not self.__crtc_config.crtc:
+        crtc_id = self.CRTC_ID
+        if not self.__is_connected or not crtc_id:
             return None
 
-        mode_info = self.__display.xrandr_get_crtc_info(
-            self.__crtc_config.crtc, self.__config_timestamp
-        )._data
-        self.__config_timestamp = mode_info["timestamp"]
-
-        return CRTCInfo(mode_id=mode_info["mode"], **mode_info)
+        return self.__crtc_info_cache.get(crtc_id, self.__config_timestamp)
 
     @property
+    @synchronized
     def CRTC_Config(self) -> CRTCConfig:
         """
         Current CRTC config of this output.
         """
-        return self.__crtc_config.copy()
+        return self.__get_crtc_config().copy()
 
     @property
     def Connected(self):
@@ -355,6 +722,39 @@ class Output(Entity):
         """
         return self.__is_connected
 
+    @property
+    def Mode_IDs(self):
+        """
+        IDs of the modes allowed for this output.
+
+        Returns
+        array
+            The mode IDs
+        """
+        return self.__mode_ids
+
+    @property
+    def Preferred_Mode_IDs(self):
+        """
+        IDs of the modes preferred by the monitor connected to this output.
+
+        Returns
+        array
+            The preferred mode IDs
+        """
+        return self.__mode_ids[: self.__preferred_mode_count]
+
+    @property
+    def Possible_CRTC_IDs(self):
+        """
+        IDs of the CRTCs which can drive this output.
+
+        Returns
+        array
+            The CRTC IDs
+        """
+        return self.__possible_crtc_ids
+
     @property
     def CRTC_ID(self):
         """
@@ -364,12 +764,20 @@ class Output(Entity):
         int
             The CRTC ID
         """
+        if self.__crtc_config is None:
+            return self.__target_crtc_id
         return self.__crtc_config.crtc
 
-    def get_info(self):
+    @synchronized
+    def get_info(self, validate=True):
         """
         Returns a dictionary containing all relevant information about this output's resources.
 
+        Parameters
+        ----------
+        validate : bool, optional
+            Whether the descriptor is validated (default is True)
+
         Returns
         -------
         OutputDescriptor
@@ -377,26 +785,34 @@ class Output(Entity):
         """
         is_connected = self.__is_connected
         crtc_info = self.CRTC_Info
+        crtc_config = self.__get_crtc_config()
 
-        return OutputDescriptor(
+        return make_descriptor(
+            OutputDescriptor,
+            validate,
             id=self._id,
-            name=self.__output._data["name"],
-            current_mode_id=self.__crtc_config.mode,
-            available_mode_ids=list(self.__modes.keys()),
+            name=self.__name,
+            current_mode_id=crtc_config.mode,
+            available_mode_ids=list(self.__mode_ids),
             is_connected=is_connected,
             x=crtc_info.x if crtc_info is not None else None,
             y=crtc_info.y if crtc_info is not None else None,
-            width=crtc_info.width if crtc_info is not None else None,
-            height=crtc_info.height if crtc_info is not None else None,
-            width_mm=self.__output._data["mm_width"],
-            height_mm=self.__output._data["mm_height"],
-            rotation=self.__crtc_config.rotation,
+            width_mm=self.__mm_width,
+            height_mm=self.__mm_height,
+            rotation=crtc_config.rotation,
             # edid=self.get_edid() if is_connected and self.has_edid() else None,
         )
 
     @staticmethod
     def load_from_identifier(
-        display, screen, output_id, screen_modes, config_timestamp
+        display,
+        screen,
+        output_id,
+        screen_modes,
+        config_timestamp,
+        crtc_info_cache=None,
+        edid_cache=None,
+        lazy=False,
     ):
         """
         Loads the outputs identified by the output_id and returns the corresponding Output object.
@@ -409,44 +825,124 @@ class Output(Entity):
             The x screen which contains this output.
         output_id : int
             The ID of the output to load.
-        screen_modes : dict
-            A dictionary of the allowed modes from the parent screen for this output.
+        screen_modes : ModeTable
+            The modes of the parent screen indexed by their IDs.
         config_timestamp : int
             The time at which the last change to the screen containing this output changed
+        crtc_info_cache : CRTCInfoCache, optional
+            The CRTC info cache of the screen containing this output
+            (default is None, a new cache is created for the output)
+        edid_cache : EDIDCache, optional
+            The EDID cache of the screen containing this output
+            (default is None, a new cache is created for the output)
+        lazy : bool, optional
+            Whether the info of the target CRTC is requested on first access (default is False).
 
         Returns
         -------
         Output
             The output object
         """
+        if crtc_info_cache is None:
+            crtc_info_cache = CRTCInfoCache(display)
+        if edid_cache is None:
+            edid_cache = EDIDCache()
+
         output = display.xrandr_get_output_info(output_id, config_timestamp)
-        output_data = output._data
-        is_connected = output_data["connection"] == randr.Connected
-        output_modes = get_modes_from_ids(output_data["modes"], screen_modes)
-        target_crtc_id = output_data["crtc"]
+        target_crtc_id = output._data["crtc"]
         target_crtc_info = (
             display.xrandr_get_crtc_info(target_crtc_id, config_timestamp)
-            if is_connected and target_crtc_id
+            if target_crtc_id and not lazy
             else None
         )
+        return Output.load_from_replies(
+            display,
+            screen,
+            output_id,
+            output,
+            target_crtc_info,
+            screen_modes,
+            config_timestamp,
+            crtc_info_cache,
+            edid_cache,
+            lazy,
+        )
+
+    @staticmethod
+    def load_from_replies(
+        display,
+        screen,
+        output_id,
+        output,
+        target_crtc_info,
+        screen_modes,
+        config_timestamp,
+        crtc_info_cache,
+        edid_cache,
+        lazy=False,
+    ):
+        """
+        Creates the Output object from already received output and CRTC info replies.
+
+        Parameters
+        ----------
+        display : XDisplay
+            The x display which contains this output.
+        screen : XScreen
+            The x screen which contains this output.
+        output_id : int
+            The ID of the output.
+        output : GetOutputInfo
+            The output info reply of the output.
+        target_crtc_info : GetCrtcInfo
+            The CRTC info reply of the CRTC the output is connected to or None if it is not connected.
+        screen_modes : ModeTable
+            The modes of the parent screen indexed by their IDs.
+        config_timestamp : int
+            The time at which the last change to the screen containing this output changed
+        crtc_info_cache : CRTCInfoCache
+            The CRTC info cache of the screen containing this output, the received
+            CRTC info is added to it
+        edid_cache : EDIDCache
+            The EDID cache of the screen containing this output
+        lazy : bool, optional
+            Whether the info of the target CRTC is requested on first access, target_crtc_info
+            is None in that case (default is False).
+
+        Returns
+        -------
+        Output
+            The output object
+        """
+        output_data = output._data
+        is_connected = output_data["connection"] == randr.Connected
+        target_crtc_id = output_data["crtc"]
         target_crtc_info_data = target_crtc_info._data if target_crtc_info else None
         x = target_crtc_info_data["x"] if target_crtc_info else None
         y = target_crtc_info_data["y"] if target_crtc_info else None
         rotation = target_crtc_info_data["rotation"] if target_crtc_info else None
         active_mode_id = target_crtc_info._data["mode"] if target_crtc_info else None
+        if target_crtc_info:
+            crtc_info_cache.put(target_crtc_id, target_crtc_info, config_timestamp)
+
         return Output(
             output_id,
             display,
             screen,
             output,
             is_connected,
-            output_modes,
+            output_data["modes"],
+            output_data["num_preferred"],
+            screen_modes,
             active_mode_id,
             target_crtc_id,
             x,
             y,
             rotation,
             config_timestamp,
+            crtc_info_cache,
+            edid_cache,
+            lazy,
         )
 
 
@@ -0,0 +1,203 @@
+from Xlib.display import Display as XDisplay
+from Xlib.ext import randr
+
+
+def send_request(display, request, **fields):
+    """
+    Sends a RandR request without waiting for its reply.
+    The reply is read when the reply() method of the returned request is called,
+    queued requests are all flushed by the first reply() call.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display to send the request to
+    request : type
+        The RandR request class, e.g. randr.GetOutputInfo
+    fields : dict
+        The fields of the request
+
+    Returns
+    -------
+    ReplyRequest
+        The sent request
+    """
+    if not isinstance(display, XDisplay):
+        # Displays of other backends implement deferred requests themselves
+        return display.defer_request(request, **fields)
+
+    return request(
+        display=display.display,
+        defer=True,
+        opcode=display.display.get_extension_major(randr.extname),
+        **fields
+    )
+
+
+def collect_replies(requests):
+    """
+    Waits for the replies of a dictionary of sent requests.
+
+    Parameters
+    ----------
+    requests : dict
+        A dictionary of sent requests
+
+    Returns
+    -------
+    dict
+        The same dictionary with all replies received
+    """
+    for request in requests.values():
+        request.reply()
+    return requests
+
+
+def send_output_info_requests(display, output_ids, config_timestamp):
+    """
+    Sends the output info requests of all the given outputs without waiting for their replies.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display which contains the outputs
+    output_ids : list
+        The IDs of the outputs
+    config_timestamp : int
+        The config timestamp of the screen containing the outputs
+
+    Returns
+    -------
+    dict
+        The sent requests indexed by output IDs
+    """
+    return {
+        output_id: send_request(
+            display,
+            randr.GetOutputInfo,
+            output=output_id,
+            config_timestamp=config_timestamp,
+        )
+        for output_id in output_ids
+    }
+
+
+def send_crtc_info_requests(display, crtc_ids, config_timestamp):
+    """
+    Sends the CRTC info requests of all the given CRTCs without waiting for their replies.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display which contains the CRTCs
+    crtc_ids : list
+        The IDs of the CRTCs
+    config_timestamp : int
+        The config timestamp of the screen containing the CRTCs
+
+    Returns
+    -------
+    dict
+        The sent requests indexed by CRTC IDs
+    """
+    return {
+        crtc_id: send_request(
+            display,
+            randr.GetCrtcInfo,
+            crtc=crtc_id,
+            config_timestamp=config_timestamp,
+        )
+        for crtc_id in crtc_ids
+    }
+
+
+def get_output_infos(display, output_ids, config_timestamp):
+    """
+    Requests the info of all the given outputs in one round trip.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display which contains the outputs
+    output_ids : list
+        The IDs of the outputs
+    config_timestamp : int
+        The config timestamp of the screen containing the outputs
+
+    Returns
+    -------
+    dict
+        The output info replies indexed by output IDs
+    """
+    return collect_replies(
+        send_output_info_requests(display, output_ids, config_timestamp)
+    )
+
+
+def get_crtc_infos(display, crtc_ids, config_timestamp):
+    """
+    Requests the info of all the given CRTCs in one round trip.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display which contains the CRTCs
+    crtc_ids : list
+        The IDs of the CRTCs
+    config_timestamp : int
+        The config timestamp of the screen containing the CRTCs
+
+    Returns
+    -------
+    dict
+        The CRTC info replies indexed by CRTC IDs
+    """
+    return collect_replies(send_crtc_info_requests(display, crtc_ids, config_timestamp))
+
+
+def get_screen_resources(display, screen_ids, probe=False):
+    """
+    Requests the resources of all the given screens in one round trip.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display which contains the screens
+    screen_ids : list
+        The IDs of the screens
+    probe : bool, optional
+        Whether the server should probe the outputs for changes (default is False).
+
+    Returns
+    -------
+    dict
+        The screen resources replies indexed by screen IDs
+    """
+    return collect_replies(
+        {
+            screen_id: send_request(
+                display,
+                randr.GetScreenResources if probe else randr.GetScreenResourcesCurrent,
+                window=display.screen(screen_id).root,
+            )
+            for screen_id in screen_ids
+        }
+    )
+
+
+def get_target_crtc_ids(output_infos):
+    """
+    Returns the IDs of the CRTCs driving the outputs of output info replies, including
+    outputs whose monitor was unplugged while their CRTC is still enabled.
+
+    Parameters
+    ----------
+    output_infos : dict
+        The received output info replies
+
+    Returns
+    -------
+    set
+        The CRTC IDs
+    """
+    return {info._data["crtc"] for info in output_infos.values() if info._data["crtc"]}
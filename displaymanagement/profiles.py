@@ -0,0 +1,386 @@
+import json
+from .model_descriptors.crtc_config import CRTCConfig
+from .model_descriptors.profile import MonitorFingerprint, Profile, ProfileOutput
+from .exceptions import ResourceError
+from .rotation import Rotation
+
+
+def get_fingerprint(edid):
+    """
+    Returns the fingerprint identifying a monitor by the manufacturer, product code and
+    serial number of its EDID.
+
+    Parameters
+    ----------
+    edid : EDIDDescriptor
+        The EDID of the monitor
+
+    Returns
+    -------
+    MonitorFingerprint
+        The fingerprint of the monitor
+    """
+    return MonitorFingerprint(
+        manufacturer=edid.manufacturer,
+        manufacturer_product_code=edid.manufacturer_product_code,
+        manufacturer_serial_number=edid.manufacturer_serial_number,
+    )
+
+
+def fingerprint_key(fingerprint):
+    return (
+        fingerprint.manufacturer,
+        fingerprint.manufacturer_product_code,
+        fingerprint.manufacturer_serial_number,
+    )
+
+
+def get_monitors_key(fingerprints):
+    """
+    Returns the key of a set of connected monitors in a ProfileIndex, independent of the
+    outputs they are connected to. Identical monitors are counted.
+    """
+    return tuple(sorted(fingerprint_key(fingerprint) for fingerprint in fingerprints))
+
+
+class ProfileIndex:
+    """
+    Stores named profiles indexed by the set of monitors they were made for,
+    so the profile of the connected monitors is found with one hash lookup.
+
+    Methods
+    -------
+    add(profile)
+    remove(name)
+    find(fingerprints)
+    save(path)
+
+    Static Methods
+    --------------
+    load(path)
+
+    Properties
+    ----------
+    Profiles()
+    """
+
+    def __init__(self, profiles=()):
+        """
+        Parameters
+        ----------
+        profiles : list, optional
+            The Profiles to index (default is none)
+        """
+        self.__profiles = {}
+        self.__index = {}
+        for profile in profiles:
+            self.add(profile)
+
+    def add(self, profile):
+        """
+        Adds a profile, replacing the profile with the same name and the profile made for
+        the same monitors.
+        """
+        self.remove(profile.name)
+        key = get_monitors_key(output.monitor for output in profile.outputs)
+        replaced = self.__index.get(key)
+        if replaced is not None:
+            del self.__profiles[replaced.name]
+        self.__profiles[profile.name] = profile
+        self.__index[key] = profile
+
+    def remove(self, name):
+        """
+        Removes the profile with the given name, if it exists.
+        """
+        profile = self.__profiles.pop(name, None)
+        if profile is not None:
+            del self.__index[
+                get_monitors_key(output.monitor for output in profile.outputs)
+            ]
+
+    def find(self, fingerprints):
+        """
+        Returns the profile made for exactly the given monitors or None if there is none.
+
+        Parameters
+        ----------
+        fingerprints : list
+            The MonitorFingerprints of the connected monitors
+        """
+        return self.__index.get(get_monitors_key(fingerprints))
+
+    def save(self, path):
+        """
+        Writes all profiles to a JSON file.
+        """
+        with open(path, "w") as profile_file:
+            json.dump(
+                [json.loads(profile.json()) for profile in self.__profiles.values()],
+                profile_file,
+                indent=2,
+            )
+
+    @staticmethod
+    def load(path):
+        """
+        Reads the profiles of a JSON file written by save().
+        """
+        with open(path) as profile_file:
+            return ProfileIndex(
+                Profile(**profile) for profile in json.load(profile_file)
+            )
+
+    @property
+    def Profiles(self):
+        """
+        Returns a dictionary of all profiles indexed by their names.
+        """
+        return dict(self.__profiles)
+
+
+class ProfileEngine:
+    """
+    Applies the profile of the connected monitors of a screen whenever a monitor is plugged
+    in or out. Hotplugs are detected through RandR events, the matching profile is looked
+    up by the EDID fingerprints of the connected monitors and applied with one call to
+    Screen.apply_layout().
+
+    Methods
+    -------
+    get_monitors()
+    capture(name)
+    apply(profile)
+    apply_matching()
+    process_events(block)
+    run()
+
+    Properties
+    ----------
+    Index()
+    """
+
+    def __init__(self, display, index, screen_identifier=0):
+        """
+        Parameters
+        ----------
+        display : Display
+            The display to watch, events are enabled by the engine
+        index : ProfileIndex
+            The profiles to apply
+        screen_identifier : int, optional
+            The screen whose monitors are watched (default is 0)
+        """
+        self.__display = display
+        self.__index = index
+        self.__screen_identifier = screen_identifier
+        self.__connected = None
+        display.enable_events()
+
+    @property
+    def Index(self):
+        return self.__index
+
+    def __get_screen(self):
+        return self.__display.Screens[self.__screen_identifier]
+
+    def __get_connected_outputs(self):
+        return tuple(
+            output_id
+            for output_id, output in self.__get_screen().Outputs.items()
+            if output.Connected
+        )
+
+    def get_monitors(self):
+        """
+        Returns the fingerprints of the monitors connected to the screen.
+        Monitors without a valid EDID can not be told apart and are left out.
+
+        Returns
+        -------
+        dict
+            The MonitorFingerprints indexed by the outputs they are connected to
+        """
+        monitors = {}
+        for output in self.__get_screen().Outputs.values():
+            if not output.Connected or not output.has_edid():
+                continue
+            try:
+                edid = output.get_edid()
+            except ValueError:
+                # The EDID is corrupt, e.g. its checksum does not match
+                continue
+            monitors[output] = get_fingerprint(edid)
+        return monitors
+
+    def capture(self, name):
+        """
+        Creates a profile from the current layout of the connected monitors and adds it to the index.
+
+        Parameters
+        ----------
+        name : str
+            The name of the profile
+
+        Returns
+        -------
+        Profile
+            The profile
+        """
+        screen = self.__get_screen()
+        modes = {mode.id: mode for mode in screen.get_info(validate=False).modes}
+        outputs = []
+        for output, fingerprint in self.get_monitors().items():
+            config = output.CRTC_Config
+            mode = modes.get(config.mode) if config.mode else None
+            outputs.append(
+                ProfileOutput(
+                    monitor=fingerprint,
+                    enabled=mode is not None,
+                    x=config.x or 0,
+                    y=config.y or 0,
+                    width=mode.width if mode is not None else None,
+                    height=mode.height if mode is not None else None,
+                    refresh_rate=mode.refresh_rate if mode is not None else None,
+                    rotation=config.rotation or Rotation.NO_ROTATION,
+                )
+            )
+
+        profile = Profile(name=name, outputs=outputs)
+        self.__index.add(profile)
+        return profile
+
+    def apply(self, profile):
+        """
+        Applies a profile to the connected monitors in one batched reconfiguration.
+        Monitors disabled by the profile, connected monitors it does not contain and outputs
+        whose monitor was unplugged while their CRTC is still enabled are turned off.
+
+        Parameters
+        ----------
+        profile : Profile
+            The profile to apply
+
+        Throws
+        ------
+        ResourceError
+            If a monitor of the profile is not connected or no CRTC is left to enable it.
+        """
+        screen = self.__get_screen()
+        outputs = {}
+        for output, fingerprint in self.get_monitors().items():
+            outputs.setdefault(fingerprint_key(fingerprint), []).append(output)
+
+        layout = {}
+        for profile_output in profile.outputs:
+            candidates = outputs.get(fingerprint_key(profile_output.monitor))
+            if not candidates:
+                raise ResourceError(
+                    "Monitor {} is not connected.".format(
+                        fingerprint_key(profile_output.monitor)
+                    )
+                )
+            output = candidates.pop(0)
+            layout[output] = self.__get_config(screen, output, profile_output)
+
+        for remaining in outputs.values():
+            for output in remaining:
+                layout[output] = CRTCConfig(mode=0)
+
+        for output in screen.Outputs.values():
+            if not output.Connected and output.CRTC_Config.mode:
+                # The CRTC keeps scanning out after an unplug and would not fit a smaller screen
+                layout[output] = CRTCConfig(mode=0)
+
+        self.__assign_crtcs(screen, layout)
+        screen.apply_layout(layout)
+
+    @staticmethod
+    def __assign_crtcs(screen, layout):
+        # Outputs enabled by the layout which are currently off have no CRTC yet, they get
+        # one which is neither used by another output nor released by the layout
+        configs = {
+            output: output.complete_crtc_config(layout.get(output, CRTCConfig()))
+            for output in screen.Outputs.values()
+        }
+        used = {
+            config.crtc for config in configs.values() if config.mode and config.crtc
+        }
+        for output, config in configs.items():
+            if output not in layout or not config.mode or config.crtc:
+                continue
+            crtc_id = next(
+                (crtc for crtc in output.Possible_CRTC_IDs if crtc not in used), None
+            )
+            if crtc_id is None:
+                raise ResourceError(
+                    "No CRTC is available for output {}.".format(output.Name)
+                )
+            used.add(crtc_id)
+            layout[output] = layout[output].copy(update=dict(crtc=crtc_id))
+
+    def __get_config(self, screen, output, profile_output):
+        if not profile_output.enabled:
+            return CRTCConfig(mode=0)
+
+        mode_id = None
+        if profile_output.width and profile_output.height:
+            mode_id = screen.find_mode(
+                profile_output.width,
+                profile_output.height,
+                profile_output.refresh_rate,
+                output=output,
+            )
+        if mode_id is None:
+            # The mode is not offered anymore, e.g. by another driver version
+            mode_id = screen.best_mode(output)
+
+        return CRTCConfig(
+            x=profile_output.x,
+            y=profile_output.y,
+            mode=mode_id,
+            rotation=profile_output.rotation,
+        )
+
+    def apply_matching(self):
+        """
+        Applies the profile made for the connected monitors, if there is one.
+
+        Returns
+        -------
+        Profile
+            The applied profile or None if no profile matches
+        """
+        self.__connected = self.__get_connected_outputs()
+        profile = self.__index.find(self.get_monitors().values())
+        if profile is not None:
+            self.apply(profile)
+        return profile
+
+    def process_events(self, block=False):
+        """
+        Applies the pending RandR events, see Display.process_events(), and the matching
+        profile if a monitor was plugged in or out since the last profile lookup.
+
+        Parameters
+        ----------
+        block : bool, optional
+            Whether to wait for an event if none is pending (default is False).
+
+        Returns
+        -------
+        Profile
+            The applied profile or None if nothing was applied
+        """
+        self.__display.process_events(block)
+        if self.__get_connected_outputs() == self.__connected:
+            return None
+        return self.apply_matching()
+
+    def run(self):
+        """
+        Applies the matching profile and keeps applying it on every hotplug until interrupted.
+        """
+        self.apply_matching()
+        while True:
+            self.process_events(block=True)
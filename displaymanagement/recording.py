@@ -0,0 +1,380 @@
+import base64
+import json
+import runpy
+import socket
+import sys
+import threading
+from contextlib import contextmanager
+from Xlib import display
+from Xlib.support import connect
+from .backend import XlibBackend
+from .exceptions import ReplayError
+
+# Directions of the recorded traffic
+SENT = "sent"
+RECEIVED = "received"
+
+RECORDING_VERSION = 1
+
+# Only one connection can be opened at a time while python-xlib's connect module is patched
+CONNECT_LOCK = threading.RLock()
+
+
+class Recording:
+    """
+    The traffic of one python-xlib connection: the bytes sent to and received from the
+    X server in order. The authentication data of the connection is never recorded.
+
+    Methods
+    -------
+    add(direction, data)
+    to_dict()
+
+    Static Methods
+    --------------
+    from_dict(data)
+    """
+
+    def __init__(self, display_name, auth_name=b"", auth_length=0, traffic=None):
+        """
+        Parameters
+        ----------
+        display_name : str
+            The name of the recorded display
+        auth_name : bytes, optional
+            The name of the authentication protocol of the connection (default is none)
+        auth_length : int, optional
+            The length of the authentication data of the connection (default is 0)
+        traffic : list, optional
+            The (direction, data) tuples recorded so far (default is None, nothing was recorded)
+        """
+        self.display_name = display_name
+        self.auth_name = auth_name
+        self.auth_length = auth_length
+        self.traffic = traffic if traffic is not None else []
+
+    def add(self, direction, data):
+        """
+        Records data sent or received, consecutive chunks of one direction are merged.
+        """
+        if not data:
+            return
+        if self.traffic and self.traffic[-1][0] == direction:
+            self.traffic[-1] = (direction, self.traffic[-1][1] + data)
+        else:
+            self.traffic.append((direction, bytes(data)))
+
+    def to_dict(self):
+        return dict(
+            display_name=self.display_name,
+            auth_name=self.auth_name.decode("latin-1"),
+            auth_length=self.auth_length,
+            traffic=[
+                [direction, base64.b64encode(data).decode("ascii")]
+                for direction, data in self.traffic
+            ],
+        )
+
+    @staticmethod
+    def from_dict(data):
+        return Recording(
+            data["display_name"],
+            data["auth_name"].encode("latin-1"),
+            data["auth_length"],
+            [
+                (direction, base64.b64decode(chunk))
+                for direction, chunk in data["traffic"]
+            ],
+        )
+
+
+def save_recordings(recordings, path):
+    """
+    Writes recordings to a JSON file.
+    """
+    with open(path, "w") as recording_file:
+        json.dump(
+            dict(
+                version=RECORDING_VERSION,
+                connections=[recording.to_dict() for recording in recordings],
+            ),
+            recording_file,
+        )
+
+
+def load_recordings(path):
+    """
+    Reads the recordings of a JSON file written by save_recordings.
+    """
+    with open(path) as recording_file:
+        data = json.load(recording_file)
+    if data.get("version") != RECORDING_VERSION:
+        raise ReplayError(
+            "Unsupported recording version {}.".format(data.get("version"))
+        )
+    return [Recording.from_dict(connection) for connection in data["connections"]]
+
+
+class RecordingSocket:
+    """
+    Wraps the socket of a python-xlib connection and records its traffic.
+    """
+
+    def __init__(self, sock, recording):
+        self.__socket = sock
+        self.__recording = recording
+        self.auth_data = b""
+
+    def send(self, data):
+        sent = self.__socket.send(data)
+        chunk = bytes(data[:sent])
+        if self.auth_data and not self.__recording.traffic:
+            # The connection setup carries the authentication data, it is never recorded
+            chunk = chunk.replace(self.auth_data, bytes(len(self.auth_data)), 1)
+        self.__recording.add(SENT, chunk)
+        return sent
+
+    def recv(self, count):
+        data = self.__socket.recv(count)
+        self.__recording.add(RECEIVED, data)
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self.__socket, name)
+
+
+class ReplaySocket:
+    """
+    Stands in for the socket of a python-xlib connection and plays back recorded traffic.
+    The replies recorded after a sent chunk become readable once the client sent as many
+    bytes as were recorded, so replies and events arrive in the recorded order.
+    """
+
+    def __init__(self, recording, strict=False):
+        """
+        Parameters
+        ----------
+        recording : Recording
+            The recorded traffic
+        strict : bool, optional
+            Whether the sent bytes have to match the recorded ones exactly (default is False,
+            only the amount of sent bytes is compared).
+        """
+        self.__client, self.__server = socket.socketpair()
+        self.__server.setblocking(False)
+        self.__traffic = list(recording.traffic)
+        self.__strict = strict
+        self.__position = 0
+        self.__offset = 0
+        self.__pending = b""
+        self.__release()
+
+    def __release(self):
+        # Queues the received chunks up to the next sent chunk
+        while (
+            self.__position < len(self.__traffic)
+            and self.__traffic[self.__position][0] == RECEIVED
+        ):
+            self.__pending += self.__traffic[self.__position][1]
+            self.__position += 1
+        if self.__position == len(self.__traffic) and not self.__pending:
+            self.__server.shutdown(socket.SHUT_WR)
+        self.__flush()
+
+    def __flush(self):
+        if not self.__pending:
+            return
+        try:
+            written = self.__server.send(self.__pending)
+        except BlockingIOError:
+            return
+        self.__pending = self.__pending[written:]
+        if not self.__pending and self.__position == len(self.__traffic):
+            self.__server.shutdown(socket.SHUT_WR)
+
+    def send(self, data):
+        data = bytes(data)
+        consumed = 0
+        while consumed < len(data):
+            if self.__position == len(self.__traffic):
+                raise ReplayError("The client sent more data than was recorded.")
+
+            expected = self.__traffic[self.__position][1]
+            count = min(len(data) - consumed, len(expected) - self.__offset)
+            if (
+                self.__strict
+                and self.__position
+                and data[consumed : consumed + count]
+                != expected[self.__offset : self.__offset + count]
+            ):
+                raise ReplayError(
+                    "The client sent data which differs from the recording."
+                )
+
+            consumed += count
+            self.__offset += count
+            if self.__offset == len(expected):
+                self.__position += 1
+                self.__offset = 0
+                self.__release()
+        return len(data)
+
+    def recv(self, count):
+        self.__flush()
+        return self.__client.recv(count)
+
+    def fileno(self):
+        return self.__client.fileno()
+
+    def getsockopt(self, *args):
+        return self.__client.getsockopt(*args)
+
+    def close(self):
+        self.__client.close()
+        self.__server.close()
+
+
+@contextmanager
+def record_connections():
+    """
+    Records the traffic of all python-xlib connections opened inside the context.
+
+    Yields
+    ------
+    list
+        The Recordings of the opened connections, filled while the connections are used
+    """
+    recordings = []
+    get_socket = connect.get_socket
+    get_auth = connect.get_auth
+
+    def recording_get_socket(dname, protocol, host, dno):
+        recording = Recording(dname)
+        recordings.append(recording)
+        return RecordingSocket(get_socket(dname, protocol, host, dno), recording)
+
+    def recording_get_auth(sock, dname, protocol, host, dno):
+        auth_name, auth_data = get_auth(sock, dname, protocol, host, dno)
+        if isinstance(sock, RecordingSocket):
+            recordings[-1].auth_name = auth_name
+            recordings[-1].auth_length = len(auth_data)
+            sock.auth_data = auth_data
+        return auth_name, auth_data
+
+    with CONNECT_LOCK:
+        connect.get_socket = recording_get_socket
+        connect.get_auth = recording_get_auth
+        try:
+            yield recordings
+        finally:
+            connect.get_socket = get_socket
+            connect.get_auth = get_auth
+
+
+def open_replay_display(recording, strict=False):
+    """
+    Opens a python-xlib display which plays back a recording instead of talking to an X server.
+
+    Parameters
+    ----------
+    recording : Recording
+        The recorded traffic of the connection
+    strict : bool, optional
+        Whether the requests have to match the recorded ones exactly (default is False).
+
+    Returns
+    -------
+    XDisplay
+        The display
+    """
+    get_socket = connect.get_socket
+    get_auth = connect.get_auth
+
+    with CONNECT_LOCK:
+        connect.get_socket = lambda *args: ReplaySocket(recording, strict)
+        connect.get_auth = lambda *args: (
+            recording.auth_name,
+            bytes(recording.auth_length),
+        )
+        try:
+            return display.Display(recording.display_name)
+        finally:
+            connect.get_socket = get_socket
+            connect.get_auth = get_auth
+
+
+class RecordingBackend(XlibBackend):
+    """
+    Opens python-xlib displays and records their traffic.
+
+    Methods
+    -------
+    open_display(name)
+    save(path)
+
+    Properties
+    ----------
+    recordings
+    """
+
+    def __init__(self):
+        self.__recordings = []
+
+    def open_display(self, name):
+        with record_connections() as recordings:
+            opened = super().open_display(name)
+        self.__recordings += recordings
+        return opened
+
+    def save(self, path):
+        """
+        Writes the recordings of all opened displays to a JSON file.
+        """
+        save_recordings(self.__recordings, path)
+
+    @property
+    def recordings(self):
+        return self.__recordings
+
+
+class ReplayBackend(XlibBackend):
+    """
+    Opens python-xlib displays playing back recordings, one recording per opened display
+    in the recorded order. The library has to send the same requests as when recording,
+    so the same calls have to be made in the same order.
+
+    Methods
+    -------
+    open_display(name)
+    """
+
+    def __init__(self, recordings, strict=False):
+        """
+        Parameters
+        ----------
+        recordings : list or str
+            The Recordings or the path of a file written by save_recordings
+        strict : bool, optional
+            Whether the requests have to match the recorded ones exactly (default is False).
+        """
+        if isinstance(recordings, str):
+            recordings = load_recordings(recordings)
+        self.__recordings = list(recordings)
+        self.__strict = strict
+
+    def open_display(self, name):
+        if not self.__recordings:
+            raise ReplayError("All recorded connections were replayed.")
+        return open_replay_display(self.__recordings.pop(0), self.__strict)
+
+
+if __name__ == "__main__":
+    # Records the connections of a script, e.g. one of the examples:
+    # python -m displaymanagement.recording recording.json examples/get_display_info.py
+    path, script = sys.argv[1], sys.argv[2]
+    sys.argv = sys.argv[2:]
+    with record_connections() as recordings:
+        try:
+            runpy.run_path(script, run_name="__main__")
+        finally:
+            save_recordings(recordings, path)
@@ -1,20 +1,128 @@
+import mmap
+import os
+import struct
+import sys
 from pyedid import Registry
 
+PNP_INDEX_PATH = os.path.join(os.path.dirname(__file__), "resources", "pnp_ids.bin")
+
+# The index starts with a header (magic, record count) followed by a table of
+# fixed-width records (PNP ID, name offset, name length) sorted by PNP ID and
+# the pool of UTF-8 encoded manufacturer names.
+PNP_INDEX_MAGIC = b"PNPI"
+PNP_INDEX_HEADER = struct.Struct("<4sI")
+PNP_INDEX_RECORD = struct.Struct("<3sIH")
 
 PNP_REGISTRY = None
 
 
-def load_pnp_info(file_dir="displaymanagement/resources/pnp_info.csv"):
+class MappedRegistry(Registry):
+    """
+    A PNP registry backed by a memory-mapped PNP index.
+    Manufacturer names are only looked up for the PNP IDs actually requested and cached.
+    The mapped pages are shared between all processes using the same index.
+
+    Methods
+    -------
+    get_company_by_pnp(pnp_id)
+    """
+
+    def __init__(self, index_path=PNP_INDEX_PATH):
+        """
+        Parameters
+        ----------
+        index_path : str, optional
+            The path of the PNP index (default is the index shipped with the package)
+        """
+        super().__init__()
+        with open(index_path, "rb") as index_file:
+            self.__index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.__count = PNP_INDEX_HEADER.unpack_from(self.__index)
+        if magic != PNP_INDEX_MAGIC:
+            raise ValueError("Not a PNP index: {}".format(index_path))
+
+    def __lookup(self, pnp_id):
+        """
+        Binary searches the index for the given PNP ID and returns the manufacturer name or None.
+        """
+        key = pnp_id.encode("ascii", "replace")
+        low, high = 0, self.__count
+        while low < high:
+            middle = (low + high) // 2
+            record_id, offset, length = PNP_INDEX_RECORD.unpack_from(
+                self.__index, PNP_INDEX_HEADER.size + middle * PNP_INDEX_RECORD.size
+            )
+            if record_id < key:
+                low = middle + 1
+            elif record_id > key:
+                high = middle
+            else:
+                return self.__index[offset : offset + length].decode("utf-8")
+        return None
+
+    def __missing__(self, pnp_id):
+        name = self.__lookup(pnp_id)
+        if name is None:
+            raise KeyError(pnp_id)
+
+        self.data[pnp_id] = name
+        return name
+
+    def __contains__(self, pnp_id):
+        return pnp_id in self.data or self.__lookup(pnp_id) is not None
+
+    def get_company_by_pnp(self, pnp_id):
+        """
+        Returns the manufacturer name of the given PNP ID or 'Unknown' if it is not registered.
+        """
+        try:
+            return self[pnp_id]
+        except KeyError:
+            return super().get_company_by_pnp(pnp_id)
+
+
+def build_pnp_index(registry, index_path=PNP_INDEX_PATH):
     """
-    Loads the PNP registry from a CSV file
+    Writes a PNP index for the given registry which can be memory-mapped by MappedRegistry.
+
+    Parameters
+    ----------
+    registry : Registry
+        The registry to index, a mapping of PNP IDs to manufacturer names
+    index_path : str, optional
+        The path of the written index (default is the index shipped with the package)
+    """
+    entries = sorted(
+        (pnp_id.encode("ascii"), name.encode("utf-8"))
+        for pnp_id, name in registry.items()
+        if len(pnp_id) == 3
+    )
+    offset = PNP_INDEX_HEADER.size + len(entries) * PNP_INDEX_RECORD.size
+
+    records = []
+    for pnp_id, name in entries:
+        records.append(PNP_INDEX_RECORD.pack(pnp_id, offset, len(name)))
+        offset += len(name)
+
+    with open(index_path, "wb") as index_file:
+        index_file.write(PNP_INDEX_HEADER.pack(PNP_INDEX_MAGIC, len(entries)))
+        index_file.writelines(records)
+        index_file.writelines(name for pnp_id, name in entries)
+
+
+def load_pnp_info(file_dir=None):
+    """
+    Loads the PNP registry, either from the shipped PNP index or from a CSV file
 
     Parameters
     ----------
     file_dir : str, optional
-        The directory of the file from which the PNP info is loaded
+        The directory of the CSV file from which the PNP info is loaded
+        (default is None, the shipped PNP index is memory-mapped)
     """
     global PNP_REGISTRY
-    PNP_REGISTRY = Registry.from_csv(file_dir)
+    PNP_REGISTRY = MappedRegistry() if file_dir is None else Registry.from_csv(file_dir)
 
 
 def get_pnp_info():
@@ -23,9 +131,19 @@ def get_pnp_info():
 
     Returns
     -------
-    dict
-        A dictionary of the loaded PNP info
+    Registry
+        The loaded PNP registry
     """
     if PNP_REGISTRY is None:
         load_pnp_info()
     return PNP_REGISTRY
+
+
+if __name__ == "__main__":
+    # Rebuilds the shipped index, e.g. from the CSV export of https://uefi.org/pnp_id_list:
+    # python -m displaymanagement.resources [pnp_info.csv]
+    from pyedid import DEFAULT_REGISTRY
+
+    build_pnp_index(
+        Registry.from_csv(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REGISTRY
+    )
@@ -1,18 +1,36 @@
 from typing import Optional
 from Xlib import X
 from Xlib.ext import randr
+from Xlib.ext.randr import PROPERTY_RANDR_EDID
 from .output import Output
 from .utils import (
-    get_mode_dict_from_list,
     get_screen_sizes_from_list,
     format_mode,
     format_size,
+    get_refresh_rate,
     get_mode,
     output_extent,
+    make_descriptor,
 )
 from .entity import Entity
+from .pipeline import (
+    get_output_infos,
+    get_crtc_infos,
+    get_target_crtc_ids,
+    get_screen_resources,
+    send_output_info_requests,
+    send_crtc_info_requests,
+    collect_replies,
+)
+from .cache import CRTCInfoCache, EDIDCache
+from .layout import plan_layout, DisableOutput, SetScreenSize
+from .mode_index import ModeIndex
+from .mode_table import ModeTable
+from .lazy import LazyDict
+from .threads import get_display_lock, synchronized, changes_state
 from .exceptions import ResourceError
 from .rotation import Rotation
+from .timings import ModeTiming
 from .model_descriptors.screen_descriptor import ScreenDescriptor, ScreenSizeRange
 from .model_descriptors.screen_size import ScreenSize
 from .model_descriptors.crtc_info import CRTCInfo
@@ -31,18 +49,31 @@ class Screen(Entity):
     set_size(width, height, dpi, width_mm, height_mm)
     adjust_size()
     set_refresh_rate(rate)
-    create_mode(self, name, width, height, refresh_rate, interlaced)
+    create_mode(name, width, height, refresh_rate, interlaced, timing)
+    register_mode(mode_id, mode)
+    find_mode(width, height, refresh_rate, tolerance, output)
+    native_mode(output)
+    best_mode(output)
+    set_crtc_config(output, config)
+    plan_layout(layout)
+    apply_layout(layout)
     get_info()
     get_size_range()
     get_crtc_info()
+    handle_event(event)
+    load_output(output_id, reload)
 
     Static Methods
     --------------
-    load_from_identifier(display, screen_identifier)
+    load_from_identifier(display, screen_identifier, probe, lazy)
+    load_from_identifiers(display, screen_identifiers, probe, lazy)
+    load_from_resources(display, resources, lazy)
+    load_from_replies(display, screen_identifier, resources, output_infos, crtc_infos, lazy, size_range)
 
     Properties
     ----------
     Outputs()
+    Load_State()
     CRTC_IDs()
     """
 
@@ -59,6 +90,12 @@ class Screen(Entity):
         width_mm,
         height_mm,
         config_timestamp,
+        crtc_info_cache,
+        edid_cache,
+        output_ids=None,
+        lazy=False,
+        size_range=None,
+        load_state=None,
     ):
         """
         Parameters
@@ -69,10 +106,10 @@ class Screen(Entity):
             The underlying x screen object.
         display : XDisplay
             The underlying X display object which contains this screen.
-        modes : dict
-            A dictionary of modes supported by this screen indexed by their IDs.
+        modes : ModeTable
+            The modes supported by this screen indexed by their IDs, shared with its outputs.
         outputs : dict
-            A dictionary of outputs connected for this screen indexed by their IDs.
+            A dictionary of the loaded outputs of this screen indexed by their IDs.
         crtc_ids : list
             A list of crtc IDs.
         width
@@ -85,19 +122,48 @@ class Screen(Entity):
             height of screen in mm
         config_timestamp : int
             A timestamp indicating when the last change on this screen occured.
+        crtc_info_cache : CRTCInfoCache
+            The cache of the CRTC info of this screen shared with its outputs.
+        edid_cache : EDIDCache
+            The cache of the EDIDs of the outputs of this screen.
+        output_ids : list, optional
+            The IDs of all outputs of this screen, the ones missing in outputs are
+            loaded on first access (default is None, all outputs are loaded).
+        lazy : bool, optional
+            Whether outputs loaded on access request the info of their CRTC on first use
+            (default is False).
+        size_range : ScreenSizeRange, optional
+            The size range of the screen (default is None, it is requested on first use).
+        load_state : tuple, optional
+            The timestamp and config timestamp of the screen resources this screen was loaded
+            from and the data of its CRTC info replies indexed by CRTC IDs, kept for snapshots
+            (default is None).
         """
         super().__init__(id)
         self.__screen = screen
         self.__display = display
+        self._lock = get_display_lock(display)
         self.__modes = modes
-        self.__outputs = outputs
+        self.__mode_index = ModeIndex(modes)
+        self.__lazy = lazy
+        self.__outputs = LazyDict(
+            outputs if output_ids is None else output_ids, self.load_output
+        )
+        self.__outputs.update(outputs)
         self.__crtc_ids = crtc_ids
         self.__width = width
         self.__height = height
         self.__width_mm = width_mm
         self.__height_mm = height_mm
         self.__config_timestamp = config_timestamp
-
+        self.__crtc_info_cache = crtc_info_cache
+        self.__edid_cache = edid_cache
+        self.__crtc_states = {}
+        self.__mode_infos = {}
+        self.__size_range = size_range
+        self.__load_state = load_state
+
+    @synchronized
     def get_sizes(self):
         """
         Returns all possible sizes for this screen.
@@ -106,18 +172,23 @@ class Screen(Entity):
         sizes = get_screen_sizes_from_list(screen_info._data["sizes"])
         return sizes
 
+    @synchronized
     def get_size_range(self):
         """
         Returns the size range allowed for this screen.
+        The range is fixed for the lifetime of the server, it is only requested once.
         """
-        range = self.__screen.root.xrandr_get_screen_size_range()
-        return ScreenSizeRange(
-            min_width=range._data["min_width"],
-            max_width=range._data["max_width"],
-            min_height=range._data["min_height"],
-            max_height=range._data["max_height"],
-        )
+        if self.__size_range is None:
+            range = self.__screen.root.xrandr_get_screen_size_range()
+            self.__size_range = ScreenSizeRange(
+                min_width=range._data["min_width"],
+                max_width=range._data["max_width"],
+                min_height=range._data["min_height"],
+                max_height=range._data["max_height"],
+            )
+        return self.__size_range
 
+    @changes_state
     def set_size(
         self,
         width: int,
@@ -166,6 +237,7 @@ class Screen(Entity):
         self.__width_mm = width_mm
         self.__height_mm = height_mm
 
+    @changes_state
     def adjust_size(self):
         """
         Adjusts size of screen to fit outputs.
@@ -213,7 +285,16 @@ class Screen(Entity):
         )
         self.__config_timestamp = result._data["config_timestamp"]
 
-    def create_mode(self, name, width, height, refresh_rate, interlaced=False):
+    @changes_state
+    def create_mode(
+        self,
+        name,
+        width,
+        height,
+        refresh_rate,
+        interlaced=False,
+        timing=ModeTiming.CVT,
+    ):
         """
         Adds a mode to the list of modes of this screen and returns its ID
 
@@ -229,6 +310,9 @@ class Screen(Entity):
             The refresh rate of the mode
         interlaced : bool
             If the mode is interlaced
+        timing : ModeTiming
+            The standard used for generating the mode timings (default is CVT).
+            CVT_RB selects reduced blanking which suits high refresh rate panels.
 
         Returns
         -------
@@ -236,15 +320,131 @@ class Screen(Entity):
             The id of the new mode
         """
         # xlib sets the mode id automatically
-        mode = get_mode(width, height, refresh_rate, name, 0, interlaced)
-        mode_id = self.__screen.root.xrandr_create_mode(mode, name)
-        return mode_id._data["mode"]
+        mode = get_mode(width, height, refresh_rate, name, 0, interlaced, timing)
+        mode_id = self.__screen.root.xrandr_create_mode(mode, name)._data["mode"]
+        return self.register_mode(mode_id, mode)
+
+    @changes_state
+    def register_mode(self, mode_id, mode):
+        """
+        Adds a mode created on the server by the caller to the list of modes of this screen
+        and returns its ID.
+
+        Parameters
+        ----------
+        mode_id : int
+            The ID the server assigned to the mode
+        mode : dict
+            The mode, e.g. created by utils.get_mode
+        """
+        mode["id"] = mode_id
+        self.__modes.add(mode_id, mode)
+        self.__mode_index.add(mode_id, mode)
+        self.__mode_infos.clear()
+        return mode_id
+
+    @synchronized
+    def find_mode(self, width, height, refresh_rate=None, tolerance=0.5, output=None):
+        """
+        Returns the ID of the mode with the given resolution and refresh rate.
+
+        Parameters
+        ----------
+        width : int
+            The width of the mode
+        height : int
+            The height of the mode
+        refresh_rate : float, optional
+            The refresh rate of the mode (default is None, the highest available refresh rate)
+        tolerance : float, optional
+            The allowed difference in Hz between the refresh rates (default is 0.5)
+        output : Output, optional
+            Only consider the modes allowed for this output (default is None, all modes of this screen)
+
+        Returns
+        -------
+        int
+            The ID of the mode with the closest refresh rate or None if there is no matching mode
+        """
+        return self.__mode_index.find(
+            width,
+            height,
+            refresh_rate,
+            tolerance,
+            output.Mode_IDs if output is not None else None,
+        )
+
+    @synchronized
+    def native_mode(self, output):
+        """
+        Returns the ID of the mode matching the preferred timing in the EDID of the
+        monitor connected to the given output.
+
+        Parameters
+        ----------
+        output : Output
+            The output to find the native mode for
+
+        Returns
+        -------
+        int
+            The ID of the native mode or None if the monitor exposes no valid EDID with a
+            preferred timing or no mode of the output matches it
+        """
+        if not output.Connected or not output.has_edid():
+            return None
+
+        try:
+            timing = output.get_edid().preferred_timing
+        except ValueError:
+            # The EDID is corrupt, e.g. its checksum does not match
+            return None
+        if timing is None:
+            return None
+
+        return self.find_mode(
+            timing.width, timing.height, timing.refresh_rate, output=output
+        )
 
+    @synchronized
+    def best_mode(self, output):
+        """
+        Returns the ID of the best mode for the given output, i.e. the native mode of
+        the connected monitor, the first mode preferred by it or, if there is none,
+        the mode with the highest resolution and refresh rate.
+
+        Parameters
+        ----------
+        output : Output
+            The output to find the best mode for
+
+        Returns
+        -------
+        int
+            The ID of the best mode or None if the output has no modes
+        """
+        native_mode_id = self.native_mode(output)
+        if native_mode_id is not None:
+            return native_mode_id
+
+        if output.Preferred_Mode_IDs:
+            return output.Preferred_Mode_IDs[0]
+
+        return max(
+            output.Mode_IDs,
+            key=lambda mode_id: (
+                self.__modes[mode_id]["width"] * self.__modes[mode_id]["height"],
+                get_refresh_rate(self.__modes[mode_id]),
+            ),
+            default=None,
+        )
+
+    @changes_state
     def set_crtc_config(self, output: Output, config: CRTCConfig):
         """
         Sets crtc config on output while also adjusting screen size.
         """
-        if output not in self.Outputs.values():
+        if output not in self.__outputs.loaded_values():
             raise ResourceError("Output not assigned to this screen.")
 
         # self.__display.grab_server()
@@ -278,13 +478,201 @@ class Screen(Entity):
             pass
             # self.__display.ungrab_server()
 
+    @synchronized
+    def plan_layout(self, layout):
+        """
+        Computes the ordered list of operations needed to apply a layout to this screen.
+        Outputs whose mode, position and rotation do not change are not part of the plan.
+
+        Parameters
+        ----------
+        layout : dict
+            A dictionary of CRTCConfigs indexed by the outputs to apply them to.
+
+        Returns
+        -------
+        list
+            The operations(DisableOutput, SetScreenSize and SetOutputConfig) to execute in order.
+
+        Throws
+        ------
+        ResourceError
+            If an output is not assigned to this screen or a mode is not in the list of
+            supported modes for this screen.
+        """
+        outputs = self.Outputs.values()
+        configs = {}
+        for output, config in layout.items():
+            if output not in outputs:
+                raise ResourceError("Output not assigned to this screen.")
+
+            config = output.complete_crtc_config(config)
+            if config.mode and config.mode not in self.__modes:
+                raise ResourceError(
+                    "Mode ID is not in the list of supported modes for this screen, use create_mode to create it first."
+                )
+            configs[output] = config
+
+        return plan_layout(
+            list(outputs),
+            configs,
+            self.__modes,
+            ScreenSize(width=self.__width, height=self.__height),
+            self.get_size_range(),
+        )
+
+    @changes_state
+    def apply_layout(self, layout):
+        """
+        Sets the crtc configs of multiple outputs at once while resizing the screen only once.
+        Outputs that are not part of the layout keep their current config.
+
+        Only the outputs whose config changes are touched: the CRTCs that are disabled by the
+        layout or do not fit the final screen size are turned off before resizing, and the
+        changed configs are applied while the server is grabbed. Nothing is sent to the server
+        if the layout matches the current one.
+
+        Parameters
+        ----------
+        layout : dict
+            A dictionary of CRTCConfigs indexed by the outputs to apply them to.
+
+        Throws
+        ------
+        ResourceError
+            If an output is not assigned to this screen or a mode is not in the list of
+            supported modes for this screen.
+        """
+        plan = self.plan_layout(layout)
+        if not plan:
+            return
+
+        self.__display.grab_server()
+
+        try:
+            for operation in plan:
+                if isinstance(operation, DisableOutput):
+                    operation.output.disable()
+                elif isinstance(operation, SetScreenSize):
+                    self.set_size(operation.width, operation.height)
+                else:
+                    operation.output.set_config(operation.config)
+        finally:
+            self.__display.ungrab_server()
+            self.__display.flush()
+
+    @changes_state
+    def handle_event(self, event):
+        """
+        Patches the loaded state of this screen and its outputs according to a RandR notify event.
+
+        Parameters
+        ----------
+        event : XEvent
+            A RandR notify event reported for the root window of this screen.
+
+        Returns
+        -------
+        bool
+            Whether the event invalidated the resources of this screen, e.g. an output
+            was plugged in or out, which requires the screen to be reloaded.
+        """
+        if isinstance(event, randr.ScreenChangeNotify):
+            self.__width = event.width_in_pixels
+            self.__height = event.height_in_pixels
+            self.__width_mm = event.width_in_millimeters
+            self.__height_mm = event.height_in_millimeters
+            self.__config_timestamp = event.config_timestamp
+            for output in self.__outputs.loaded_values():
+                output.update_config_timestamp(event.config_timestamp)
+            return False
+
+        if isinstance(event, randr.CrtcChangeNotify):
+            self.__crtc_states[event.crtc] = event
+            self.__crtc_info_cache.update_from_crtc_change(event)
+            for output in self.__outputs.loaded_values():
+                output.update_from_crtc_change(event)
+            return False
+
+        if isinstance(event, randr.OutputChangeNotify):
+            # The monitor might have been replaced, so its EDID is fetched again when needed
+            self.__edid_cache.invalidate(event.output)
+            if event.output not in self.__outputs:
+                # An output unknown to this screen has to be picked up by a reload
+                return True
+
+            if event.config_timestamp != self.__config_timestamp:
+                self.__config_timestamp = event.config_timestamp
+                for other_output in self.__outputs.loaded_values():
+                    other_output.update_config_timestamp(event.config_timestamp)
+
+            if not self.__outputs.is_loaded(event.output):
+                # The output is requested with its current state on first access
+                return False
+
+            output = self.__outputs[event.output]
+            return output.update_from_output_change(
+                event, self.__crtc_states.get(event.crtc)
+            )
+
+        if isinstance(
+            event, randr.OutputPropertyNotify
+        ) and event.atom == self.__display.get_atom(PROPERTY_RANDR_EDID):
+            self.__edid_cache.invalidate(event.output)
+
+        # Output property changes do not affect any other loaded state
+        return False
+
+    @changes_state
+    def load_output(self, output_id, reload=False):
+        """
+        Loads the output identified by the output_id, outputs of lazily loaded screens
+        are loaded by this on first access.
+
+        Parameters
+        ----------
+        output_id : int
+            The ID of the output to load
+        reload : bool, optional
+            Whether the output should be reloaded if it was loaded before (default is False).
+
+        Returns
+        -------
+        Output
+            The output object
+        """
+        if self.__outputs.is_loaded(output_id) and not reload:
+            return self.__outputs[output_id]
+
+        output = Output.load_from_identifier(
+            self.__display,
+            self.__screen,
+            output_id,
+            self.__modes,
+            self.__config_timestamp,
+            self.__crtc_info_cache,
+            self.__edid_cache,
+            self.__lazy,
+        )
+        self.__outputs[output_id] = output
+        return output
+
     @property
     def Outputs(self):
         """
         Returns a dictionary of all outputs associated with this screen indexed with their IDs.
+        Outputs of lazily loaded screens are loaded on first access.
         """
         return self.__outputs
 
+    @property
+    def Load_State(self):
+        """
+        Returns the timestamp and config timestamp of the screen resources this screen was
+        loaded from and the data of its CRTC info replies indexed by CRTC IDs.
+        """
+        return self.__load_state
+
     @property
     def CRTC_IDs(self):
         """
@@ -292,19 +680,24 @@ class Screen(Entity):
         """
         return self.__crtc_ids
 
+    @synchronized
     def get_crtc_info(self, crtc_id: int) -> CRTCInfo:
         """
         Returns crtc info for given id.
+        The info is requested only if it is not in the CRTC info cache of this screen.
         """
-        mode_info = self.__display.xrandr_get_crtc_info(
-            crtc_id, self.__config_timestamp
-        )._data
-
-        return CRTCInfo(mode_id=mode_info["mode"], **mode_info)
+        return self.__crtc_info_cache.get(crtc_id, self.__config_timestamp)
 
-    def get_info(self):
+    @synchronized
+    def get_info(self, validate=True):
         """
         Returns a dictionary containing all relevant information about this screen's resources.
+        The mode descriptors are only created once as modes only change through create_mode().
+
+        Parameters
+        ----------
+        validate : bool, optional
+            Whether the descriptors are validated (default is True)
 
         Returns
         -------
@@ -312,20 +705,167 @@ class Screen(Entity):
         ScreenDescriptor
             The descriptor of the screen
         """
-        return ScreenDescriptor(
+        if validate not in self.__mode_infos:
+            self.__mode_infos[validate] = [
+                format_mode(mode_id, mode, validate)
+                for mode_id, mode in self.__modes.items()
+            ]
+
+        return make_descriptor(
+            ScreenDescriptor,
+            validate,
             id=self._id,
-            size=ScreenSize(width=self.__width, height=self.__height),
-            outputs=[output.get_info() for output_id, output in self.__outputs.items()],
-            modes=[
-                format_mode(mode_id, mode) for mode_id, mode in self.__modes.items()
-            ],
+            size=make_descriptor(
+                ScreenSize, validate, width=self.__width, height=self.__height
+            ),
+            outputs=[output.get_info(validate) for output in self.__outputs.values()],
+            modes=list(self.__mode_infos[validate]),
             size_range=self.get_size_range(),
         )
 
     @staticmethod
-    def load_from_identifier(display, screen_id):
+    def load_from_identifier(display, screen_id, probe=False, lazy=False):
         """
         Loads the screen specified by the screen_id and returns a corresponding screen object.
+        The info of all outputs and their CRTCs is requested in bulk, so loading takes
+        three round trips regardless of the number of outputs. Lazily loaded screens only
+        request their resources, each output and its CRTC info are requested on first access.
+
+        Parameters
+        ----------
+        display : XDisplay
+            The underlying X display which contains the referenced screen
+        screen_id : int
+            The ID of the screen
+        probe : bool, optional
+            Whether the server should probe the outputs for changes (default is False).
+            Without probing, the resources currently known to the server are returned
+            which avoids slow DDC reads on some drivers.
+        lazy : bool, optional
+            Whether the outputs are loaded on first access (default is False).
+
+        Returns
+        -------
+        Screen
+            The screen object
+        """
+        screen = display.screen(screen_id)
+        resources = (
+            screen.root.xrandr_get_screen_resources()
+            if probe
+            else screen.root.xrandr_get_screen_resources_current()
+        )
+        output_ids = resources._data["outputs"]
+        config_timestamp = resources._data["config_timestamp"]
+
+        output_infos = (
+            {} if lazy else get_output_infos(display, output_ids, config_timestamp)
+        )
+        crtc_infos = get_crtc_infos(
+            display, get_target_crtc_ids(output_infos), config_timestamp
+        )
+        return Screen.load_from_replies(
+            display, screen_id, resources, output_infos, crtc_infos, lazy
+        )
+
+    @staticmethod
+    def load_from_identifiers(display, screen_ids, probe=False, lazy=False):
+        """
+        Loads multiple screens at once. The requests of all screens are interleaved on the
+        connection, so loading takes three round trips regardless of the number of screens
+        and outputs, see load_from_identifier().
+
+        Parameters
+        ----------
+        display : XDisplay
+            The underlying X display which contains the referenced screens
+        screen_ids : list
+            The IDs of the screens
+        probe : bool, optional
+            Whether the server should probe the outputs for changes (default is False).
+        lazy : bool, optional
+            Whether the outputs are loaded on first access (default is False).
+
+        Returns
+        -------
+        dict
+            The screen objects indexed by screen IDs
+        """
+        return Screen.load_from_resources(
+            display, get_screen_resources(display, screen_ids, probe), lazy
+        )
+
+    @staticmethod
+    def load_from_resources(display, resources, lazy=False):
+        """
+        Loads multiple screens whose resources were received already, requesting the info
+        of their outputs and CRTCs interleaved in two round trips.
+
+        Parameters
+        ----------
+        display : XDisplay
+            The underlying X display which contains the referenced screens
+        resources : dict
+            The screen resources replies of the screens indexed by screen IDs
+        lazy : bool, optional
+            Whether the outputs are loaded on first access (default is False).
+
+        Returns
+        -------
+        dict
+            The screen objects indexed by screen IDs
+        """
+        screen_ids = list(resources)
+        output_infos = {
+            screen_id: (
+                {}
+                if lazy
+                else send_output_info_requests(
+                    display,
+                    resources[screen_id]._data["outputs"],
+                    resources[screen_id]._data["config_timestamp"],
+                )
+            )
+            for screen_id in screen_ids
+        }
+        for requests in output_infos.values():
+            collect_replies(requests)
+
+        crtc_infos = {
+            screen_id: send_crtc_info_requests(
+                display,
+                get_target_crtc_ids(output_infos[screen_id]),
+                resources[screen_id]._data["config_timestamp"],
+            )
+            for screen_id in screen_ids
+        }
+        for requests in crtc_infos.values():
+            collect_replies(requests)
+
+        return {
+            screen_id: Screen.load_from_replies(
+                display,
+                screen_id,
+                resources[screen_id],
+                output_infos[screen_id],
+                crtc_infos[screen_id],
+                lazy,
+            )
+            for screen_id in screen_ids
+        }
+
+    @staticmethod
+    def load_from_replies(
+        display,
+        screen_id,
+        resources,
+        output_infos,
+        crtc_infos,
+        lazy=False,
+        size_range=None,
+    ):
+        """
+        Creates the Screen object from already received replies.
 
         Parameters
         ----------
@@ -333,6 +873,17 @@ class Screen(Entity):
             The underlying X display which contains the referenced screen
         screen_id : int
             The ID of the screen
+        resources : GetScreenResources
+            The screen resources reply of the screen
+        output_infos : dict
+            The output info replies of the outputs to load indexed by output IDs,
+            the other outputs are loaded on first access.
+        crtc_infos : dict
+            The CRTC info replies of the CRTCs of the connected outputs indexed by CRTC IDs
+        lazy : bool, optional
+            Whether outputs loaded on access request the info of their CRTC on first use (default is False).
+        size_range : ScreenSizeRange, optional
+            The size range of the screen (default is None, it is requested on first use).
 
         Returns
         -------
@@ -340,17 +891,27 @@ class Screen(Entity):
             The screen object
         """
         screen = display.screen(screen_id)
-        resources = screen.root.xrandr_get_screen_resources()
         resources_data = resources._data
-        modes = get_mode_dict_from_list(resources_data["modes"])
+        modes = ModeTable(resources_data["modes"])
         output_ids = resources_data["outputs"]
         crtc_ids = resources_data["crtcs"]
         config_timestamp = resources_data["config_timestamp"]
-        outputs = {}
+        crtc_info_cache = CRTCInfoCache(display)
+        edid_cache = EDIDCache()
 
-        for output_id in output_ids:
-            outputs[output_id] = Output.load_from_identifier(
-                display, screen, output_id, modes, config_timestamp
+        outputs = {}
+        for output_id, output_info in output_infos.items():
+            target_crtc_info = crtc_infos.get(output_info._data["crtc"])
+            outputs[output_id] = Output.load_from_replies(
+                display,
+                screen,
+                output_id,
+                output_info,
+                target_crtc_info,
+                modes,
+                config_timestamp,
+                crtc_info_cache,
+                edid_cache,
             )
 
         return Screen(
@@ -365,4 +926,14 @@ class Screen(Entity):
             screen.width_in_mms,
             screen.height_in_mms,
             config_timestamp,
+            crtc_info_cache,
+            edid_cache,
+            output_ids,
+            lazy,
+            size_range,
+            (
+                resources_data["timestamp"],
+                config_timestamp,
+                {crtc_id: info._data for crtc_id, info in crtc_infos.items()},
+            ),
         )
@@ -0,0 +1,284 @@
+import base64
+import hashlib
+import json
+from Xlib.protocol.rq import DictWrapper
+from .screen import Screen
+from .pipeline import get_screen_resources
+from .exceptions import InvalidStateError
+
+SNAPSHOT_VERSION = 1
+
+# The fields of the stored replies needed for restoring outputs
+OUTPUT_INFO_FIELDS = {
+    "connection",
+    "crtc",
+    "modes",
+    "num_preferred",
+    "name",
+    "mm_width",
+    "mm_height",
+    "crtcs",
+}
+CRTC_INFO_FIELDS = {
+    "timestamp",
+    "x",
+    "y",
+    "width",
+    "height",
+    "mode",
+    "rotation",
+    "outputs",
+    "possible_outputs",
+}
+
+
+def encode_reply_data(value):
+    """
+    Converts the data of a reply into JSON compatible values, bytes are base64 encoded.
+    """
+    if isinstance(value, DictWrapper):
+        value = value._data
+    if isinstance(value, dict):
+        return {key: encode_reply_data(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_reply_data(item) for item in value]
+    if isinstance(value, bytes):
+        return {"base64": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def decode_reply_data(value):
+    """
+    Converts values written by encode_reply_data back.
+    """
+    if isinstance(value, dict):
+        if list(value) == ["base64"]:
+            return base64.b64decode(value["base64"])
+        return {key: decode_reply_data(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_reply_data(item) for item in value]
+    return value
+
+
+def get_screen_snapshot(screen, edids):
+    """
+    Returns the snapshot of a loaded screen: the timestamps of the resources it was loaded
+    with, the CRTC info replies it was loaded with, the output info data of its loaded outputs
+    and the digests of the cached EDIDs. Outputs only change after loading together with the
+    timestamps of the server, so restoring validates their current data as well.
+
+    Parameters
+    ----------
+    screen : Screen
+        The loaded screen
+    edids : dict
+        The raw EDIDs indexed by their digests, the cached EDIDs of the screen are added
+
+    Returns
+    -------
+    dict
+        The JSON compatible snapshot of the screen
+    """
+    timestamp, config_timestamp, crtc_infos = screen.Load_State
+
+    output_infos = {}
+    edid_digests = {}
+    for output_id, output in screen.Outputs.loaded_items():
+        output_info = output.get_output_info_data()
+        crtc_id = output_info["crtc"]
+        if crtc_id and crtc_id not in crtc_infos:
+            # Loaded after the screen, e.g. lazily, it is loaded on access after restoring too
+            continue
+        output_infos[output_id] = output_info
+        if not output.Connected or not output.EDID_Loaded:
+            continue
+        raw = output.get_raw_edid()
+        digest = None
+        if raw is not None:
+            digest = hashlib.sha1(raw).hexdigest()
+            edids[digest] = base64.b64encode(raw).decode("ascii")
+        edid_digests[output_id] = digest
+
+    return dict(
+        timestamp=timestamp,
+        config_timestamp=config_timestamp,
+        output_infos=output_infos,
+        crtc_infos={
+            crtc_id: encode_reply_data(data) for crtc_id, data in crtc_infos.items()
+        },
+        edids=edid_digests,
+    )
+
+
+def save_snapshot(display_id, screens, path):
+    """
+    Writes the snapshot of the loaded screens of a display to a JSON file.
+
+    Parameters
+    ----------
+    display_id : str
+        The id of the display
+    screens : dict
+        The loaded Screens indexed by their IDs
+    path : str
+        The path of the snapshot file
+    """
+    edids = {}
+    snapshot = dict(
+        version=SNAPSHOT_VERSION,
+        display=display_id,
+        screens={
+            screen_id: get_screen_snapshot(screen, edids)
+            for screen_id, screen in screens.items()
+        },
+        edids=edids,
+    )
+    with open(path, "w") as snapshot_file:
+        json.dump(snapshot, snapshot_file, separators=(",", ":"))
+
+
+def load_snapshot(path, display_id):
+    """
+    Reads a snapshot file written by save_snapshot.
+
+    Parameters
+    ----------
+    path : str
+        The path of the snapshot file
+    display_id : str
+        The id of the display the snapshot has to belong to
+
+    Returns
+    -------
+    dict
+        The snapshot
+
+    Throws
+    ------
+    InvalidStateError
+        If the snapshot was written by another version or for another display or is malformed
+    """
+    with open(path) as snapshot_file:
+        snapshot = json.load(snapshot_file)
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise InvalidStateError(
+            "Unsupported snapshot version {}.".format(snapshot.get("version"))
+        )
+    if snapshot.get("display") != display_id:
+        raise InvalidStateError(
+            "The snapshot belongs to display {}.".format(snapshot.get("display"))
+        )
+    validate_snapshot(snapshot)
+    return snapshot
+
+
+def validate_snapshot(snapshot):
+    """
+    Checks that a snapshot has the structure written by save_snapshot.
+
+    Throws
+    ------
+    InvalidStateError
+        If a part of the snapshot is missing or of the wrong type
+    """
+    edids = snapshot.get("edids")
+    screens = snapshot.get("screens")
+    if not isinstance(edids, dict) or not isinstance(screens, dict):
+        raise InvalidStateError("The snapshot has no screens or EDIDs.")
+
+    for screen_id, screen in screens.items():
+        if not isinstance(screen, dict) or not all(
+            isinstance(screen.get(key), int)
+            for key in ("timestamp", "config_timestamp")
+        ):
+            raise InvalidStateError("Screen {} has no timestamps.".format(screen_id))
+        for key in ("output_infos", "crtc_infos", "edids"):
+            if not isinstance(screen.get(key), dict):
+                raise InvalidStateError("Screen {} has no {}.".format(screen_id, key))
+        for output_id, info in screen["output_infos"].items():
+            if not isinstance(info, dict) or not OUTPUT_INFO_FIELDS <= info.keys():
+                raise InvalidStateError(
+                    "The output info of output {} is incomplete.".format(output_id)
+                )
+        for crtc_id, info in screen["crtc_infos"].items():
+            if not isinstance(info, dict) or not CRTC_INFO_FIELDS <= info.keys():
+                raise InvalidStateError(
+                    "The CRTC info of CRTC {} is incomplete.".format(crtc_id)
+                )
+        for output_id, digest in screen["edids"].items():
+            if digest is not None and digest not in edids:
+                raise InvalidStateError(
+                    "The EDID of output {} is missing.".format(output_id)
+                )
+
+
+def restore_screens(display, snapshot, screen_ids, probe=False, lazy=False):
+    """
+    Loads screens from a snapshot after validating it against the server.
+    The current resources of all screens are requested in one round trip, which also
+    brings their modes up to date. Screens whose timestamps still match the snapshot
+    are rebuilt from it without any further request, the other screens are loaded
+    from the server in two more round trips.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display which contains the screens
+    snapshot : dict
+        The snapshot read by load_snapshot
+    screen_ids : list
+        The IDs of the screens to load
+    probe : bool, optional
+        Whether the server should probe the outputs for changes (default is False).
+    lazy : bool, optional
+        Whether the outputs of changed screens are loaded on first access (default is False).
+
+    Returns
+    -------
+    dict
+        The screen objects indexed by screen IDs
+    """
+    resources = get_screen_resources(display, screen_ids, probe)
+    stored_screens = snapshot["screens"]
+
+    unchanged = {}
+    for screen_id in screen_ids:
+        stored = stored_screens.get(str(screen_id))
+        if (
+            stored is not None
+            and stored["timestamp"] == resources[screen_id]._data["timestamp"]
+            and stored["config_timestamp"]
+            == resources[screen_id]._data["config_timestamp"]
+        ):
+            unchanged[screen_id] = stored
+
+    screens = Screen.load_from_resources(
+        display,
+        {
+            screen_id: reply
+            for screen_id, reply in resources.items()
+            if screen_id not in unchanged
+        },
+        lazy,
+    )
+
+    for screen_id, stored in unchanged.items():
+        screen = Screen.load_from_replies(
+            display,
+            screen_id,
+            resources[screen_id],
+            {
+                int(output_id): DictWrapper(decode_reply_data(data))
+                for output_id, data in stored["output_infos"].items()
+            },
+            {
+                int(crtc_id): DictWrapper(decode_reply_data(data))
+                for crtc_id, data in stored["crtc_infos"].items()
+            },
+        )
+        for output_id, digest in stored["edids"].items():
+            raw = base64.b64decode(snapshot["edids"][digest]) if digest else None
+            screen.Outputs[int(output_id)].put_raw_edid(raw)
+        screens[screen_id] = screen
+
+    return {screen_id: screens[screen_id] for screen_id in screen_ids}
@@ -0,0 +1,191 @@
+import select
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import wraps
+from Xlib.display import Display as XDisplay
+
+# The locks of X displays opened in thread-safe mode, shared by their screens and outputs
+DISPLAY_LOCKS = weakref.WeakKeyDictionary()
+
+
+class DisplayLock:
+    """
+    A reentrant lock serializing the requests sent through one X display and the changes
+    to the state of its screens and outputs. Every change bumps the generation, so
+    snapshots of the state can be validated without taking the lock.
+
+    Methods
+    -------
+    changing()
+
+    Properties
+    ----------
+    generation
+    """
+
+    def __init__(self):
+        self.__lock = threading.RLock()
+        self.__generation = 0
+
+    def __enter__(self):
+        self.__lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.__lock.release()
+
+    @contextmanager
+    def changing(self):
+        """
+        Holds the lock while the state is changed and bumps the generation afterwards.
+        """
+        with self.__lock:
+            try:
+                yield self
+            finally:
+                self.__generation += 1
+
+    @property
+    def generation(self):
+        return self.__generation
+
+
+class NoLock:
+    """
+    Stands in for the DisplayLock of displays which are not shared between threads.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    @contextmanager
+    def changing(self):
+        yield self
+
+    @property
+    def generation(self):
+        return None
+
+
+NO_LOCK = NoLock()
+
+
+def synchronized(method):
+    """
+    Runs a method of a display, screen or output while holding the lock of its display.
+    """
+
+    @wraps(method)
+    def synchronized_method(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return synchronized_method
+
+
+def changes_state(method):
+    """
+    Runs a method of a display, screen or output changing its state while holding the lock
+    of its display, snapshots taken before are invalidated afterwards.
+    """
+
+    @wraps(method)
+    def changing_method(self, *args, **kwargs):
+        with self._lock.changing():
+            return method(self, *args, **kwargs)
+
+    return changing_method
+
+
+def make_thread_safe(display):
+    """
+    Creates the DisplayLock of an X display which is shared between threads.
+    Must be called before the screens and outputs of the display are loaded.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display
+
+    Returns
+    -------
+    DisplayLock
+        The lock of the display
+    """
+    lock = DISPLAY_LOCKS[display] = DisplayLock()
+    return lock
+
+
+def get_display_lock(display):
+    """
+    Returns the DisplayLock of an X display, or a lock doing nothing if the display is not
+    shared between threads.
+    """
+    return DISPLAY_LOCKS.get(display, NO_LOCK)
+
+
+def wait_for_events(display, timeout):
+    """
+    Waits without holding any lock until events might be pending on an X display.
+
+    Parameters
+    ----------
+    display : XDisplay
+        The X display
+    timeout : float
+        The maximum duration to wait in seconds
+
+    Returns
+    -------
+    bool
+        Whether data arrived before the timeout
+    """
+    if isinstance(display, XDisplay):
+        readable, _, _ = select.select([display], [], [], timeout)
+        return bool(readable)
+    return display.wait_for_events(timeout)
+
+
+class EventReader(threading.Thread):
+    """
+    A daemon thread applying the RandR events of a Display as soon as they arrive.
+
+    Methods
+    -------
+    stop()
+    """
+
+    def __init__(self, display, xdisplay, interval=0.5):
+        """
+        Parameters
+        ----------
+        display : Display
+            The display whose events are processed
+        xdisplay : XDisplay
+            The underlying X display
+        interval : float, optional
+            How often, in seconds, the thread checks whether it was stopped (default is 0.5).
+        """
+        super().__init__(name="displaymanagement-events", daemon=True)
+        self.__display = display
+        self.__xdisplay = xdisplay
+        self.__interval = interval
+        self.__stopped = threading.Event()
+
+    def run(self):
+        while not self.__stopped.is_set():
+            # Events may have been queued while other threads waited for replies
+            self.__display.process_events()
+            wait_for_events(self.__xdisplay, self.__interval)
+
+    def stop(self):
+        """
+        Stops the thread and waits until it finished.
+        """
+        self.__stopped.set()
+        if self is not threading.current_thread():
+            self.join()
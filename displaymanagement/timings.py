@@ -0,0 +1,273 @@
+import enum
+import struct
+from collections import namedtuple
+from functools import lru_cache
+from Xlib.ext import randr
+
+Timing = namedtuple(
+    "Timing",
+    [
+        "dot_clock",
+        "width",
+        "h_sync_start",
+        "h_sync_end",
+        "h_total",
+        "height",
+        "v_sync_start",
+        "v_sync_end",
+        "v_total",
+        "flags",
+    ],
+)
+
+
+class ModeTiming(enum.Enum):
+    """
+    Represents the standards available for generating mode timings
+    """
+
+    CVT = "cvt"
+    CVT_RB = "cvt_rb"
+    GTF = "gtf"
+
+
+# VESA CVT 1.2 constants, see https://glenwing.github.io/docs/VESA-CVT-1.2.pdf
+CVT_H_GRANULARITY = 8
+CVT_MIN_V_PORCH = 3
+CVT_MIN_V_BPORCH = 6
+CVT_CLOCK_STEP = 250
+CVT_MIN_VSYNC_BP = 550.0
+CVT_HSYNC_PERCENTAGE = 8
+CVT_M_PRIME = 600 * 128 // 256
+CVT_C_PRIME = (40 - 20) * 128 // 256 + 20
+CVT_RB_MIN_VBLANK = 460.0
+CVT_RB_H_SYNC = 32
+CVT_RB_H_BLANK = 160
+CVT_RB_VFPORCH = 3
+
+# VESA GTF constants
+GTF_CELL_GRAN = 8.0
+GTF_MIN_PORCH = 1
+GTF_V_SYNC_RQD = 3
+GTF_H_SYNC_PERCENT = 8.0
+GTF_MIN_VSYNC_PLUS_BP = 550.0
+GTF_M_PRIME = 128 / 256.0 * 600.0
+GTF_C_PRIME = (40.0 - 20.0) * 128 / 256.0 + 20.0
+
+
+def _float32(value):
+    """
+    Rounds a value to single precision, the reference implementations compute with C floats.
+    """
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def _cvt_vsync(width, height):
+    """
+    Returns the vertical sync width for the aspect ratio of the given resolution.
+    """
+    if height % 3 == 0 and height * 4 // 3 == width:
+        return 4
+    if height % 9 == 0 and height * 16 // 9 == width:
+        return 5
+    if height % 10 == 0 and height * 16 // 10 == width:
+        return 6
+    if height % 4 == 0 and height * 5 // 4 == width:
+        return 7
+    if height % 9 == 0 and height * 15 // 9 == width:
+        return 7
+    return 10
+
+
+def cvt_timing(width, height, refresh_rate, interlaced=False, reduced=False):
+    """
+    Generates VESA CVT 1.2 timings, matching the output of the cvt command-line tool.
+
+    Parameters
+    ----------
+    width : int
+        The width of the mode
+    height : int
+        The height of the mode
+    refresh_rate : float
+        The refresh rate of the mode
+    interlaced : bool
+        Whether the mode is interlaced
+    reduced : bool
+        Whether to use reduced blanking
+
+    Returns
+    -------
+    Timing
+        The generated timings
+    """
+    refresh_rate = refresh_rate or 60.0
+    field_rate = _float32(refresh_rate * 2 if interlaced else refresh_rate)
+    h_display = width - width % CVT_H_GRANULARITY
+    v_display_rnd = height // 2 if interlaced else height
+    interlace = 0.5 if interlaced else 0.0
+    v_sync = _cvt_vsync(h_display, height)
+
+    if not reduced:
+        h_period = _float32(
+            (1000000.0 / field_rate - CVT_MIN_VSYNC_BP)
+            / (v_display_rnd + CVT_MIN_V_PORCH + interlace)
+        )
+
+        v_sync_bp = int(CVT_MIN_VSYNC_BP / h_period) + 1
+        v_sync_bp = max(v_sync_bp, v_sync + CVT_MIN_V_PORCH)
+        v_total = int(v_display_rnd + v_sync_bp + interlace + CVT_MIN_V_PORCH)
+
+        h_blank_percentage = max(
+            _float32(CVT_C_PRIME - CVT_M_PRIME * h_period / 1000.0), 20
+        )
+        h_blank = int(h_display * h_blank_percentage / (100.0 - h_blank_percentage))
+        h_blank -= h_blank % (2 * CVT_H_GRANULARITY)
+
+        h_total = h_display + h_blank
+        h_sync_end = h_display + h_blank // 2
+        h_sync_start = h_sync_end - h_total * CVT_HSYNC_PERCENTAGE // 100
+        h_sync_start += CVT_H_GRANULARITY - h_sync_start % CVT_H_GRANULARITY
+
+        v_sync_start = height + CVT_MIN_V_PORCH
+        flags = randr.HSyncNegative | randr.VSyncPositive
+    else:
+        h_period = _float32(
+            (1000000.0 / field_rate - CVT_RB_MIN_VBLANK) / v_display_rnd
+        )
+
+        vbi_lines = int(_float32(CVT_RB_MIN_VBLANK / h_period + 1))
+        vbi_lines = max(vbi_lines, CVT_RB_VFPORCH + v_sync + CVT_MIN_V_BPORCH)
+        v_total = int(v_display_rnd + interlace + vbi_lines)
+
+        h_total = h_display + CVT_RB_H_BLANK
+        h_sync_end = h_display + CVT_RB_H_BLANK // 2
+        h_sync_start = h_sync_end - CVT_RB_H_SYNC
+
+        v_sync_start = height + CVT_RB_VFPORCH
+        flags = randr.HSyncPositive | randr.VSyncNegative
+
+    clock = int(h_total * 1000.0 / h_period)
+    clock -= clock % CVT_CLOCK_STEP
+
+    if interlaced:
+        v_total *= 2
+        flags |= randr.Interlace
+
+    return Timing(
+        dot_clock=clock * 1000,
+        width=h_display,
+        h_sync_start=h_sync_start,
+        h_sync_end=h_sync_end,
+        h_total=h_total,
+        height=height,
+        v_sync_start=v_sync_start,
+        v_sync_end=v_sync_start + v_sync,
+        v_total=v_total,
+        flags=flags,
+    )
+
+
+def gtf_timing(width, height, refresh_rate, interlaced=False):
+    """
+    Generates VESA GTF timings, matching the output of the gtf command-line tool
+    for non interlaced modes.
+
+    Parameters
+    ----------
+    width : int
+        The width of the mode
+    height : int
+        The height of the mode
+    refresh_rate : float
+        The refresh rate of the mode
+    interlaced : bool
+        Whether the mode is interlaced
+
+    Returns
+    -------
+    Timing
+        The generated timings
+    """
+    refresh_rate = refresh_rate or 60.0
+    h_pixels = _float32(round(width / GTF_CELL_GRAN) * GTF_CELL_GRAN)
+    v_lines = _float32(height / 2.0 if interlaced else float(height))
+    field_rate = _float32(refresh_rate * 2.0 if interlaced else refresh_rate)
+    interlace = 0.5 if interlaced else 0.0
+
+    h_period_est = _float32(
+        (1.0 / field_rate - GTF_MIN_VSYNC_PLUS_BP / 1000000.0)
+        / (v_lines + GTF_MIN_PORCH + interlace)
+        * 1000000.0
+    )
+    vsync_plus_bp = _float32(round(GTF_MIN_VSYNC_PLUS_BP / h_period_est))
+    total_v_lines = _float32(v_lines + vsync_plus_bp + interlace + GTF_MIN_PORCH)
+    field_rate_est = _float32(1.0 / h_period_est / total_v_lines * 1000000.0)
+    h_period = _float32(h_period_est / (field_rate / field_rate_est))
+
+    duty_cycle = _float32(GTF_C_PRIME - GTF_M_PRIME * h_period / 1000.0)
+    h_blank = _float32(
+        round(h_pixels * duty_cycle / (100.0 - duty_cycle) / (2.0 * GTF_CELL_GRAN))
+        * (2.0 * GTF_CELL_GRAN)
+    )
+    total_pixels = _float32(h_pixels + h_blank)
+    pixel_freq = _float32(total_pixels / h_period)
+
+    h_sync = _float32(
+        round(GTF_H_SYNC_PERCENT / 100.0 * total_pixels / GTF_CELL_GRAN) * GTF_CELL_GRAN
+    )
+    h_front_porch = _float32(h_blank / 2.0 - h_sync)
+
+    v_sync_start = height + GTF_MIN_PORCH
+    flags = randr.HSyncNegative | randr.VSyncPositive
+    v_total = int(total_v_lines)
+    if interlaced:
+        v_total = int(total_v_lines * 2)
+        flags |= randr.Interlace
+
+    return Timing(
+        dot_clock=int(round(pixel_freq * 100)) * 10000,
+        width=int(h_pixels),
+        h_sync_start=int(h_pixels + h_front_porch),
+        h_sync_end=int(h_pixels + h_front_porch + h_sync),
+        h_total=int(total_pixels),
+        height=height,
+        v_sync_start=v_sync_start,
+        v_sync_end=v_sync_start + GTF_V_SYNC_RQD,
+        v_total=v_total,
+        flags=flags,
+    )
+
+
+@lru_cache(maxsize=256)
+def generate_timing(
+    width, height, refresh_rate, interlaced=False, timing=ModeTiming.CVT
+):
+    """
+    Generates the timings of a mode according to the given standard.
+    Results are memoized.
+
+    Parameters
+    ----------
+    width : int
+        The width of the mode
+    height : int
+        The height of the mode
+    refresh_rate : float
+        The refresh rate of the mode
+    interlaced : bool
+        Whether the mode is interlaced
+    timing : ModeTiming
+        The standard used for generating the timings (default is CVT)
+
+    Returns
+    -------
+    Timing
+        The generated timings
+    """
+    timing = ModeTiming(timing)
+    if timing == ModeTiming.GTF:
+        return gtf_timing(width, height, refresh_rate, interlaced)
+    return cvt_timing(
+        width, height, refresh_rate, interlaced, timing == ModeTiming.CVT_RB
+    )
@@ -2,12 +2,12 @@ import re
 from collections import namedtuple
 from functools import reduce
 from string import Template
-from subprocess import check_output
 from .model_descriptors.screen_size import ScreenSize
 from .model_descriptors.mode_info import ModeInfo
 from .model_descriptors.edid_descriptor import EDIDDescriptor
 from .exceptions import MalformedInputError
 from .rotation import Rotation
+from .timings import generate_timing, ModeTiming
 
 MODE_FLAG_CODES = {
     "+hsync": 0x00000001,
@@ -36,21 +36,6 @@ def get_mode_dict_from_list(modes_resouces):
     return {mode.id: mode for mode in modes_resouces}
 
 
-def get_modes_from_ids(mode_ids, modes):
-    """
-    Takes in a list of mode ids and a list of modes and returns a dictionary
-    of the provided mode ids with their correpsonding mode objects.
-
-    Parameters
-    ----------
-    mode_ids : list
-        a list of mode IDs
-    modes : dict
-        a dictionary of modes indexed by their ids
-    """
-    return {mode_id: modes[mode_id]._data for mode_id in mode_ids}
-
-
 # NOTE: Width and height and constrained by xlib to be 16bit vals.
 # refresh_rate has weaker constraints but the values calculated from it have a limit of 16 bits
 # as well, therefore, a bound of 480 is set which is reasonable as if the time of writing this note.
@@ -70,9 +55,17 @@ def validate_mode(width, height, refresh_rate):
         raise MalformedInputError("Refresh rate should be between 0 and 480")
 
 
-def get_mode(width, height, refresh_rate, name, mode_id, interlaced=False):
+def get_mode(
+    width,
+    height,
+    refresh_rate,
+    name,
+    mode_id,
+    interlaced=False,
+    timing=ModeTiming.CVT,
+):
     """
-    Generates a VESA CVT modeline from the given width height and refresh rate
+    Generates a VESA CVT or GTF modeline from the given width height and refresh rate
 
     Parameters
     ----------
@@ -88,6 +81,9 @@ def get_mode(width, height, refresh_rate, name, mode_id, interlaced=False):
         The id to use for the mode
     interlaced : bool
         Determines if the mode is interlaced
+    timing : ModeTiming
+        The standard used for generating the timings (default is CVT, CVT_RB selects
+        CVT with reduced blanking)
 
     Returns
     -------
@@ -95,12 +91,22 @@ def get_mode(width, height, refresh_rate, name, mode_id, interlaced=False):
         The generated modeline info
     """
     validate_mode(width, height, refresh_rate)
-    cvt_lines = check_output(["cvt", str(width), str(height), str(refresh_rate)])
-    cvt_lines = str(cvt_lines).split("\\n")
-    modeline_info = parse_modeline(
-        cvt_lines[-2], name, mode_id, ["Interlace"] if interlaced else []
-    )
-    return modeline_info
+    mode_timing = generate_timing(width, height, refresh_rate, interlaced, timing)
+    return {
+        "id": mode_id,
+        "width": mode_timing.width,
+        "height": mode_timing.height,
+        "dot_clock": mode_timing.dot_clock,
+        "h_sync_start": mode_timing.h_sync_start,
+        "h_sync_end": mode_timing.h_sync_end,
+        "h_total": mode_timing.h_total,
+        "h_skew": 0,
+        "v_sync_start": mode_timing.v_sync_start,
+        "v_sync_end": mode_timing.v_sync_end,
+        "v_total": mode_timing.v_total,
+        "name_length": len(name),
+        "flags": mode_timing.flags,
+    }
 
 
 def parse_modeline(modeline, name, mode_id, additional_flags):
@@ -152,7 +158,30 @@ def get_screen_sizes_from_list(screen_sizes):
     return {idx: format_size(size) for idx, size in enumerate(screen_sizes)}
 
 
-def format_mode(mode_id, mode):
+def make_descriptor(model, validate=True, **fields):
+    """
+    Creates a descriptor, skipping pydantic validation if requested.
+    Descriptors of data received from the server can skip it safely, fields are
+    then expected to be passed with their final types.
+
+    Parameters
+    ----------
+    model : type
+        The descriptor class
+    validate : bool, optional
+        Whether the fields are validated (default is True)
+    fields : dict
+        The fields of the descriptor
+
+    Returns
+    -------
+    BaseModel
+        The descriptor
+    """
+    return model(**fields) if validate else model.construct(**fields)
+
+
+def format_mode(mode_id, mode, validate=True):
     """
     Takes in a mode id and a mode object and return a dictionary containing the mode's width, height and refresh rate
 
@@ -162,25 +191,41 @@ def format_mode(mode_id, mode):
         the id of the mode
     mode : mode_object
         the mode object
+    validate : bool, optional
+        Whether the descriptor is validated (default is True)
 
     Returns
     -------
     ModeInfo
         A descriptor of the mode info
     """
-    dot_clock = mode["dot_clock"]
-    h_total = mode["h_total"]
-    v_total = mode["v_total"]
-    refresh_rate = dot_clock / (h_total * v_total)
-
-    return ModeInfo(
+    return make_descriptor(
+        ModeInfo,
+        validate,
         id=mode["id"],
         width=mode["width"],
         height=mode["height"],
-        refresh_rate=refresh_rate,
+        refresh_rate=get_refresh_rate(mode),
     )
 
 
+def get_refresh_rate(mode):
+    """
+    Takes in a mode object and returns its refresh rate
+
+    Parameters
+    ----------
+    mode : mode_object
+        the mode object
+
+    Returns
+    -------
+    float
+        The refresh rate of the mode in Hz
+    """
+    return mode["dot_clock"] / (mode["h_total"] * mode["v_total"])
+
+
 def format_size(size):
     """
     Takes in a size object and returns a dictionary containing the size's width and height
@@ -200,14 +245,17 @@ def format_size(size):
     )
 
 
-def format_edid(edid_data):
+def format_edid(edid_data, raw=b""):
     """
     Takes in EDID info and returns an EDIDDescriptor describing the relevant info of the monitor
 
     Parameters
     ----------
     edid_data : Edid
-        The edid object describing the monitor
+        The edid object describing the monitor, as returned by pyedid.parse_edid
+    raw : bytes, optional
+        The raw EDID including its extension blocks, the timings and extensions
+        of the descriptor are decoded from it on access (default is empty)
 
     Returns
     -------
@@ -215,12 +263,13 @@ def format_edid(edid_data):
         The descriptor of relevant info of the edid
     """
     manufacturer = edid_data.manufacturer
-    manufacturer_product_code = edid_data.product
-    manufacturer_serial_number = edid_data.serial
+    manufacturer_product_code = str(edid_data.product_id)
+    manufacturer_serial_number = str(edid_data.serial)
     width = edid_data.width
     height = edid_data.height
 
     return EDIDDescriptor(
+        raw=raw,
         manufacturer=manufacturer,
         manufacturer_product_code=manufacturer_product_code,
         manufacturer_serial_number=manufacturer_serial_number,
@@ -0,0 +1,15 @@
+from displaymanagement.manager import DisplayManager
+
+# Connect to all displays in parallel
+DISPLAY_IDS = [":0", ":1"]
+manager = DisplayManager(DISPLAY_IDS)
+manager.open()
+
+# Get the info of all displays at once
+for display_id, result in manager.get_info().items():
+    if result.error is not None:
+        print(display_id, "failed:", result.error)
+    else:
+        print(display_id, result.value.json())
+
+manager.close()
@@ -7,6 +7,7 @@ setup(
     url="https://github.com/evocount/display-management",
     author="EvoCount GmbH",
     packages=["displaymanagement", "displaymanagement/model_descriptors"],
+    package_data={"displaymanagement": ["resources/pnp_ids.bin"]},
     python_requires=">=3.6",
     install_requires=["pydantic", "python-xlib", "pyedid"],
 )